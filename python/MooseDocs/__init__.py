@@ -12,6 +12,11 @@ import sys
 import subprocess
 import logging
 
+# Report the time spent importing modules (see main.py), this must be enabled prior to any imports
+if '--profile-imports' in sys.argv:
+    from MooseDocs import import_profiler
+    import_profiler.start()
+
 try:
     import anytree
     from anytree import search
@@ -45,7 +50,3 @@ MOOSE_DIR = os.getenv('MOOSE_DIR', None)
 if MOOSE_DIR is None:
     print "The MOOSE_DIR environment must be set, this should be set within moosedocs.py."
     sys.exit(1)
-
-# List all files with git, this is done here to avoid running this command many times
-PROJECT_FILES = mooseutils.git_ls_files(ROOT_DIR)
-PROJECT_FILES.update(mooseutils.git_ls_files(MOOSE_DIR))
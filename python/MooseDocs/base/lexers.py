@@ -195,9 +195,12 @@ class Lexer(object):
 
     Generally, this object should not be used. It is designed to provide the general capability
     needed for the RecursiveLexer.
+
+    The 'timing' attribute may be set to a Timing object to record the time spent by the
+    component of each pattern, see Translator.init.
     """
     def __init__(self):
-        pass
+        self.timing = None
 
     def tokenize(self, parent, grammar, text, line=1):
         """
@@ -253,7 +256,12 @@ class Lexer(object):
         """
         Return a token object for the given lexer information.
         """
-        obj = pattern.function(info, parent)
+        if self.timing is None:
+            obj = pattern.function(info, parent)
+        else:
+            extension = getattr(pattern.function, 'extension', None)
+            obj = self.timing.call('reader', pattern.name, extension, pattern.function, info,
+                                   parent)
         if MooseDocs.LOG_LEVEL == logging.DEBUG:
             common.check_type('obj', obj, (tokens.Token, type(None)),
                               exc=exceptions.TokenizeException)
@@ -1,8 +1,9 @@
 """Defines Renderer objects that convert AST (from Reader) into an output format."""
 import os
+import json
+import hashlib
 import logging
 import traceback
-import uuid
 import subprocess
 
 import anytree
@@ -29,6 +30,7 @@ class Renderer(mixins.ConfigObject, mixins.TranslatorObject, mixins.ComponentObj
         mixins.TranslatorObject.__init__(self)
         mixins.ComponentObject.__init__(self)
         self.__functions = dict()  # functions on the RenderComponent to call
+        self.timing = None         # Timing object, see Translator.init
 
     def add(self, token, component):
         """
@@ -93,7 +95,13 @@ class Renderer(mixins.ConfigObject, mixins.TranslatorObject, mixins.ComponentObj
         """
         try:
             func = self.__getFunction(token)
-            el = func(token, parent) if func else parent
+            if func is None:
+                el = parent
+            elif self.timing is None:
+                el = func(token, parent)
+            else:
+                el = self.timing.call('render', type(token).__name__, func.__self__.extension,
+                                      func, token, parent)
 
         except Exception as e: #pylint: disable=broad-except
             el = None
@@ -123,6 +131,13 @@ class Renderer(mixins.ConfigObject, mixins.TranslatorObject, mixins.ComponentObj
         """Called by Translator prior to conversion."""
         pass
 
+    def cached(self, node): #pylint: disable=no-self-use,unused-argument
+        """
+        Return True if the output of the supplied page from a previous build is current, in which
+        case the page is not converted by Translator.execute (see LatexRenderer).
+        """
+        return False
+
     def postExecute(self):
         """Called by Translator after conversion."""
         pass
@@ -188,6 +203,10 @@ class MaterializeRenderer(HTMLRenderer):
         config['home'] = ('/', "The homepage for the website.")
         config['scrollspy'] = (True, "Enable/disable the scrolling table of contents.")
         config['search'] = (True, "Enable/disable the search bar.")
+        config['search-index'] = ('list', "The format of the search index ('js/search_index.js'), " \
+                                          "'list' creates a list with an entry for each section " \
+                                          "and 'trie' creates a compact prefix tree of the page " \
+                                          "locations that is expanded by the browser.")
         config['google_analytics'] = (False, "Enable Google Analytics.")
         return config
 
@@ -437,7 +456,7 @@ class MaterializeRenderer(HTMLRenderer):
                     a = html.Tag(top_li, 'a', href=href, string=unicode(key1))
 
                 else:
-                    id_ = uuid.uuid4()
+                    id_ = self.translator.uniqueID(u'dropdown')
                     top_li = html.Tag(ul, 'li')
                     a = html.Tag(top_li, 'a', class_="dropdown-button", href="#!",
                                  string=unicode(key1))
@@ -581,9 +600,13 @@ class MaterializeRenderer(HTMLRenderer):
                 elif level < current:
                     section = html.Tag(section.parent.parent, 'section')
 
+                text = child.text()
                 section['data-section-level'] = level
-                section['data-section-text'] = child.text()
-                section['id'] = uuid.uuid4()
+                section['data-section-text'] = text
+
+                # The heading text is used for the ID, so the IDs (and the search index) do not
+                # change unless the heading changes
+                section['id'] = self.translator.uniqueID(u'section:' + text)
                 if 'data-details-open' in child:
                     section['data-details-open'] = child['data-details-open']
 
@@ -613,12 +636,33 @@ class MaterializeRenderer(HTMLRenderer):
 class LatexRenderer(Renderer):
     """
     Renderer for converting AST to LaTeX.
+
+    The pages are converted to LaTeX files by Translator.execute (in parallel), the main file that
+    includes the pages is created by postExecute. The LaTeX file of a page from the previous build
+    is used if the content of the page and the files that it depends on are unchanged, see cached.
     """
     METHOD = 'createLatex'
     EXTENSION = '.tex'
 
+    #: Change this if the stored page data changes, see cached
+    FRAGMENT_VERSION = 1
+
+    @staticmethod
+    def defaultConfig():
+        """
+        Return the default configuration.
+        """
+        config = Renderer.defaultConfig()
+        config['fragment-cache'] = (True, "Use the LaTeX file of each page from the previous " \
+                                          "build when the page content and dependencies are " \
+                                          "unchanged, this requires that the destination is " \
+                                          "not cleaned (e.g., 'build --incremental').")
+        return config
+
     def __init__(self, *args, **kwargs):
         self._packages = set()
+        self.__fragments = dict() # source: (key, dependencies) from the previous build
+        self.__cached = set()     # pages that were not converted, see cached
         Renderer.__init__(self, *args, **kwargs)
 
     def createRoot(self, config): #pylint: disable=unused-argument
@@ -627,6 +671,42 @@ class LatexRenderer(Renderer):
         """
         return base.NodeBase()
 
+    def preExecute(self):
+        """
+        Load the page data from the previous build, see cached.
+        """
+        self.__fragments = dict()
+        self.__cached = set()
+        filename = self.__fragmentsFilename()
+        if self.get('fragment-cache') and os.path.isfile(filename):
+            try:
+                with open(filename, 'r') as fid:
+                    data = json.load(fid)
+                if data.get('config') == self.__configKey():
+                    self.__fragments = data['pages']
+            except (IOError, ValueError, KeyError):
+                LOG.warning("Failed to read the LaTeX page data: %s", filename)
+
+    def cached(self, node):
+        """
+        Return True if the LaTeX file of the page from the previous build is current.
+
+        The file is current if it exists and the content of the page and the files that it
+        depended on in the previous build (e.g., !include files) are unchanged.
+        """
+        entry = self.__fragments.get(node.source, None)
+        if (entry is None) or (not os.path.isfile(node.destination)):
+            return False
+
+        key, dependencies = entry
+        if key != self.__pageKey(node.source, dependencies):
+            return False
+
+        for filename in dependencies:
+            node.addDependency(filename)
+        self.__cached.add(node.source)
+        return True
+
     def postExecute(self):
         """
         Combines all the LaTeX files into a single file.
@@ -653,17 +733,38 @@ class LatexRenderer(Renderer):
         root = self.translator.root
         sort_node(root)
 
-        main = self._processPages(root)
+        main, changed = self._processPages(root)
         loc = self.translator['destination']
-        with open(os.path.join(loc, 'main.tex'), 'w+') as fid:
-            fid.write(main.write())
-
         main_tex = os.path.join(loc, 'main.tex')
+        changed = common.write(main_tex, main.write()) or changed
+
+        # Store the data for determining the current pages for the next build
+        func = lambda n: isinstance(n, page.MarkdownNode)
+        nodes = [n for n in anytree.PreOrderIter(root, filter_=func)]
+        if self.get('fragment-cache'):
+            pages = dict()
+            for node in nodes:
+                if os.path.isfile(node.destination):
+                    dependencies = sorted(node.dependencies)
+                    pages[node.source] = (self.__pageKey(node.source, dependencies), dependencies)
+            with open(self.__fragmentsFilename(), 'w') as fid:
+                json.dump(dict(config=self.__configKey(), pages=pages), fid)
+
+        # Only the top-level pages were converted and unchanged, so the PDF is current
+        main_pdf = os.path.join(loc, 'main.pdf')
+        if (not changed) and all(n.source in self.__cached for n in nodes if n.depth > 1) \
+           and os.path.isfile(main_pdf):
+            LOG.info("The complete LaTeX document is unchanged: %s", main_tex)
+            return
+
         LOG.info("Building complete LaTeX document: %s", main_tex)
         cmd = ['pdflatex', '-halt-on-error', main_tex]
         try:
             subprocess.check_output(cmd, cwd=loc, stderr=subprocess.STDOUT)
         except subprocess.CalledProcessError as e:
+            # The PDF from a previous build must not be considered current by the next build
+            if os.path.isfile(main_pdf):
+                os.remove(main_pdf)
             msg = 'Failed to run command: {}'
             raise exceptions.MooseDocsException(msg, ' '.join(cmd), error=e.output)
 
@@ -675,36 +776,63 @@ class LatexRenderer(Renderer):
 
     def _processPages(self, root):
         """
-        Build a main latex file that includes the others.
+        Build a main latex file that includes the others, returns the main node and True if a
+        page was written.
+
+        The pages are written by Translator.execute, except the top-level pages, which are
+        converted again to extract the title.
         """
 
         main = base.NodeBase()
         latex.Command(main, 'documentclass', string=u'report', end='')
-        for package in self._packages:
+        for package in sorted(self._packages):
             latex.Command(main, 'usepackage', string=package, start='\n', end='')
 
+        changed = False
         func = lambda n: isinstance(n, page.MarkdownNode)
         nodes = [n for n in anytree.PreOrderIter(root, filter_=func)]
         for node in nodes:
-
-            # If the parallel implementation was better this would not be needed.
-            node.tokenize()
-            node.render(node.ast)
-
             if node.depth == 1:
+                self.translator.current = node
+                self.translator.reinit()
+                node.render(node.tokenize())
+                self.translator.current = None
+
                 title = latex.Command(main, 'title', start='\n')
                 for child in node.result.children[0]:#[0].children:
                     child.parent = title
                 node.result.children[0].parent = None
+                changed = node.write() or changed
 
         doc = latex.Environment(main, 'document', end='\n')
         latex.Command(doc, 'maketitle')
         for node in nodes:
-            node.write()
             cmd = latex.Command(doc, 'input', start='\n')
             latex.String(cmd, content=unicode(node.destination), escape=False)
 
-        return main
+        return main, changed
+
+    def __fragmentsFilename(self):
+        """Return the file that stores the page data, see cached."""
+        return os.path.join(self.translator['destination'], 'latex_fragments.json')
+
+    def __configKey(self):
+        """Return a hash of the renderer and extension configuration, see preExecute."""
+        items = [(type(ext).__name__, sorted(ext.getConfig().items())) \
+                 for ext in self.translator.extensions]
+        data = (self.FRAGMENT_VERSION, sorted(self.getConfig().items()), items)
+        return hashlib.sha1(repr(data)).hexdigest()
+
+    @staticmethod
+    def __pageKey(source, dependencies):
+        """Return a hash of the content of the page and the files that it depends on."""
+        sha = hashlib.sha1()
+        for filename in [source] + list(dependencies):
+            sha.update(filename)
+            if os.path.isfile(filename):
+                with open(filename, 'rb') as fid:
+                    sha.update(hashlib.sha1(fid.read()).hexdigest())
+        return sha.hexdigest()
 
 class JSONRenderer(Renderer):
     """
@@ -0,0 +1,146 @@
+"""
+Defines the Timing object for recording the time spent within the components and extensions
+during the conversion of pages, see Translator 'timing' configuration option.
+"""
+import time
+import json
+
+class Timing(object):
+    """
+    Storage for the time spent by reader components (by Pattern name), render components (by
+    token type), and extension functions (e.g., preRender), as well as the time spent tokenizing,
+    rendering, and writing each page.
+
+    The component times exclude the time of nested component calls (e.g., a component that
+    tokenizes the content of another file), so the times may be summed. The data is stored as
+    plain python types, so it may be returned from the processes that convert the pages and
+    combined with the merge method.
+    """
+    #: The names of the page conversion steps, see MarkdownNode.build
+    STEPS = ('tokenize', 'render', 'write')
+
+    def __init__(self):
+        self.__components = dict() # (kind, name, extension): [count, time]
+        self.__pages = dict()      # source: [tokenize, render, write]
+        self.__stack = []          # time of nested calls for the components being executed
+
+    @property
+    def data(self):
+        """Return the recorded data, see merge."""
+        return self.__components, self.__pages
+
+    def clear(self):
+        """Remove all recorded data."""
+        self.__components.clear()
+        self.__pages.clear()
+
+    def merge(self, data):
+        """
+        Add the data from another Timing object (e.g., from a process that converted pages).
+
+        Inputs:
+            data[tuple]: The data from the Timing.data property.
+        """
+        components, pages = data
+        for key, (count, t) in components.iteritems():
+            record = self.__components.setdefault(key, [0, 0.])
+            record[0] += count
+            record[1] += t
+        for source, times in pages.iteritems():
+            record = self.__pages.setdefault(source, [0.] * len(self.STEPS))
+            for i, t in enumerate(times):
+                record[i] += t
+
+    def call(self, kind, name, extension, func, *args):
+        """
+        Call the supplied function and record the time with the kind, name, and extension.
+
+        Inputs:
+            kind[str]: The type of function being called ('reader', 'render', or 'extension').
+            name[str]: The name of the component (e.g., the Pattern name or token type).
+            extension[Extension]: The extension object that contains the function.
+            func[function]: The function to execute with the remaining arguments.
+        """
+        self.__stack.append(0.)
+        start = time.time()
+        try:
+            return func(*args)
+        finally:
+            t = time.time() - start
+            nested = self.__stack.pop()
+            if self.__stack:
+                self.__stack[-1] += t
+
+            key = (kind, name, type(extension).__name__ if extension else None)
+            record = self.__components.get(key, None)
+            if record is None:
+                record = self.__components[key] = [0, 0.]
+            record[0] += 1
+            record[1] += t - nested
+
+    def page(self, source, step, func, *args):
+        """
+        Call the supplied function and record the time for a step in converting a page.
+
+        Inputs:
+            source[str]: The page source filename.
+            step[str]: The conversion step, see STEPS.
+            func[function]: The function to execute with the remaining arguments.
+        """
+        start = time.time()
+        try:
+            return func(*args)
+        finally:
+            record = self.__pages.setdefault(source, [0.] * len(self.STEPS))
+            record[self.STEPS.index(step)] += time.time() - start
+
+    def extensions(self):
+        """Return the total time spent for each extension."""
+        out = dict()
+        for (_, _, extension), (_, t) in self.__components.iteritems():
+            out[extension] = out.get(extension, 0) + t
+        return out
+
+    def report(self, num=10):
+        """
+        Return a summary of the slowest pages, components, and extensions.
+
+        Inputs:
+            num[int]: The number of pages and components to include.
+        """
+        out = []
+        pages = sorted(self.__pages.iteritems(), key=lambda x: sum(x[1]), reverse=True)
+        out.append('Slowest pages (of {}):'.format(len(pages)))
+        out.append('  {:>9} {:>9} {:>9} {:>9}  {}'.format('total', *self.STEPS + ('page',)))
+        for source, times in pages[:num]:
+            out.append('  {:9.4f} {:9.4f} {:9.4f} {:9.4f}  {}'.format(sum(times), *times + [source]))
+
+        components = sorted(self.__components.iteritems(), key=lambda x: x[1][1], reverse=True)
+        out.append('Slowest components (of {}):'.format(len(components)))
+        out.append('  {:>9} {:>9}  {}'.format('time', 'count', 'component'))
+        for (kind, name, extension), (count, t) in components[:num]:
+            out.append('  {:9.4f} {:9d}  {}:{} ({})'.format(t, count, kind, name, extension))
+
+        out.append('Extensions:')
+        extensions = sorted(self.extensions().iteritems(), key=lambda x: x[1], reverse=True)
+        for extension, t in extensions:
+            out.append('  {:9.4f}  {}'.format(t, extension))
+        return '\n'.join(out)
+
+    def write(self, filename, **kwargs):
+        """
+        Write the recorded data to a JSON file, which may be used to compare builds.
+
+        Inputs:
+            filename[str]: The name of the file to create.
+            **kwargs: Additional items to include in the file (e.g., the commit).
+        """
+        data = dict(kwargs)
+        data['pages'] = dict((source, dict(zip(self.STEPS, times))) \
+                             for source, times in self.__pages.iteritems())
+        data['components'] = [dict(kind=kind, name=name, extension=extension, count=count, time=t)
+                              for (kind, name, extension), (count, t) \
+                              in sorted(self.__components.iteritems())]
+        data['extensions'] = self.extensions()
+        with open(filename, 'w') as fid:
+            json.dump(data, fid, indent=2, sort_keys=True)
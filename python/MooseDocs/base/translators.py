@@ -4,10 +4,15 @@ Renderer objects. The Translator objects exist as a place to import extensions a
 between the reading and rendering content.
 """
 import os
+import uuid
 import logging
+import collections
 import multiprocessing
+import multiprocessing.pool
+import tempfile
 import time
 import json
+import Queue
 
 import anytree
 
@@ -19,6 +24,7 @@ from MooseDocs.common import mixins, exceptions
 from MooseDocs.tree import page
 from components import Extension
 from readers import Reader
+from timing import Timing
 from renderers import Renderer, MaterializeRenderer
 
 LOG = logging.getLogger('MooseDocs.Translator')
@@ -46,6 +52,16 @@ class Translator(mixins.ConfigObject):
         config['destination'] = (os.path.join(os.getenv('HOME'), '.local', 'share', 'moose',
                                               'site'),
                                  "The output directory.")
+        config['costs'] = (os.path.join(os.getenv('HOME'), '.local', 'share', 'moose', 'cache',
+                                        'page_costs.json'),
+                           "The file for storing the page conversion times, which are used to " \
+                           "schedule the most expensive pages first when building in parallel.")
+        config['release'] = (True, "Release the AST and rendered result of each page after it is " \
+                                   "written by a worker process (i.e., when building in " \
+                                   "parallel), only the tokens needed for linking to the page " \
+                                   "are kept (see MarkdownNode.release).")
+        config['timing'] = (False, "Record the time spent by the components and extensions for " \
+                                   "each page, see the 'timing' property.")
         return config
 
     def __init__(self, content, reader, renderer, extensions, **kwargs):
@@ -66,6 +82,9 @@ class Translator(mixins.ConfigObject):
         self.__reader = reader
         self.__renderer = renderer
         self.__destination = None # assigned during init()
+        self.__timing = None # assigned during init(), see 'timing' configuration option
+        self.__release = False # enabled on the worker processes, see execute()
+        self.__ids = collections.defaultdict(int) # counts for uniqueID(), reset by reinit()
         self.__extension_functions = dict(preRender=list(),
                                           postRender=list(),
                                           preTokenize=list(),
@@ -103,6 +122,19 @@ class Translator(mixins.ConfigObject):
             common.check_type('value', value, (type(None), page.PageNodeBase))
         self.__current = value
 
+    @property
+    def timing(self):
+        """Return the Timing object, this is None unless the 'timing' option is enabled."""
+        return self.__timing
+
+    @property
+    def release(self):
+        """
+        Return True if the pages should release the AST and rendered result when they are no
+        longer needed, this is only enabled on the worker processes (see execute).
+        """
+        return self.__release
+
     @property
     def lock(self):
         """Return a multiprocessing lock for serial operations (e.g., directory creation)."""
@@ -131,6 +163,11 @@ class Translator(mixins.ConfigObject):
             raise MooseDocs.common.exceptions.MooseDocsException(msg, type(self))
 
         destination = self.get("destination")
+        if self.get('timing'):
+            self.__timing = Timing()
+            self.__reader.lexer.timing = self.__timing
+            self.__renderer.timing = self.__timing
+
         self.__reader.init(self)
         self.__renderer.init(self)
 
@@ -167,19 +204,42 @@ class Translator(mixins.ConfigObject):
                 raise exceptions.MooseDocsException(msg, name, self.__extension_functions.keys())
 
         for func in self.__extension_functions[name]:
-            func(*args)
+            if self.__timing is None:
+                func(*args)
+            else:
+                self.__timing.call('extension', name, func.__self__, func, *args)
 
     def reinit(self):
         """
         Reinitialize the Reader, Renderer, and all Extension objects.
         """
         self.__assertInitialize()
+        self.__ids.clear()
         self.reader.reinit()
         self.renderer.reinit()
 
         for ext in self.__extensions:
             ext.reinit()
 
+    def uniqueID(self, prefix=u''):
+        """
+        Return an ID (uuid.UUID) that is unique within the page being converted.
+
+        The ID is computed from the location of the current page, the supplied prefix, and the
+        number of IDs requested with the prefix since the last call to reinit(). Unlike
+        uuid.uuid4(), the same IDs are created each time an unchanged page is converted, thus
+        the output is identical.
+
+        Inputs:
+            prefix[unicode]: Name for the type of ID (e.g., u'modal'), each prefix is counted
+                             separately so the order in which different types are created
+                             does not alter the IDs.
+        """
+        self.__ids[prefix] += 1
+        local = self.__current.local if self.__current is not None else u''
+        name = u'{}:{}:{}'.format(local, prefix, self.__ids[prefix])
+        return uuid.uuid5(uuid.NAMESPACE_URL, name.encode('utf-8'))
+
     def execute(self, num_threads=1):
         """
         Perform parallel build for all pages.
@@ -187,6 +247,11 @@ class Translator(mixins.ConfigObject):
         Inputs:
             num_threads[int]: The number of threads to use (default: 1).
 
+        The pages are converted by worker processes that take pages from a queue, the pages are
+        ordered by the conversion time from the previous build (see the 'costs' configuration
+        option) so that the expensive pages are started first. Files are copied by a pool of
+        threads in the main process while the pages are converted.
+
         NOTICE:
         A proper parallelization for MooseDocs would be three parallel steps, with minimal
         communication.
@@ -214,8 +279,13 @@ class Translator(mixins.ConfigObject):
         This new system is already an order of 4 times faster than the previous implementation and
         likely could be optimized further.
 
-        The multiprocessing.Manager() needs to be explored, it is working to pull the JSON index
-        information together.
+        The search index entries for each page are returned to the main process with the page
+        results (i.e., in bulk), so no shared objects or locks are needed to build the index.
+
+        The worker processes release the AST and rendered result of each page after the page is
+        written (see the 'release' configuration option), so the memory of each process does not
+        grow with the number of pages that it builds. The pages built by the main process are kept,
+        since they are reused by the livereload server.
         """
         common.check_type('num_threads', num_threads, int)
         self.__assertInitialize()
@@ -227,51 +297,203 @@ class Translator(mixins.ConfigObject):
         LOG.info("Building Pages...")
         start = time.time()
 
-        manager = multiprocessing.Manager()
-        array = manager.list()
         build_index = isinstance(self.renderer, MaterializeRenderer)
-        def target(nodes, lock):
-            """Helper for building multiple nodes (i.e., a chunk for a process)."""
-            for node in nodes:
-                node.build()
-                if isinstance(node, page.MarkdownNode):
-                    if build_index:
-                        node.buildIndex(self.renderer.get('home', None))
-                        with lock:
-                            for entry in node.index:
-                                array.append(entry)
-
-        # Complete list of nodes
-        nodes = [n for n in anytree.PreOrderIter(self.root)]
+        def build_page(i, node):
+            """
+            Helper for building a page, returns the index, status, time, search index, and
+            dependencies.
+            """
+            t = time.time()
+            status = node.build()
+            index = None
+            if build_index:
+                node.buildIndex(self.renderer.get('home', None))
+                index = node.index
+            if self.__release:
+                node.release()
+            return i, status, time.time() - t, index, node.dependencies
+
+        def target(queue, results):
+            """Helper for building pages from the queue until None is received (i.e., a worker)."""
+            busy = 0
+            count = 0
+            self.__release = self.get('release')
+            if self.__timing is not None:
+                self.__timing.clear() # remove data copied from the main process
+            try:
+                for i in iter(queue.get, None):
+                    out = build_page(i, nodes[i])
+                    results.put(out)
+                    busy += out[2]
+                    count += 1
+            finally:
+                results.put((None, count, busy, self.__timing.data if self.__timing else None))
+
+        # Complete list of nodes, separated into pages that are converted, files that are copied
+        # and other nodes (i.e., directories)
+        nodes = list(anytree.PreOrderIter(self.root))
+        pages = [i for i, n in enumerate(nodes) if isinstance(n, page.MarkdownNode)]
+        files = [n for n in nodes if isinstance(n, page.FileNode) and \
+                 not isinstance(n, page.MarkdownNode)]
+        others = [n for n in nodes if not isinstance(n, page.FileNode)]
+
+        # Order the pages by the cost from the previous build, most expensive first, such that
+        # the long running pages do not start last; pages without a cost are assumed to be expensive
+        costs = self.__loadCosts()
+        default = max(costs.itervalues()) if costs else 0
+        pages.sort(key=lambda i: costs.get(nodes[i].source, default), reverse=True)
+
+        # Create directories (serial), this must be complete prior to building pages/files
+        status = [n.build() for n in others]
+
+        # Pages with current output from a previous build are not converted, see Renderer.cached
+        cached = set(i for i in pages if self.renderer.cached(nodes[i]))
+        if cached:
+            LOG.info("Using the output from the previous build for %s page(s).", len(cached))
+            pages = [i for i in pages if i not in cached]
+            status += [False] * len(cached)
+        workers = []
 
         # Serial
         if num_threads == 1:
-            target(nodes, self.lock)
+            status += [n.build() for n in files]
+            results = [build_page(i, nodes[i]) for i in pages]
+            workers.append((len(results), sum(r[2] for r in results)))
 
-        # Multiprocessing
+        # Multiprocessing: Pages are converted by a pool of processes that take the pages from a
+        # queue, the file copies are performed by a pool of threads in the main process.
         else:
+            # List the project files once, rather than on each process (see common.project_find)
+            common.project_files()
+
+            queue = multiprocessing.Queue()
+            output = multiprocessing.Queue()
+            for i in pages:
+                queue.put(i)
+
             jobs = []
-            for chunk in mooseutils.make_chunks(nodes, num_threads):
-                p = multiprocessing.Process(target=target, args=(chunk, self.lock))
+            for _ in range(num_threads):
+                queue.put(None)
+                p = multiprocessing.Process(target=target, args=(queue, output))
                 p.start()
                 jobs.append(p)
 
+            t = time.time()
+            pool = multiprocessing.pool.ThreadPool(num_threads)
+            status += pool.map(lambda n: n.build(), files)
+            pool.close()
+            pool.join()
+            LOG.info("Copied %s file(s) in %.2f sec.", len(files), time.time() - t)
+
+            results = []
+            while len(workers) < num_threads:
+                try:
+                    out = output.get(timeout=1)
+                except Queue.Empty:
+                    if not any(job.is_alive() for job in jobs):
+                        break
+                    continue
+                if out[0] is None:
+                    workers.append(out[1:3])
+                    if out[3] is not None:
+                        self.__timing.merge(out[3])
+                else:
+                    results.append(out)
+
             for job in jobs:
                 job.join()
 
+        # The page dependencies are needed by the livereload watcher, see commands/build.py
+        for r in results:
+            status.append(r[1])
+            nodes[r[0]].dependencies.update(r[4])
+        self.__writeCosts(costs, [(nodes[r[0]].source, r[2]) for r in results])
+
         # Done
         stop = time.time()
         LOG.info("Build time %s sec.", stop - start)
+        for i, (count, busy) in enumerate(workers):
+            LOG.info("Worker %s built %s page(s), busy for %.2f sec. (%.0f%%)",
+                     i, count, busy, 100 * busy / (stop - start))
 
+        # The search index entries are returned with the results from each page, they are sorted
+        # by page because the processes complete in arbitrary order
         if build_index:
-            iname = os.path.join(self.get('destination'), 'js', 'search_index.js')
-            if not os.path.isdir(os.path.dirname(iname)):
-                os.makedirs(os.path.dirname(iname))
-            items = [v for v in array if v]
-            common.write(iname, 'var index_data = {};'.format(json.dumps(items)))
+            results.sort(key=lambda r: r[0])
+            status.append(self.__writeSearchIndex([v for r in results for v in r[3] or [] if v]))
+
+        LOG.info("Wrote %s file(s), %s file(s) were unchanged.",
+                 status.count(True), status.count(False))
 
         self.renderer.postExecute()
 
+    def __writeSearchIndex(self, items):
+        """
+        Write the search index, the format is set by the 'search-index' renderer option.
+
+        The 'trie' format stores the locations as a tree of the URL path components (directories
+        include the trailing '/'), with the page name stored once for each page rather than for
+        every section. The file includes a function for expanding the tree into the list used by
+        the search (index_data).
+
+        Inputs:
+            items[list]: The search entries from MarkdownNode.buildIndex.
+        """
+        fmt = self.renderer.get('search-index', 'list')
+        if fmt == 'list':
+            content = 'var index_data = {};'.format(json.dumps(items))
+
+        elif fmt == 'trie':
+            trie = collections.OrderedDict()
+            for item in items:
+                url, _, fragment = item['location'].partition('#')
+                parts = url.split('/')
+                node = trie
+                for part in parts[:-1]:
+                    node = node.setdefault(part + '/', collections.OrderedDict())
+                node.setdefault(parts[-1], [item['name'], []])[1].append([item['text'], fragment])
+
+            content = 'var index_data = (function(t){var o=[];(function f(n,p){for(var k in n){' \
+                      'var v=n[k];if(Array.isArray(v)){for(var i=0;i<v[1].length;i++){' \
+                      'o.push({name:v[0],text:v[1][i][0],location:p+k+"#"+v[1][i][1]});}}' \
+                      'else{f(v,p+k);}}})(t,"");return o;})(' + \
+                      json.dumps(trie, separators=(',', ':')) + ');'
+
+        else:
+            msg = "The 'search-index' option must be 'list' or 'trie', but '{}' was provided."
+            raise exceptions.MooseDocsException(msg, fmt)
+
+        iname = os.path.join(self.get('destination'), 'js', 'search_index.js')
+        if not os.path.isdir(os.path.dirname(iname)):
+            os.makedirs(os.path.dirname(iname))
+        return common.write(iname, content)
+
+    def __loadCosts(self):
+        """Return the page conversion times from the previous build, see execute()."""
+        filename = self.get('costs')
+        if filename and os.path.isfile(filename):
+            try:
+                with open(filename, 'r') as fid:
+                    return json.load(fid)
+            except (IOError, ValueError):
+                LOG.warning("Failed to read the page conversion times: %s", filename)
+        return dict()
+
+    def __writeCosts(self, costs, times):
+        """Update the page conversion times, see execute()."""
+        filename = self.get('costs')
+        if not filename or not times:
+            return
+
+        costs.update(times)
+        dirname = os.path.dirname(filename)
+        if dirname and not os.path.isdir(dirname):
+            os.makedirs(dirname)
+        fid, tmp = tempfile.mkstemp(dir=dirname or None)
+        with os.fdopen(fid, 'w') as fid:
+            json.dump(costs, fid)
+        os.rename(tmp, filename)
+
     def __assertInitialize(self):
         """Helper for asserting initialize status."""
         if not self.__initialized:
@@ -5,14 +5,10 @@ import logging
 import subprocess
 import shutil
 
-import anytree
-import livereload
-
 import mooseutils
 
 import MooseDocs
 from MooseDocs import common
-from MooseDocs.tree import page
 from check import check
 
 def command_line_options(subparser, parent):
@@ -41,7 +37,11 @@ def command_line_options(subparser, parent):
                         help="The local host for live web server (default: %(default)s).")
     parser.add_argument('--clean', action='store_true',
                         help="Clean the destination directory when the '--files' option is used. "
-                             "The destination directory is always cleaned otherwise.")
+                             "The destination directory is always cleaned otherwise, unless "
+                             "the '--incremental' option is used.")
+    parser.add_argument('--incremental', action='store_true',
+                        help="Do not clean the destination directory, only the files with "
+                             "content that differs from the existing files are written.")
     parser.add_argument('-f', '--files', default=[], nargs='*',
                         help="A list of file to build, this is useful for testing. The paths " \
                              "should be as complete as necessary to make the name unique, just " \
@@ -50,68 +50,20 @@ def command_line_options(subparser, parent):
                                                      "This is mainly used by CIVET to allow " \
                                                      "temporary sites to be functional.")
 
+    parser.add_argument('--timing-report', nargs='?', const='timing.json', default=None,
+                        metavar='FILENAME',
+                        help="Record the time spent by the components and extensions, the " \
+                             "slowest pages and components are printed and the complete data " \
+                             "is written to a JSON file (default: %(const)s).")
+    parser.add_argument('--timing-count', type=int, default=10,
+                        help="The number of pages and components to include in the timing " \
+                             "report (default: %(default)s).")
+
     parser.add_argument('--check', action='store_true',
                         help="Run the default check command prior to build, the main purpose " \
                              "of this command is to allow the make targets to avoid creating " \
                              "the syntax multiple times.")
 
-class MooseDocsWatcher(livereload.watcher.Watcher):
-    """
-    A livereload watcher for MooseDocs that adds nodes to the directory tree when pages are added.
-
-    Inputs:
-        translator[Translator]: Instance of the translator object for converting files.
-        options[argparse]: Complete argparse options as passed into the main function.
-    """
-
-    def __init__(self, translator, options, *args, **kwargs):
-        super(MooseDocsWatcher, self).__init__(*args, **kwargs)
-        self._options = options
-        self._translator = translator
-
-        for node in anytree.PreOrderIter(self._translator.root):
-            if isinstance(node, page.FileNode):
-                self.watch(node.source, node.build, delay=2)
-
-    def execute(self):
-        """
-        Perform complete build.
-        """
-        self._translator.execute(self._options.num_threads)
-
-    def examine(self):
-        """
-        Investigate directories for new files and add them to the tree if found.
-
-        TODO: Remove nodes if page is deleted.
-        TODO: Handle !include (see extensions.include.py for more information).
-        """
-        for node in anytree.PreOrderIter(self._translator.root):
-
-            # Only perform check on valid directories
-            if not isinstance(node, page.DirectoryNode) or not os.path.exists(node.source):
-                continue
-
-            # Build map of child pages for the directory
-            children = {child.name:child for child in node.children \
-                        if isinstance(child, page.FileNode)}
-
-            # Compare the list of files in the directory with those tracked by MooseDocs
-            for filename in os.listdir(node.source):  #pylint: disable=no-member
-                if filename.endswith(MooseDocs.FILE_EXT) and not filename.startswith('.'):
-                    if filename not in children:
-                        source = os.path.join(node.source, filename)
-                        if filename.endswith('.md'):
-                            new = page.MarkdownNode(node, source=source)
-                        else:
-                            new = page.FileNode(node, source=source) #pylint: disable=redefined-variable-type
-                        new.base = self._options.destination
-                        self.watch(new.source, new.build, delay=2) #pylint: disable=no-member
-                        new.init(self._translator)
-                        new.build()
-
-        return super(MooseDocsWatcher, self).examine()
-
 def _init_large_media():
     """Check submodule for large_media."""
     log = logging.getLogger('MooseDocs._init_large_media')
@@ -124,6 +76,19 @@ def _init_large_media():
             subprocess.call(['git', 'submodule', 'update', '--init', 'large_media'],
                             cwd=MooseDocs.MOOSE_DIR)
 
+def _timing_report(timing, filename, num):
+    """Print the slowest pages and components and write the complete timing data."""
+    try:
+        commit = subprocess.check_output(['git', 'rev-parse', 'HEAD'], cwd=MooseDocs.ROOT_DIR,
+                                         stderr=subprocess.STDOUT).strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+
+    print timing.report(num)
+    timing.write(filename, commit=commit)
+    log = logging.getLogger('MooseDocs.build')
+    log.info("Wrote timing report: %s", filename)
+
 def main(options):
     """
     Main function for the build command.
@@ -139,6 +104,8 @@ def main(options):
     translator, _ = common.load_config(options.config)
     if options.destination:
         translator.update(destination=mooseutils.eval_path(options.destination))
+    if options.timing_report:
+        translator.update(timing=True)
     translator.init()
 
     # Replace "home" with local server
@@ -152,8 +119,8 @@ def main(options):
     if options.dump:
         print translator.root
 
-    # Clean when --files is NOT used or when --clean is used with --files.
-    if ((options.files == []) or (options.files != [] and options.clean)) \
+    # Clean when --files and --incremental are NOT used or when --clean is used.
+    if ((options.files == [] and not options.incremental) or options.clean) \
        and os.path.exists(translator['destination']):
         log = logging.getLogger('MooseDocs.build')
         log.info("Cleaning destination %s", translator['destination'])
@@ -171,7 +138,13 @@ def main(options):
     else:
         translator.execute(options.num_threads)
 
+    # Report timing
+    if options.timing_report:
+        _timing_report(translator.timing, options.timing_report, options.timing_count)
+
     if options.serve:
+        import livereload # only required for serving the pages
+        from watcher import MooseDocsWatcher
         watcher = MooseDocsWatcher(translator, options)
         server = livereload.Server(watcher=watcher)
         server.serve(root=translator['destination'], host=options.host, port=options.port)
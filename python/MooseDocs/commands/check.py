@@ -55,13 +55,14 @@ def check(translator,
           object_prefix=os.path.join('doc', 'content', 'source'),
           syntax_prefix=os.path.join('doc', 'content', 'syntax')):
     """Helper to all both main and build.py:main to perform check."""
+    from MooseDocs.extensions import appsyntax # not imported at startup, see extensions/__init__.py
 
     # Extract the syntax root node
     app_syntax = None
     extension = None
     for ext in translator.extensions:
         extension = ext
-        if isinstance(ext, MooseDocs.extensions.appsyntax.AppSyntaxExtension):
+        if isinstance(ext, appsyntax.AppSyntaxExtension):
             app_syntax = ext.syntax
             break
 
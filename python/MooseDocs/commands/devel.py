@@ -6,8 +6,6 @@ import importlib
 import logging
 
 from MooseDocs.tree import tokens
-from MooseDocs.base import components, testing
-from MooseDocs.extensions import command
 
 def command_line_options(subparser, parent):
     """Define the 'devel' command."""
@@ -28,6 +26,8 @@ def sub_function(match, values):
 #pylint: disable=cell-var-from-loop,redefined-variable-type,undefined-loop-variable
 def main(options):
     """./moosedocs devel"""
+    from MooseDocs.base import components, testing # not imported at startup
+    from MooseDocs.extensions import command
 
     LOG = logging.getLogger(__name__) #pylint: disable=invalid-name
 
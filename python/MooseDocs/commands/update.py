@@ -12,7 +12,6 @@ import logging
 import subprocess
 import anytree
 
-import MooseDocs
 from MooseDocs.tree import syntax
 from MooseDocs import common
 
@@ -29,12 +28,13 @@ def command_line_options(subparser, parent):
 
 def main(options):
     """./moosedocs update"""
+    from MooseDocs.extensions import appsyntax # not imported at startup, see extensions/__init__.py
 
     # Load syntax
     translator, _ = common.load_config(options.config)
     root = None
     for ext in translator.extensions:
-        if isinstance(ext, MooseDocs.extensions.appsyntax.AppSyntaxExtension):
+        if isinstance(ext, appsyntax.AppSyntaxExtension):
             root = ext.syntax
             break
 
@@ -0,0 +1,116 @@
+"""Defines the livereload watcher for the MooseDocs build command (see build.py)."""
+import os
+import logging
+
+import anytree
+import livereload
+
+import MooseDocs
+from MooseDocs import common
+from MooseDocs.tree import page
+
+LOG = logging.getLogger(__name__)
+
+class MooseDocsWatcher(livereload.watcher.Watcher):
+    """
+    A livereload watcher for MooseDocs that rebuilds the pages with modified sources or
+    dependencies (e.g., !include and !listing files) and adds (removes) nodes to (from) the
+    directory tree when pages are added (deleted).
+
+    The changes are detected with a file monitor (see common/monitor.py), which uses inotify if
+    available, rather than the livereload tasks.
+
+    Inputs:
+        translator[Translator]: Instance of the translator object for converting files.
+        options[argparse]: Complete argparse options as passed into the main function.
+    """
+
+    def __init__(self, translator, options, *args, **kwargs):
+        super(MooseDocsWatcher, self).__init__(*args, **kwargs)
+        self._options = options
+        self._translator = translator
+        self._monitor = common.create_monitor()
+        self._nodes = dict()
+
+        for node in anytree.PreOrderIter(self._translator.root):
+            self._add(node)
+
+    def execute(self):
+        """
+        Perform complete build.
+        """
+        self._translator.execute(self._options.num_threads)
+
+    def examine(self):
+        """
+        Rebuild the pages affected by the changed files, see livereload.watcher.Watcher.
+        """
+        if self._changes:
+            return self._changes.pop()
+
+        paths = self._monitor.changes()
+        if not paths:
+            return None, None
+
+        build = set()
+        for path in sorted(paths):
+            node = self._nodes.get(path, None)
+            if (node is not None) and not os.path.exists(path):
+                self._remove(node)
+            elif node is not None:
+                build.add(node)
+            elif os.path.isfile(path):
+                node = self._create(path)
+                if node is not None:
+                    build.add(node)
+
+            # Pages that depend on the path
+            for other in self._nodes.itervalues():
+                if path in getattr(other, 'dependencies', tuple()):
+                    build.add(other)
+
+        for node in sorted(build, key=lambda n: n.source):
+            if node.parent is not None:
+                LOG.info("Building %s", node.source)
+                node.build()
+                for filename in getattr(node, 'dependencies', tuple()):
+                    self._monitor.watch(filename)
+
+        return sorted(paths)[0], None
+
+    def _add(self, node):
+        """Add a node and the node dependencies to the monitored paths."""
+        if isinstance(node, page.LocationNodeBase) and os.path.exists(node.source):
+            self._nodes[node.source] = node
+            self._monitor.watch(node.source)
+            for filename in getattr(node, 'dependencies', tuple()):
+                self._monitor.watch(filename)
+
+    def _create(self, source):
+        """Create a node for a file added to a directory in the tree."""
+        parent = self._nodes.get(os.path.dirname(source), None)
+        filename = os.path.basename(source)
+        if not isinstance(parent, page.DirectoryNode) or filename.startswith('.') or \
+           not filename.endswith(MooseDocs.FILE_EXT):
+            return None
+
+        if filename.endswith('.md'):
+            node = page.MarkdownNode(parent, source=source)
+        else:
+            node = page.FileNode(parent, source=source) #pylint: disable=redefined-variable-type
+        node.base = self._translator['destination']
+        node.init(self._translator)
+        page.reset_cache(self._translator.root)
+        self._add(node)
+        return node
+
+    def _remove(self, node):
+        """Remove a node (and children) from the tree and the rendered output."""
+        LOG.info("Removing %s", node.source)
+        for child in anytree.PreOrderIter(node):
+            self._nodes.pop(child.source, None)
+            self._monitor.unwatch(child.source)
+            if isinstance(child, page.FileNode) and os.path.isfile(child.destination):
+                os.remove(child.destination)
+        node.parent = None
+        page.reset_cache(self._translator.root)
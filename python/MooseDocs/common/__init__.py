@@ -9,7 +9,8 @@ from load_config import load_config, load_extensions
 from build_class_database import build_class_database
 from read import read, write, get_language
 from regex import regex
-from project_find import project_find
+from project_find import project_find, project_files, add_project_directory
 from check_filenames import check_filenames
 from submodule_status import submodule_status
 from get_requirements import get_requirements
+from monitor import create_monitor, PollingMonitor, INotifyMonitor
@@ -1,11 +1,17 @@
 """Tools for extracting C++ class information."""
 import os
 import re
+import logging
+import cPickle
+import tempfile
+import multiprocessing
 
 import mooseutils
 
 import MooseDocs
 
+LOG = logging.getLogger(__name__)
+
 #: Locates class definitions in header files
 DEFINITION_RE = re.compile(r'class\s*(?P<class>\w+)\b[^;]')
 
@@ -15,6 +21,12 @@ CHILD_RE = re.compile(r'\bpublic\s+(?P<key>\w+)\b')
 #: Locates class use in input files
 INPUT_RE = re.compile(r'\btype\s*=\s*(?P<key>\w+)\b')
 
+#: Key for invalidating cached scan results, this must change if the regexes change
+CACHE_KEY = (DEFINITION_RE.pattern, CHILD_RE.pattern, INPUT_RE.pattern)
+
+#: Files are scanned serially unless more than this number need to be scanned
+MIN_PARALLEL = 256
+
 class DatabaseItem(object):
     """Storage container for class information."""
     def __init__(self, name, header, source):
@@ -24,15 +36,22 @@ class DatabaseItem(object):
         self.inputs = set()
         self.children = set()
 
-def build_class_database(include_dirs=None, input_dirs=None):
+def build_class_database(include_dirs=None, input_dirs=None, cache=None,
+                         num_threads=multiprocessing.cpu_count()):
     """
     Create the class database.
 
     Returns a dict() of DatabaseItem objects. The key is the class name e.g., Diffusion.
 
+    Each file is read once and all regexes are applied, the scan results are stored in the
+    optional cache file with the file modification time such that only the files that changed
+    are read on subsequent calls.
+
     Inputs:
         include_dirs[list]: A space separated str or a list of include directories.
         input_dirs[list]: A space separated str or a list of input file directories.
+        cache[str]: (Optional) The filename for storing the file scan results.
+        num_threads[int]: The number of processes to use for scanning files.
     """
 
     # Handle environment variables
@@ -47,38 +66,110 @@ def build_class_database(include_dirs=None, input_dirs=None):
         input_dirs = [MooseDocs.ROOT_DIR]
 
     # Locate filenames
-    headers = _locate_filenames(include_dirs, '.h')
-    inputs = _locate_filenames(input_dirs, '.i')
+    filenames = _locate_filenames(set(include_dirs + input_dirs))
+    headers = sorted(fname for fname in _filter(filenames, include_dirs) if fname.endswith('.h'))
+    inputs = sorted(fname for fname in _filter(filenames, input_dirs) if fname.endswith('.i'))
+
+    # Scan the files
+    scans = _load_cache(cache)
+    if _scan_files(scans, headers + inputs, num_threads) and cache:
+        current = set(headers + inputs)
+        _write_cache(cache, dict((k, v) for k, v in scans.iteritems() \
+                                 if (k in current) or os.path.exists(k)))
 
     # Create the database
     objects = dict()
-    _process(objects, headers, DEFINITION_RE, _match_definition)
-    _process(objects, headers, CHILD_RE, _match_child)
-    _process(objects, inputs, INPUT_RE, _match_input)
-    return objects
+    for filename in headers:
+        for name in scans[filename][1]:
+            _match_definition(objects, filename, name)
+
+    for filename in headers:
+        for key in scans[filename][2]:
+            _match_child(objects, filename, key)
 
-def _locate_filenames(directories, ext):
-    """Locate files in the directories with the given extension."""
+    for filename in inputs:
+        for key in scans[filename][2]:
+            _match_input(objects, filename, key)
 
+    return objects
+
+def _locate_filenames(directories):
+    """Locate files in the directories, 'git ls-files' is executed once for each directory."""
     out = set()
     for location in directories:
         for filename in mooseutils.git_ls_files(os.path.join(MooseDocs.ROOT_DIR, location)):
-            if filename.endswith(ext) and not os.path.islink(filename):
+            if filename.endswith(('.h', '.i')) and not os.path.islink(filename):
                 out.add(filename)
     return out
 
-def _process(objects, filenames, regex, func):
-    """Process regex"""
-    for filename in filenames:
-        with open(filename, 'r') as fid:
-            content = fid.read()
+def _filter(filenames, directories):
+    """Return the filenames within the supplied directories."""
+    prefixes = tuple(os.path.join(os.path.abspath(os.path.join(MooseDocs.ROOT_DIR, d)), '') \
+                     for d in directories)
+    return [fname for fname in filenames if fname.startswith(prefixes)]
 
-        for match in regex.finditer(content):
-            func(objects, filename, match)
+def _scan(filename):
+    """
+    Read the file and apply the regexes.
 
-def _match_definition(objects, filename, match):
+    Returns a tuple with the modification time, the list of class definitions, and the list of
+    keys from the child (headers) or input (input files) regex.
+    """
+    mtime = os.path.getmtime(filename)
+    with open(filename, 'r') as fid:
+        content = fid.read()
+
+    if filename.endswith('.h'):
+        names = [match.group('class') for match in DEFINITION_RE.finditer(content)]
+        keys = [match.group('key') for match in CHILD_RE.finditer(content)]
+    else:
+        names = []
+        keys = [match.group('key') for match in INPUT_RE.finditer(content)]
+    return filename, (mtime, names, keys)
+
+def _scan_files(scans, filenames, num_threads):
+    """Scan the files that are not in the supplied scan results or have been modified."""
+    needed = [fname for fname in filenames \
+              if (fname not in scans) or (scans[fname][0] != os.path.getmtime(fname))]
+    if not needed:
+        return False
+
+    LOG.debug('Scanning %s of %s files for class information.', len(needed), len(filenames))
+    if (num_threads > 1) and (len(needed) > MIN_PARALLEL):
+        pool = multiprocessing.Pool(num_threads)
+        results = pool.imap_unordered(_scan, needed, chunksize=64)
+        scans.update(results)
+        pool.close()
+        pool.join()
+    else:
+        scans.update(_scan(fname) for fname in needed)
+    return True
+
+def _load_cache(filename):
+    """Load the file scan results, an empty dict() is returned if the cache is not valid."""
+    if filename and os.path.isfile(filename):
+        try:
+            with open(filename, 'rb') as fid:
+                key, scans = cPickle.load(fid)
+            if key == CACHE_KEY:
+                return scans
+        except Exception: #pylint: disable=broad-except
+            LOG.warning("Failed to load the class database cache: %s", filename)
+    return dict()
+
+def _write_cache(filename, scans):
+    """Write the file scan results, a temporary file is used to avoid partially written files."""
+    dirname = os.path.dirname(filename)
+    if dirname and not os.path.isdir(dirname):
+        os.makedirs(dirname)
+
+    fid, tmp = tempfile.mkstemp(dir=dirname or None)
+    with os.fdopen(fid, 'wb') as fid:
+        cPickle.dump((CACHE_KEY, scans), fid, cPickle.HIGHEST_PROTOCOL)
+    os.rename(tmp, filename)
+
+def _match_definition(objects, filename, name):
     """Class definition match function."""
-    name = match.group('class')
     src = filename.replace('/include/', '/src/')[:-2] + '.C'
     if not os.path.exists(src):
         src = None
@@ -88,16 +179,14 @@ def _match_definition(objects, filename, match):
     hdr = os.path.relpath(filename, MooseDocs.ROOT_DIR)
     objects[name] = DatabaseItem(name, hdr, src)
 
-def _match_child(objects, filename, match):
+def _match_child(objects, filename, key):
     """Child class match function."""
-    key = match.group('key')
     if key in objects:
         filename = os.path.relpath(filename, MooseDocs.ROOT_DIR)
         objects[key].children.add(filename)
 
-def _match_input(objects, filename, match):
+def _match_input(objects, filename, key):
     """Input use match function."""
-    key = match.group('key')
     if key in objects:
         filename = os.path.relpath(filename, MooseDocs.ROOT_DIR)
         objects[key].inputs.add(filename)
@@ -1,6 +1,7 @@
 #pylint: disable=missing-docstring
 import os
 import collections
+import multiprocessing
 import logging
 
 import mooseutils
@@ -27,30 +28,43 @@ class Requirement(object):
         frmt = '{}:\n    Text: {}\n    Design: {}\n    Issues: {}'
         return frmt.format(self.name, self.text, repr(self.design), repr(self.issues))
 
-def get_requirements(directories, specs):
+def get_requirements(directories, specs, cache=mooseutils.spec_reader.CACHE,
+                     num_threads=multiprocessing.cpu_count()):
     """
     Build requirements dictionary from the provided directories.
+
+    The specification files are read in parallel and the results are cached by modification time,
+    see mooseutils.read_specs.
+
+    Inputs:
+        directories[list]: The directories to search for specification files, with git.
+        specs[list]: The names of the specification files (e.g., ['tests']).
+        cache[str]: The filename for storing the specification data, None disables the cache.
+        num_threads[int]: The number of processes to use for reading the files.
     """
-    out = collections.defaultdict(list)
+    filenames = []
     for location in directories:
-        for filename in mooseutils.git_ls_files(location):
-            if not os.path.isfile(filename):
-                continue
-            fname = os.path.basename(filename)
-            if fname in specs:
-                _add_requirements(out, location, filename)
+        for filename in sorted(mooseutils.git_ls_files(location)):
+            if (os.path.basename(filename) in specs) and os.path.isfile(filename):
+                filenames.append((location, filename))
+
+    data = mooseutils.read_specs([f for _, f in filenames], cache=cache, num_threads=num_threads)
+
+    out = collections.defaultdict(list)
+    for location, filename in filenames:
+        if data[filename]:
+            _add_requirements(out, location, filename, data[filename][0])
 
     for i, requirements in enumerate(out.itervalues()):
         for j, req in enumerate(requirements):
             req.label = "F{}.{}".format(i+1, j+1)
     return out
 
-def _add_requirements(out, location, filename):
-    """Opens tests specification and extracts requirement items."""
-    root = mooseutils.hit_load(filename)
-    design = root.children[0].get('design', None)
-    issues = root.children[0].get('issues', None)
-    for child in root.children[0]:
+def _add_requirements(out, location, filename, block):
+    """Extracts requirement items from the top-level block of a test specification."""
+    design = block.get('design', None)
+    issues = block.get('issues', None)
+    for child in block:
         if 'requirement' in child:
 
             local_design = child.get('design', design)
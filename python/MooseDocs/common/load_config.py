@@ -4,7 +4,6 @@ import types
 import importlib
 import logging
 
-from mooseutils.yaml_load import yaml_load
 import MooseDocs
 from MooseDocs.common import check_type, exceptions
 
@@ -41,6 +40,7 @@ def load_config(filename):
     """
     Read the config.yml file and create the Translator object.
     """
+    from mooseutils.yaml_load import yaml_load # yaml is only required for loading configurations
     config = yaml_load(filename, root=MooseDocs.ROOT_DIR)
 
     content = _yaml_load_content(config)
@@ -0,0 +1,130 @@
+"""
+Objects for monitoring files and directories for changes, see commands/build.py.
+
+The INotifyMonitor is used when pyinotify is available, otherwise the PollingMonitor is used. Both
+objects provide the same interface: watch() and unwatch() add and remove files or directories and
+changes() returns the paths that were created, modified, or removed since the last call.
+"""
+import os
+import logging
+
+try:
+    import pyinotify
+except ImportError:
+    pyinotify = None
+
+LOG = logging.getLogger(__name__)
+
+def create_monitor():
+    """Return an INotifyMonitor, if pyinotify is available, otherwise a PollingMonitor."""
+    if pyinotify is not None:
+        return INotifyMonitor()
+    LOG.debug("The pyinotify package is not available, the file monitor will poll for changes.")
+    return PollingMonitor()
+
+class PollingMonitor(object):
+    """
+    Detect changes by comparing modification times.
+
+    The modification time of each watched file is checked on each call to changes(), the
+    content of a watched directory is listed only when the directory modification time changes
+    (i.e., a file was added or removed).
+    """
+    def __init__(self):
+        self._files = dict()
+        self._directories = dict()
+
+    def watch(self, path):
+        """Add a file or directory (not recursive) to the paths being monitored."""
+        if os.path.isdir(path):
+            if path not in self._directories:
+                self._directories[path] = (os.path.getmtime(path), set(os.listdir(path)))
+        elif path not in self._files:
+            self._files[path] = os.path.getmtime(path) if os.path.exists(path) else None
+
+    def unwatch(self, path):
+        """Remove a file or directory from the paths being monitored."""
+        self._files.pop(path, None)
+        self._directories.pop(path, None)
+
+    def changes(self):
+        """Return a set of the paths that have changed since the last call."""
+        out = set()
+        for path, mtime in self._files.items():
+            current = os.path.getmtime(path) if os.path.exists(path) else None
+            if current != mtime:
+                self._files[path] = current
+                out.add(path)
+
+        for path, (mtime, names) in self._directories.items():
+            if not os.path.isdir(path):
+                self._directories.pop(path)
+                out.add(path)
+                out.update(os.path.join(path, name) for name in names)
+                continue
+
+            current = os.path.getmtime(path)
+            if current != mtime:
+                current_names = set(os.listdir(path))
+                self._directories[path] = (current, current_names)
+                out.update(os.path.join(path, name) for name in names ^ current_names)
+
+        return out
+
+class INotifyMonitor(object):
+    """
+    Detect changes using the inotify events of the operating system (via pyinotify).
+
+    Watching a file adds a watch to the directory that contains it, the events are filtered so that
+    changes() only includes the watched files and the content of the watched directories (as for
+    the PollingMonitor).
+    """
+    MASK = pyinotify.IN_CLOSE_WRITE | pyinotify.IN_CREATE | pyinotify.IN_DELETE | \
+           pyinotify.IN_MOVED_FROM | pyinotify.IN_MOVED_TO | pyinotify.IN_DELETE_SELF \
+           if pyinotify else None
+
+    def __init__(self):
+        self._paths = set()
+        self._files = set()
+        self._directories = set()
+        self._watches = dict()
+        self._manager = pyinotify.WatchManager()
+        self._notifier = pyinotify.Notifier(self._manager, self._processEvent, timeout=0)
+
+    def watch(self, path):
+        """Add a file or directory (not recursive) to the paths being monitored."""
+        if os.path.isdir(path):
+            self._directories.add(path)
+            dirname = path
+        else:
+            self._files.add(path)
+            dirname = os.path.dirname(path)
+        if dirname not in self._watches:
+            self._watches.update(self._manager.add_watch(dirname, self.MASK, quiet=True))
+
+    def unwatch(self, path):
+        """Remove a file or directory from the paths being monitored."""
+        dirname = path if path in self._directories else os.path.dirname(path)
+        self._files.discard(path)
+        self._directories.discard(path)
+
+        # The directory watch is removed when it is not needed for other paths
+        if (dirname not in self._directories) and \
+           all(os.path.dirname(f) != dirname for f in self._files):
+            wd = self._watches.pop(dirname, None)
+            if (wd is not None) and (wd > 0):
+                self._manager.rm_watch(wd, quiet=True)
+
+    def changes(self):
+        """Return a set of the paths that have changed since the last call."""
+        while self._notifier.check_events(timeout=0):
+            self._notifier.read_events()
+        self._notifier.process_events()
+        out = set(path for path in self._paths if (path in self._files) or \
+                  (path in self._directories) or (os.path.dirname(path) in self._directories))
+        self._paths = set()
+        return out
+
+    def _processEvent(self, event):
+        """Store the path of the event."""
+        self._paths.add(event.pathname)
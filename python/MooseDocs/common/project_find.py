@@ -1,15 +1,101 @@
 #pylint:disable=missing-docstring, unused-argument
+import os
+import hashlib
+import tempfile
+import cPickle
+
+import mooseutils
+
 import MooseDocs
 
+#: Location of the cached 'git ls-files' results
+CACHE_DIR = os.path.join(os.path.expanduser('~'), '.local', 'share', 'moose', 'cache',
+                         'project_files')
+
+#: Change this if the stored data changes
+CACHE_VERSION = 1
+
+#: Repositories that contain project files, in addition to MooseDocs.ROOT_DIR and MOOSE_DIR
+_DIRECTORIES = []
+
+#: The complete list of project files and the repositories that have been listed
+_FILES = set()
+_LISTED = set()
+
 def project_find(filename):
     """
-    Utility for finding files within a project based on 'git ls-files', see MooseDocs.__init__.py.
+    Utility for finding files within a project based on 'git ls-files', see project_files().
 
     The main use for this function is locating source files for inclusion in listings or for
     creating bottom modals with source code.
-
-    The list of files is populated in MooseDocs.__init__.py, otherwise the list was created
-    multiple times.
     """
-    matches = [fname for fname in MooseDocs.PROJECT_FILES if fname.endswith(filename)]
+    matches = [fname for fname in project_files() if fname.endswith(filename)]
     return matches
+
+def project_files():
+    """
+    Return the set of files, via 'git ls-files', within the repositories of the project.
+
+    The list is created when first needed from MooseDocs.ROOT_DIR, MooseDocs.MOOSE_DIR, and the
+    repositories supplied to add_project_directory(). The result for each repository is cached on
+    disk, using the modification time of the git index, so 'git ls-files' only executes when the
+    index changes.
+    """
+    for location in [MooseDocs.ROOT_DIR, MooseDocs.MOOSE_DIR] + _DIRECTORIES:
+        if location not in _LISTED:
+            _FILES.update(_git_ls_files(location))
+            _LISTED.add(location)
+    return _FILES
+
+def add_project_directory(location):
+    """
+    Include the files from the git repository containing the supplied directory in the project.
+
+    Inputs:
+        location[str]: A directory within a git repository.
+    """
+    root = mooseutils.git_root_dir(location)
+    if root and (root not in _DIRECTORIES):
+        _DIRECTORIES.append(root)
+
+def _git_index(location):
+    """Return the git index file of the repository, None is returned if it is not located."""
+    git = os.path.join(location, '.git')
+    if os.path.isfile(git): # submodule or worktree
+        with open(git, 'r') as fid:
+            content = fid.read().strip()
+        if content.startswith('gitdir:'):
+            git = os.path.join(location, content[7:].strip())
+
+    index = os.path.join(git, 'index')
+    return index if os.path.isfile(index) else None
+
+def _git_ls_files(location):
+    """Return the files in the repository, using the cache if the git index has not changed."""
+    location = os.path.abspath(location)
+    index = _git_index(location)
+    if index is None:
+        return mooseutils.git_ls_files(location)
+
+    stat = os.stat(index)
+    key = (CACHE_VERSION, location, stat.st_mtime, stat.st_size)
+    filename = os.path.join(CACHE_DIR, '{}.pkl'.format(hashlib.sha1(location).hexdigest()))
+    try:
+        with open(filename, 'rb') as fid:
+            if cPickle.load(fid) == key:
+                return cPickle.load(fid)
+    except Exception: #pylint: disable=broad-except
+        pass
+
+    files = mooseutils.git_ls_files(location)
+    try:
+        if not os.path.isdir(CACHE_DIR):
+            os.makedirs(CACHE_DIR)
+        fid, tmp = tempfile.mkstemp(dir=CACHE_DIR)
+        with os.fdopen(fid, 'wb') as fid:
+            cPickle.dump(key, fid, cPickle.HIGHEST_PROTOCOL)
+            cPickle.dump(files, fid, cPickle.HIGHEST_PROTOCOL)
+        os.rename(tmp, filename)
+    except (IOError, OSError):
+        pass
+    return files
@@ -2,8 +2,12 @@
 import codecs
 import re
 import os
+import filecmp
 
-def read(filename):
+#: Storage for the content of files read with the cache enabled: filename -> (mtime, content)
+_CACHE = dict()
+
+def read(filename, cache=False):
     """
     Reads file using utf-8 encoding.
 
@@ -15,21 +19,68 @@ def read(filename):
 
     Inputs:
         filename[str]: The filename to open.
+        cache[bool]: When True the content is stored for the life of the process, the file is
+                     only read again if the modification time changes. This should be used for
+                     files that are included repeatedly (e.g., source code listings).
     """
+    if cache:
+        mtime = os.path.getmtime(filename)
+        item = _CACHE.get(filename, None)
+        if (item is not None) and (item[0] == mtime):
+            return item[1]
+
     with codecs.open(filename, encoding='utf-8') as fid:
         content = fid.read()
 
     if filename.endswith(('.h', '.C')):
         content = re.sub(r'^//\*', '//', content, flags=re.MULTILINE|re.UNICODE)
 
+    if cache:
+        _CACHE[filename] = (mtime, content)
     return content
 
-def write(filename, content):
+def write(filename, content, buffer_size=65536):
     """
     Write utf-8 file.
+
+    The content is written to a temporary file that replaces the supplied file only if the content
+    differs, so files with unchanged content are not modified. Returns True if the file was written.
+
+    Inputs:
+        filename[str]: The filename to write.
+        content[str|generator]: The content to write, if a generator (e.g., from the iterwrite
+                                method of the tree objects) is supplied the pieces are written in
+                                blocks of approximately 'buffer_size' characters.
     """
-    with codecs.open(filename, 'w', encoding='utf-8') as fid:
-        fid.write(content)
+    tmp = '{}.{}.tmp'.format(filename, os.getpid())
+    try:
+        with codecs.open(tmp, 'w', encoding='utf-8') as fid:
+            if isinstance(content, basestring):
+                fid.write(content)
+            else:
+                buf = []
+                count = 0
+                for item in content:
+                    buf.append(item)
+                    count += len(item)
+                    if count >= buffer_size:
+                        fid.write(''.join(buf))
+                        buf = []
+                        count = 0
+                fid.write(''.join(buf))
+
+        if os.path.isfile(filename) and filecmp.cmp(tmp, filename, shallow=False):
+            os.remove(tmp)
+            return False
+
+        os.rename(tmp, filename)
+        return True
+
+    except:
+        # The temporary file must not remain in the destination (e.g., an error while rendering)
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        raise
 
 def get_language(filename):
     """
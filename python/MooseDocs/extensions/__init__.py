@@ -1,18 +1,4 @@
-#pylint: disable=missing-docstring
-import alert
-import appsyntax
-import autolink
-import bibtex
-import command
-import core
-import devel
-import floats
-import panoptic
-import include
-import media
-import package
-import sqa
-import table
-import materialicon
-import layout
-import config
+"""
+MooseDocs extensions, the modules are imported when needed (see common.load_extensions) such that
+the dependencies of an extension (e.g., pybtex) are only loaded if the extension is used.
+"""
@@ -63,6 +63,11 @@ class AppSyntaxExtension(command.CommandExtension):
                               "List of include directories to investigate for class information.")
         config['inputs'] = ([],
                             "List of directories to interrogate for input files using an object.")
+        config['database-cache'] = (os.path.join(os.getenv('HOME'), '.local', 'share', 'moose',
+                                                 'cache', 'class_database.pkl'),
+                                    "File for caching the class database information, only " \
+                                    "the files that changed are re-scanned when the database " \
+                                    "is created. Set to None to disable.")
         config['disable'] = (False,
                              "Disable running the MOOSE application executable and simply use " \
                              "place holder text.")
@@ -109,7 +114,10 @@ class AppSyntaxExtension(command.CommandExtension):
                     LOG.error(msg, self['executable'], e.message)
 
         LOG.info("Building MOOSE class database.")
-        self._database = common.build_class_database(self['includes'], self['inputs'])
+        cache = self['database-cache']
+        self._database = common.build_class_database(self['includes'], self['inputs'],
+                                                     cache=mooseutils.eval_path(cache) \
+                                                     if cache else None)
 
         # Cache the syntax entries, search the tree is very slow
         if self._app_syntax:
@@ -305,7 +313,8 @@ class SyntaxChildrenCommand(SyntaxCommandHeadingBase):
                 lang = common.get_language(filename)
                 code = tokens.Code(None,
                                    language=lang,
-                                   code=common.read(os.path.join(MooseDocs.ROOT_DIR, filename)))
+                                   code=common.read(os.path.join(MooseDocs.ROOT_DIR, filename),
+                                                    cache=True))
                 floats.ModalLink(li,
                                  url=filename,
                                  bottom=True,
@@ -556,7 +565,7 @@ class RenderInputParametersToken(components.RenderComponent):
         else:
             groups['Required'] = dict()
             groups['Optional'] = dict()
-            for param in node.parameters.itervalues():
+            for _, param in sorted(node.parameters.iteritems()):
                 group = param['group_name']
                 if group and group not in groups:
                     groups[group] = dict()
@@ -2,8 +2,6 @@
 import os
 import re
 
-import anytree
-
 import MooseDocs
 from MooseDocs import common
 from MooseDocs.common import exceptions
@@ -47,14 +45,6 @@ LINK_RE = re.compile(r'(?P<filename>.*?\.md)(?P<bookmark>#.*)?')
 class AutoLinkMixin(object):
     """Common functionality for RenderComponent objects within this class."""
 
-    #: Caches for nodes to avoid searching AST for the same nodes
-    BOOKMARK_CACHE = dict()
-    HEADING_CACHE = dict()
-
-    def reinit(self): #pylint: disable=no-self-use
-        AutoLinkMixin.BOOKMARK_CACHE.clear()
-        AutoLinkMixin.HEADING_CACHE.clear()
-
     def createMaterialize(self, token, parent):
         tag = self.createHTML(token, parent)
         tag.addClass('tooltipped')
@@ -77,37 +67,18 @@ class AutoLinkMixin(object):
 
         return page, tag, href
 
-    #def findToken(self, ast, token):
     def findToken(self, root, token):
-        # Load the token from the cache or locate it
-        try:
-            return AutoLinkMixin.BOOKMARK_CACHE[token.bookmark]
-        except KeyError:
-            with self.translator.lock:
-                ast = root.tokenize()
-
-            for node in anytree.PreOrderIter(ast):
-                if 'id' in node and node['id'] == token.bookmark[1:]:
-                    AutoLinkMixin.BOOKMARK_CACHE[token.bookmark] = node
-                    return node
-
-        # If you get here the id does not exist
-        msg = "Failed to locate a token with id '{}' in '{}'."
-        raise exceptions.RenderException(token.info, msg, token.bookmark[1:],
-                                         self.translator.current.source)
+        """Locate the token with the bookmark 'id' from the index of the supplied page."""
+        node = root.findBookmark(token.bookmark[1:])
+        if node is None:
+            msg = "Failed to locate a token with id '{}' in '{}'."
+            raise exceptions.RenderException(token.info, msg, token.bookmark[1:],
+                                             self.translator.current.source)
+        return node
 
     def findHeading(self, root):
-        """Locate the first heading of the supplied AST."""
-        try:
-            return AutoLinkMixin.HEADING_CACHE[root]
-        except KeyError:
-            with self.translator.lock:
-                ast = root.tokenize()
-
-            for node in anytree.PreOrderIter(ast):
-                if isinstance(node, tokens.Heading):
-                    AutoLinkMixin.HEADING_CACHE[root] = node
-                    return node
+        """Locate the first heading of the supplied page."""
+        return root.findHeading()
 
 class AutoShortcutLink(tokens.ShortcutLink):
     PROPERTIES = [Property('header', default=False),
@@ -126,7 +97,7 @@ def _source_token(parent, key): #pylint
         src = unicode(source[0])
         code = tokens.Code(None,
                            language=common.get_language(src),
-                           code=common.read(os.path.join(MooseDocs.ROOT_DIR, src)))
+                           code=common.read(os.path.join(MooseDocs.ROOT_DIR, src), cache=True))
         link = floats.ModalLink(parent, url=src, content=code,
                                 bottom=True, title=tokens.String(None, content=src))
         return link
@@ -1,7 +1,10 @@
 #pylint: disable=missing-docstring
+import os
 import re
-import uuid
+import hashlib
 import logging
+import tempfile
+import cPickle
 
 import anytree
 
@@ -18,6 +21,12 @@ from MooseDocs.extensions import command
 
 LOG = logging.getLogger('MooseDocs.extensions.bibtex')
 
+#: Location of the parsed BibTeX databases, see BibtexExtension.init
+CACHE_DIR = os.path.join(os.path.expanduser('~'), '.local', 'share', 'moose', 'cache', 'bibtex')
+
+#: Change this if the stored data changes
+CACHE_VERSION = 2
+
 def make_extension(**kwargs):
     return BibtexExtension(**kwargs)
 
@@ -30,6 +39,8 @@ class BibtexExtension(command.CommandExtension):
     def defaultConfig():
         config = command.CommandExtension.defaultConfig()
         config['duplicate_warning'] = (True, "Show a warning when duplicate entries detected.")
+        config['cache'] = (True, "Store the parsed BibTeX database, the files are only parsed " \
+                                 "when the content of a BibTeX file changes.")
         return config
 
     def __init__(self, *args, **kwargs):
@@ -39,6 +50,14 @@ class BibtexExtension(command.CommandExtension):
         self.__citations = set()
 
     def init(self, translator):
+        """
+        Create the database from the BibTeX files within the content.
+
+        Parsing BibTeX files is slow, so the database is stored (pickled) in CACHE_DIR with a key
+        computed from the names of the files, the stored database is used if the hash of the content
+        of the files is unchanged. The database is loaded prior to the pages being converted, so the
+        processes that convert the pages share the loaded database.
+        """
         command.CommandExtension.init(self, translator)
 
         bib_files = []
@@ -46,23 +65,79 @@ class BibtexExtension(command.CommandExtension):
             if node.source.endswith('.bib'):
                 bib_files.append(node.source)
 
+        key = hashlib.sha1(repr([os.path.abspath(bfile) for bfile in bib_files]))
+        filename = os.path.join(CACHE_DIR, '{}.pkl'.format(key.hexdigest()))
+
+        sha = hashlib.sha1(repr((CACHE_VERSION, self.get('duplicate_warning'))))
+        for bfile in bib_files:
+            with open(bfile, 'rb') as fid:
+                sha.update(bfile)
+                sha.update(hashlib.sha1(fid.read()).hexdigest())
+        sha = sha.hexdigest()
+
+        data = self.__readCache(filename, sha) if self.get('cache') else None
+        if data is None:
+            data = self.__parse(bib_files)
+            if self.get('cache'):
+                self.__writeCache(filename, sha, data)
+
+        self.__database, warnings = data
+        for msg, args in warnings:
+            LOG.warning(msg, *args)
+
+    def __parse(self, bib_files):
+        """Parse the BibTeX files, returns the database and the warnings to be displayed."""
+        database = BibliographyData()
+        warnings = []
         for bfile in bib_files:
             try:
                 db = parse_file(bfile)
             except UndefinedMacro as e:
                 msg = "The BibTeX file %s has an undefined macro:\n%s"
-                LOG.warning(msg, bfile, e.message)
+                warnings.append((msg, (bfile, e.message)))
+                continue
 
             #TODO: https://bitbucket.org/pybtex-devs/pybtex/issues/93/
             #      databaseadd_entries-method-not-considering
             warn = self.get('duplicate_warning')
             for key in db.entries:
-                if key in self.__database.entries:
+                if key in database.entries:
                     if warn:
                         msg = "The BibTeX entry '%s' defined in %s already exists."
-                        LOG.warning(msg, key, bfile)
+                        warnings.append((msg, (key, bfile)))
                 else:
-                    self.__database.add_entry(key, db.entries[key])
+                    database.add_entry(key, db.entries[key])
+
+        return database, warnings
+
+    @staticmethod
+    def __readCache(filename, sha):
+        """
+        Load the parsed database, None is returned if the file does not exist, is invalid, or was
+        stored for different content (sha).
+        """
+        if os.path.isfile(filename):
+            try:
+                with open(filename, 'rb') as fid:
+                    stored, data = cPickle.load(fid)
+                if stored == sha:
+                    return data
+            except Exception: #pylint: disable=broad-except
+                LOG.warning("Failed to load the BibTeX cache: %s", filename)
+        return None
+
+    @staticmethod
+    def __writeCache(filename, sha, data):
+        """Store the parsed database, a temporary file is used to avoid partially written files."""
+        try:
+            if not os.path.isdir(CACHE_DIR):
+                os.makedirs(CACHE_DIR)
+            fid, tmp = tempfile.mkstemp(dir=CACHE_DIR)
+            with os.fdopen(fid, 'wb') as fid:
+                cPickle.dump((sha, data), fid, cPickle.HIGHEST_PROTOCOL)
+            os.rename(tmp, filename)
+        except (IOError, OSError, cPickle.PicklingError):
+            LOG.warning("Failed to write the BibTeX cache: %s", filename)
 
     @property
     def database(self):
@@ -117,6 +192,9 @@ class BibtexCommand(command.CommandComponent):
         return parent
 
 class RenderBibtexCite(components.RenderComponent):
+    def __init__(self, *args, **kwargs):
+        components.RenderComponent.__init__(self, *args, **kwargs)
+        self.__authors = dict() # key: (entry, author text), the text is computed once per key
 
     def createHTML(self, token, parent):
 
@@ -135,34 +213,10 @@ class RenderBibtexCite(components.RenderComponent):
                 raise exceptions.RenderException(msg, key)
 
             entry = self.extension.database.entries[key]
-            author_found = True
-            if not 'author' in entry.persons.keys() and not 'Author' in entry.persons.keys():
-                author_found = False
-                entities = ['institution', 'organization']
-                for entity in entities:
-                    if entity in entry.fields.keys():
-                        author_found = True
-                        name = ''
-                        for word in entry.fields[entity]:
-                            if word[0].isupper():
-                                name += word[0]
-                        entry.persons['author'] = [Person(name)]
-
-            if not author_found:
-                msg = 'No author, institution, or organization for {}'
-                raise exceptions.RenderException(msg, key)
-
-            a = entry.persons['author']
-            n = len(a)
-            if n > 2:
-                author = '{} et al.'.format(' '.join(a[0].last_names))
-            elif n == 2:
-                a0 = ' '.join(a[0].last_names)
-                a1 = ' '.join(a[1].last_names)
-                author = '{} and {}'.format(a0, a1)
-            else:
-                author = ' '.join(a[0].last_names)
-            author = LatexNodes2Text().latex_to_text(author)
+            cache = self.__authors.get(key, None)
+            if (cache is None) or (cache[0] is not entry): # the database is re-created by init
+                cache = self.__authors[key] = (entry, self.__author(key, entry))
+            author = cache[1]
 
             form = u'{}, {}' if citep else u'{} ({})'
             html.Tag(parent, 'a', href='#{}'.format(key),
@@ -187,6 +241,38 @@ class RenderBibtexCite(components.RenderComponent):
     def createMaterialize(self, token, parent):
         self.createHTML(token, parent)
 
+    @staticmethod
+    def __author(key, entry):
+        """Return the author text for the citation of the supplied entry."""
+        author_found = True
+        if not 'author' in entry.persons.keys() and not 'Author' in entry.persons.keys():
+            author_found = False
+            entities = ['institution', 'organization']
+            for entity in entities:
+                if entity in entry.fields.keys():
+                    author_found = True
+                    name = ''
+                    for word in entry.fields[entity]:
+                        if word[0].isupper():
+                            name += word[0]
+                    entry.persons['author'] = [Person(name)]
+
+        if not author_found:
+            msg = 'No author, institution, or organization for {}'
+            raise exceptions.RenderException(msg, key)
+
+        a = entry.persons['author']
+        n = len(a)
+        if n > 2:
+            author = '{} et al.'.format(' '.join(a[0].last_names))
+        elif n == 2:
+            a0 = ' '.join(a[0].last_names)
+            a1 = ' '.join(a[1].last_names)
+            author = '{} and {}'.format(a0, a1)
+        else:
+            author = ' '.join(a[0].last_names)
+        return LatexNodes2Text().latex_to_text(author)
+
 class RenderBibtexBibliography(components.RenderComponent):
     def createHTML(self, token, parent):
 
@@ -222,7 +308,7 @@ class RenderBibtexBibliography(components.RenderComponent):
             db.add_entry(key, self.extension.database.entries[key])
             btex = db.to_string("bibtex")
 
-            m_id = uuid.uuid4()
+            m_id = self.translator.uniqueID(u'bibtex')
             html.Tag(child, 'a',
                      style="padding-left:10px;",
                      class_='modal-trigger moose-bibtex-modal',
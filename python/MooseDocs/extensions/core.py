@@ -2,7 +2,6 @@
 Defines the "core" extension for translating MooseDocs markdown to HTML and LaTeX.
 """
 import re
-import uuid
 import logging
 
 import anytree
@@ -578,7 +577,7 @@ class RenderError(components.RenderComponent):
 
     def createMaterialize(self, token, parent): #pylint: disable=no-self-use
 
-        id_ = uuid.uuid4()
+        id_ = self.translator.uniqueID(u'error')
         a = html.Tag(parent, 'a', class_="moose-exception modal-trigger", href='#{}'.format(id_))
         html.String(a, content=token.info[0])
 
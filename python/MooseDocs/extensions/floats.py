@@ -1,5 +1,4 @@
 #pylint: disable=missing-docstring
-import uuid
 
 import MooseDocs
 from MooseDocs.base import components
@@ -111,7 +110,7 @@ class RenderModalLink(core.RenderLink):
     def createMaterialize(self, token, parent):
         link = core.RenderLink.createMaterialize(self, token, parent)
 
-        tag = uuid.uuid4()
+        tag = self.translator.uniqueID(u'modal')
         link.addClass('modal-trigger')
         link['href'] = u'#{}'.format(tag)
 
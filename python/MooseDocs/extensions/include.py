@@ -33,19 +33,15 @@ class IncludeCommand(command.CommandComponent):
 
     def createToken(self, info, parent):
         """
-        NOTICE:
-        Ideally, this method would create a connection between the two pages so that when you
-        update the included page the livereload would run the including page. This doesn't work
-        because of the multiprocessing, which would be making a connection between object that
-        are on copies working on other processes from those that the livereload is watching.
-
-        TODO: A possible fix would be to just hack in a regex for !include into the livereload
-              watcher object itself, just need to implement it.
+        The included page is added as a dependency of the current page, the dependencies are
+        returned from the build processes (see Translator.execute) so that the livereload watcher
+        rebuilds the current page when the included page changes.
         """
 
         master_page = self.translator.current
         include_page = master_page.findall(info['subcommand'], exc=exceptions.TokenizeException)[0]
 
+        master_page.addDependency(include_page.source)
         content = common.read(include_page.source) #TODO: copy existing tokens when not using re
         if self.settings['re']:
             content = common.regex(self.settings['re'], content, eval(self.settings['re-flags']))
@@ -1,6 +1,5 @@
 #pylint: disable=missing-docstring
 import re
-import uuid
 
 from MooseDocs.base import components
 from MooseDocs.common import exceptions
@@ -59,7 +58,7 @@ class KatexBlockEquationComponent(components.TokenComponent):
         tex = r'{}'.format(info['equation']).strip('\n').replace('\n', ' ').encode('string-escape')
 
         # Define a unique equation ID for use by KaTeX
-        eq_id = 'moose-equation-{}'.format(uuid.uuid4())
+        eq_id = 'moose-equation-{}'.format(self.translator.uniqueID(u'equation'))
 
         # Build the token
         is_numbered = not info['cmd'].endswith('*')
@@ -92,7 +91,7 @@ class KatexInlineEquationComponent(components.TokenComponent):
         tex = r'{}'.format(info['equation']).strip('\n').replace('\n', ' ').encode('string-escape')
 
         # Define a unique equation ID for use by KaTeX
-        eq_id = 'moose-equation-{}'.format(uuid.uuid4())
+        eq_id = 'moose-equation-{}'.format(self.translator.uniqueID(u'equation'))
 
         # Create token
         LatexInlineEquation(parent, tex=tex, id_=eq_id)
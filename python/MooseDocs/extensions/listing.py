@@ -10,6 +10,10 @@ from MooseDocs.common import exceptions
 from MooseDocs.extensions import command, floats
 from MooseDocs.tree import tokens
 
+#: Storage for the regions extracted from files, by filename and settings with the modification
+#: time of the file (for the life of the process), see FileListingCommand.extractContent
+_REGIONS = dict()
+
 def make_extension(**kwargs):
     return ListingExtension(**kwargs)
 
@@ -74,6 +78,9 @@ class FileListingCommand(LocalListingCommand):
     COMMAND = 'listing'
     SUBCOMMAND = '*'
 
+    #: Settings that define the region extracted from the file, see extractRegion
+    EXTRACT_SETTINGS = ('re', 're-flags', 'line', 'start', 'end', 'include-start', 'include-end')
+
     @staticmethod
     def defaultSettings():
         settings = LocalListingCommand.defaultSettings()
@@ -110,6 +117,8 @@ class FileListingCommand(LocalListingCommand):
 
         # Locate filename
         filename = common.check_filenames(info['subcommand'])
+        if self.translator.current is not None:
+            self.translator.current.addDependency(filename)
 
         # Listing container
         flt = floats.Float(parent)
@@ -125,7 +134,7 @@ class FileListingCommand(LocalListingCommand):
         # Add bottom modal
         if self.settings['link']:
             rel_filename = os.path.relpath(filename, MooseDocs.ROOT_DIR)
-            code = tokens.Code(None, language=lang, code=common.read(filename))
+            code = tokens.Code(None, language=lang, code=common.read(filename, cache=True))
             floats.ModalLink(flt, url=unicode(rel_filename), bottom=True, content=code,
                              string=u'({})'.format(rel_filename),
                              title=tokens.String(None, content=unicode(filename)))
@@ -137,12 +146,29 @@ class FileListingCommand(LocalListingCommand):
         """
         Extract the desired content from the supplied raw text from a file.
 
+        The file content and the extracted region are stored for the life of the process, so
+        repeated listings of the same file do not require reading or searching the file again.
+
         Inputs:
             filename[unicode]: The file to read (known to exist already).
             settings[dict]: The setting from the createToken method.
         """
+        content = common.read(filename, cache=True)
+        mtime = os.path.getmtime(filename)
+        key = (filename,) + tuple(settings[k] for k in FileListingCommand.EXTRACT_SETTINGS)
+        region = _REGIONS.get(key, None)
+        if (region is None) or (region[0] != mtime):
+            region = _REGIONS[key] = (mtime, self.extractRegion(content, settings))
+        return self.prepareContent(region[1], settings)
+
+    def extractRegion(self, content, settings):
+        """
+        Extract the region of the file content defined by the settings (see EXTRACT_SETTINGS).
 
-        content = common.read(filename)
+        Inputs:
+            content[unicode]: The complete file content.
+            settings[dict]: The setting from the createToken method.
+        """
         if settings['re']:
             content = common.regex(self.settings['re'], content, eval(self.settings['re-flags']))
 
@@ -156,7 +182,7 @@ class FileListingCommand(LocalListingCommand):
                                             settings['include-start'],
                                             settings['include-end'])
 
-        return self.prepareContent(content, settings)
+        return content
 
     def prepareContent(self, content, settings): #pylint: disable=no-self-use
         """
@@ -270,11 +296,17 @@ class InputListingCommand(FileListingCommand):
 
     @staticmethod
     def extractInputBlocks(filename, blocks):
+        """
+        Return the content of the input file blocks.
 
-        hit = mooseutils.hit_load(filename)
+        The blocks are located with a "fuzzy" search, the first block (in pre-order) with a
+        complete path that contains the supplied name is used (see mooseutils.HitNode.find). The
+        parsed file is stored until the file is modified (see mooseutils.hit_load).
+        """
+        root = mooseutils.hit_load(filename, cache=True)
         out = []
         for block in blocks.split(' '):
-            node = hit.find(block)
+            node = root.find(block)
             if node is None:
                 msg = "Unable to find block '{}' in {}."
                 raise exceptions.TokenizeException(msg, block, filename)
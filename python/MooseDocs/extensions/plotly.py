@@ -1,7 +1,6 @@
 #pylint: disable=missing-docstring
 import os
 import re
-import uuid
 import mooseutils
 
 from MooseDocs import common
@@ -118,7 +117,7 @@ class RenderScatter(components.RenderComponent):
 
     TEMPLATE = PlotlyTemplate('scatter.js')
     def createHTML(self, token, parent):
-        plot_id = unicode(uuid.uuid4())
+        plot_id = unicode(self.translator.uniqueID(u'plotly'))
         content = self.TEMPLATE(id_=plot_id, data=repr(token.data), layout=repr(token.layout))
         html.Tag(parent, 'div', id_=plot_id)
         html.Tag(parent, 'script', string=content)
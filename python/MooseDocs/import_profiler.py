@@ -0,0 +1,78 @@
+#pylint: disable=missing-docstring
+#* This file is part of the MOOSE framework
+#* https://www.mooseframework.org
+#*
+#* All rights reserved, see COPYRIGHT for full restrictions
+#* https://github.com/idaholab/moose/blob/master/COPYRIGHT
+#*
+#* Licensed under LGPL 2.1, please see LICENSE for details
+#* https://www.gnu.org/licenses/lgpl-2.1.html
+#pylint: enable=missing-docstring
+"""
+Tool for reporting the time spent importing modules, similar to 'python -X importtime' (which is
+not available for python 2). It is enabled with the --profile-imports command-line option (see
+MooseDocs/__init__.py and main.py), so it must only use the standard library.
+"""
+import sys
+import time
+import atexit
+import __builtin__
+
+#: The default __import__ function
+_IMPORT = __builtin__.__import__
+
+#: Completed imports: (depth, name, self time, cumulative time)
+_RECORDS = []
+
+#: Stack of the imports currently being executed: [name, start time, time of nested imports]
+_STACK = []
+
+def start(threshold=0.001):
+    """
+    Begin recording the import times, the report is printed to sys.stderr at exit.
+
+    Inputs:
+        threshold[float]: Imports with a cumulative time less than this value (in seconds) are
+                          not included in the report.
+    """
+    if __builtin__.__import__ is not _IMPORT:
+        return
+    __builtin__.__import__ = _profile_import
+    atexit.register(lambda: sys.stderr.write(report(threshold)))
+
+def stop():
+    """Stop recording the import times."""
+    __builtin__.__import__ = _IMPORT
+
+def report(threshold=0.001):
+    """
+    Return the report of the imports that loaded new modules, in the order the imports completed.
+
+    Inputs:
+        threshold[float]: Imports with a cumulative time less than this value (in seconds) are
+                          not included in the report.
+    """
+    out = ['import time: self [us] | cumulative | imported package']
+    for depth, name, self_time, cumulative in _RECORDS:
+        if cumulative >= threshold:
+            out.append('import time: {:>9.0f} | {:>10.0f} | {}{}'.format(self_time * 1e6,
+                                                                          cumulative * 1e6,
+                                                                          ' ' * (2 * depth), name))
+    total = sum(r[3] for r in _RECORDS if r[0] == 0)
+    out.append('import time: {:>9} | {:>10.0f} | total'.format('', total * 1e6))
+    return '\n'.join(out) + '\n'
+
+def _profile_import(name, globals=None, locals=None, fromlist=None, level=-1):
+    """Replacement for __import__ that records the time of imports that load new modules."""
+    #pylint: disable=redefined-builtin
+    count = len(sys.modules)
+    _STACK.append([name or '.' + ', '.join(fromlist or []), time.time(), 0])
+    try:
+        return _IMPORT(name, globals, locals, fromlist, level)
+    finally:
+        name, t, nested = _STACK.pop()
+        t = time.time() - t
+        if len(sys.modules) != count:
+            _RECORDS.append((len(_STACK), name, t - nested, t))
+            if _STACK:
+                _STACK[-1][2] += t
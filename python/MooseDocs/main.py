@@ -34,6 +34,9 @@ def command_line_options():
                         choices=levels,
                         default='INFO',
                         help="Set the python logging level (default: %(default)s).")
+    parent.add_argument('--profile-imports', action='store_true',
+                        help="Report the time spent importing python modules, this is useful for "
+                             "locating modules that slow down the startup.")
 
     build.command_line_options(subparser, parent)
     devel.command_line_options(subparser, parent)
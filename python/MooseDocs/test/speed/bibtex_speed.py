@@ -0,0 +1,82 @@
+#!/usr/bin/env python2
+#pylint: disable=missing-docstring
+#* This file is part of the MOOSE framework
+#* https://www.mooseframework.org
+#*
+#* All rights reserved, see COPYRIGHT for full restrictions
+#* https://github.com/idaholab/moose/blob/master/COPYRIGHT
+#*
+#* Licensed under LGPL 2.1, please see LICENSE for details
+#* https://www.gnu.org/licenses/lgpl-2.1.html
+"""
+Benchmark for creating the BibTeX database, comparing the parsing of the BibTeX files with
+loading the cached database (see MooseDocs/extensions/bibtex.py).
+
+By default all of the BibTeX files within the MOOSE repository are used.
+
+    ./bibtex_speed.py
+    ./bibtex_speed.py --directory ~/projects/moose/modules --repeat 10
+"""
+import os
+import sys
+import time
+import shutil
+import tempfile
+import argparse
+
+import mooseutils
+
+import MooseDocs
+from MooseDocs.extensions import core, command, bibtex
+from MooseDocs.tree import page
+from MooseDocs.base import MarkdownReader, HTMLRenderer, Translator
+
+def command_line_options():
+    parser = argparse.ArgumentParser(description="Benchmark for the BibTeX database creation.")
+    parser.add_argument('--directory', default=MooseDocs.MOOSE_DIR,
+                        help="The git repository directory containing the BibTeX files.")
+    parser.add_argument('--repeat', type=int, default=5, help="The number of repetitions.")
+    return parser.parse_args()
+
+def create_translator(bib_files, cache):
+    """Create a Translator with a content tree containing the supplied BibTeX files."""
+    root = page.DirectoryNode(None, source='')
+    for bfile in bib_files:
+        page.FileNode(root, source=bfile)
+    config = {'MooseDocs.extensions.bibtex':dict(cache=cache, duplicate_warning=False)}
+    extensions = MooseDocs.common.load_extensions([core, command, bibtex], config)
+    return Translator(root, MarkdownReader(), HTMLRenderer(), extensions)
+
+def benchmark(bib_files, cache, repeat):
+    """Return the best time for creating the database and the number of entries."""
+    times = []
+    for _ in range(repeat):
+        translator = create_translator(bib_files, cache)
+        start = time.time()
+        translator.init()
+        times.append(time.time() - start)
+    ext = [e for e in translator.extensions if isinstance(e, bibtex.BibtexExtension)][0]
+    return min(times), len(ext.database.entries)
+
+def main():
+    opt = command_line_options()
+
+    bib_files = [f for f in mooseutils.git_ls_files(opt.directory) if f.endswith('.bib')]
+    bibtex.CACHE_DIR = tempfile.mkdtemp()
+    try:
+        parse, count = benchmark(bib_files, False, opt.repeat)
+        benchmark(bib_files, True, 1) # create the cache
+        load, _ = benchmark(bib_files, True, opt.repeat)
+        size = sum(os.path.getsize(os.path.join(bibtex.CACHE_DIR, f)) \
+                   for f in os.listdir(bibtex.CACHE_DIR))
+    finally:
+        shutil.rmtree(bibtex.CACHE_DIR)
+
+    print '{} BibTeX files, {} entries (best of {})'.format(len(bib_files), count, opt.repeat)
+    print '  {:>10}: {:.4f} sec.'.format('parse', parse)
+    print '  {:>10}: {:.4f} sec. ({:.1f} KB)'.format('cache', load, size / 1024.)
+    print '  {:>10}: {:.1f}x'.format('speedup', parse / load)
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,134 @@
+#!/usr/bin/env python2
+#pylint: disable=missing-docstring
+#* This file is part of the MOOSE framework
+#* https://www.mooseframework.org
+#*
+#* All rights reserved, see COPYRIGHT for full restrictions
+#* https://github.com/idaholab/moose/blob/master/COPYRIGHT
+#*
+#* Licensed under LGPL 2.1, please see LICENSE for details
+#* https://www.gnu.org/licenses/lgpl-2.1.html
+"""
+Time and memory benchmark for the MooseDocs AST (tokens) and HTML trees.
+
+By default a synthetic page that mimics the large auto-generated syntax listing pages is converted,
+alternatively the largest markdown pages of a configuration may be used via the --config option.
+
+    ./tree_speed.py --objects 5000
+    ./tree_speed.py --config ~/projects/moose/modules/doc/config.yml --pages 5
+"""
+import os
+import sys
+import gc
+import time
+import argparse
+import resource
+
+import anytree
+
+from MooseDocs import common
+from MooseDocs.extensions import core
+from MooseDocs.tree import tokens, page
+from MooseDocs.base import MarkdownReader, HTMLRenderer, Translator
+
+def command_line_options():
+    parser = argparse.ArgumentParser(description="Benchmark for the MooseDocs tree objects.")
+    parser.add_argument('--objects', type=int, default=2000,
+                        help="The number of objects listed on the synthetic page.")
+    parser.add_argument('--config', default=None,
+                        help="Benchmark the largest pages of the supplied configuration file.")
+    parser.add_argument('--pages', type=int, default=3,
+                        help="The number of pages to benchmark when --config is supplied.")
+    parser.add_argument('--repeat', type=int, default=3, help="The number of repetitions.")
+    return parser.parse_args()
+
+def syntax_page(n):
+    """Create markdown content that is similar to a syntax listing page."""
+    out = [u'# Syntax\n']
+    for i in range(n):
+        if i % 50 == 0:
+            out.append(u'## System{}\n'.format(i))
+        out.append(u'- [Object{0}](object{0}.md) Description of *object* number {0}, this '
+                   u'is some **text** with `code`.\n'.format(i))
+    return u''.join(out)
+
+def node_bytes(node):
+    """Return the approximate number of bytes used by a node, excluding the children."""
+    size = sys.getsizeof(node)
+    values = []
+    if hasattr(node, '__dict__'):
+        size += sys.getsizeof(node.__dict__)
+        values += node.__dict__.values()
+    for name in getattr(type(node), '_NodeBase__slotnames', tuple()):
+        values.append(getattr(node, name, None))
+    for value in values:
+        if isinstance(value, (dict, list)):
+            size += sys.getsizeof(value)
+    return size
+
+def tree_info(root):
+    count = 0
+    size = 0
+    for node in anytree.PreOrderIter(root):
+        count += 1
+        size += node_bytes(node)
+    return count, size
+
+def benchmark(translator, content, repeat):
+    """Tokenize, render, and write the content returning the timing and size information."""
+    times = dict(tokenize=[], render=[], write=[])
+    for _ in range(repeat):
+        gc.collect()
+        start = time.time()
+        ast = tokens.Token(None)
+        translator.reader.parse(ast, content)
+        times['tokenize'].append(time.time() - start)
+
+        start = time.time()
+        result = translator.renderer.render(ast)
+        times['render'].append(time.time() - start)
+
+        start = time.time()
+        result.write()
+        times['write'].append(time.time() - start)
+
+    ast_info = tree_info(ast)
+    html_info = tree_info(result)
+    return times, ast_info, html_info
+
+def report(title, times, ast_info, html_info):
+    print title
+    for key in ('tokenize', 'render', 'write'):
+        print '  {:>10}: {:.4f} sec. (best of {})'.format(key, min(times[key]), len(times[key]))
+    for key, (count, size) in (('AST', ast_info), ('HTML', html_info)):
+        print '  {:>10}: {} nodes, {:.1f} bytes/node'.format(key, count, size / float(count))
+
+def main():
+    opt = command_line_options()
+
+    if opt.config is None:
+        translator = Translator(page.PageNodeBase(None), MarkdownReader(), HTMLRenderer(),
+                                common.load_extensions([core]))
+        translator.init()
+        content = syntax_page(opt.objects)
+        report('Synthetic syntax page ({} objects)'.format(opt.objects),
+               *benchmark(translator, content, opt.repeat))
+
+    else:
+        translator, _ = common.load_config(opt.config)
+        translator.init()
+        func = lambda n: isinstance(n, page.MarkdownNode)
+        nodes = [n for n in anytree.PreOrderIter(translator.root, filter_=func)]
+        nodes.sort(key=lambda n: os.path.getsize(n.source), reverse=True)
+        for node in nodes[:opt.pages]:
+            translator.current = node
+            translator.reinit()
+            report(node.local, *benchmark(translator, node.content, opt.repeat))
+            translator.current = None
+
+    usage = resource.getrusage(resource.RUSAGE_SELF)
+    print 'Peak memory: {:.1f} MB'.format(usage.ru_maxrss / 1024.)
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -9,9 +9,7 @@
 #* https://www.gnu.org/licenses/lgpl-2.1.html
 #pylint: enable=missing-docstring
 import sys
-import collections
 import logging
-import json
 
 import anytree
 
@@ -36,17 +34,15 @@ def app_syntax(exe, remove=None, allow_test_objects=False, hide=None, alias=None
     common.check_type('allow_test_objects', allow_test_objects, bool)
 
     try:
-        raw = mooseutils.runExe(exe, ['--json', '--allow-test-objects'])
-        raw = raw.split('**START JSON DATA**\n')[1]
-        raw = raw.split('**END JSON DATA**')[0]
-        tree = json.loads(raw, object_pairs_hook=collections.OrderedDict)
+        tree = mooseutils.syntax_dump(exe, ['--allow-test-objects'])
 
     except Exception as e: #pylint: disable=broad-except
         LOG.error("Failed to execute the MOOSE executable '%s':\n%s", exe, e.message)
         sys.exit(1)
 
+    # The JSON dump is not ordered, the keys are sorted to match the order of the '--json' output
     root = SyntaxNode(None, '')
-    for key, value in tree['blocks'].iteritems():
+    for key, value in sorted(tree['blocks'].iteritems()):
         node = SyntaxNode(root, key)
         __syntax_tree_helper(node, value)
 
@@ -111,7 +107,7 @@ def __syntax_tree_helper(parent, item):
         return
 
     if 'actions' in item:
-        for key, action in item['actions'].iteritems():
+        for key, action in sorted(item['actions'].iteritems()):
             if ('parameters' in action) and action['parameters'] and \
             ('isObjectAction' in action['parameters']):
                 MooseObjectActionNode(parent, key, action)
@@ -122,14 +118,14 @@ def __syntax_tree_helper(parent, item):
         __syntax_tree_helper(parent, item['star'])
 
     if ('types' in item) and item['types']:
-        for key, obj in item['types'].iteritems():
+        for key, obj in sorted(item['types'].iteritems()):
             __add_moose_object_helper(parent, key, obj)
 
     if ('subblocks' in item) and item['subblocks']:
-        for k, v in item['subblocks'].iteritems():
+        for k, v in sorted(item['subblocks'].iteritems()):
             node = SyntaxNode(parent, k)
             __syntax_tree_helper(node, v)
 
     if ('subblock_types' in item) and item['subblock_types']:
-        for k, v in item['subblock_types'].iteritems():
+        for k, v in sorted(item['subblock_types'].iteritems()):
             __add_moose_object_helper(parent, k, v)
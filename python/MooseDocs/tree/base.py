@@ -73,9 +73,57 @@ class Property(object):
 
     def __get__(self, instance, key):
         """Get the property value."""
-        return instance._NodeBase__properties.get(self.name, self.default) #pylint: disable=protected-access
+        if instance is None:
+            return self
+        return instance._NodeBase__properties[self.name] #pylint: disable=protected-access
 
-class NodeBase(anytree.NodeMixin):
+class NodeMeta(type):
+    """
+    Metaclass for NodeBase that builds the property table once per class.
+
+    The PROPERTIES from all classes in the inheritance chain are collected when the class is
+    created (the most derived definition wins), the Property descriptors are attached to the class,
+    and the default values and required names are stored for use by the NodeBase constructor.
+    Errors in the PROPERTIES definition are stored and reported when an instance is created.
+
+    The names of all __slots__ in the inheritance chain are also collected to support pickling.
+    """
+    def __init__(cls, name, bases, attrs):
+        super(NodeMeta, cls).__init__(name, bases, attrs)
+
+        error = None
+        properties = dict()
+        for c in reversed(inspect.getmro(cls)):
+            props = c.__dict__.get('PROPERTIES', [])
+            if not isinstance(props, list):
+                error = ("The class attribute 'PROPERTIES' must be a list.",)
+                continue
+            for prop in props:
+                if not isinstance(prop, Property):
+                    msg = "The supplied property must be a Property object, but {} provided."
+                    error = (msg, type(prop).__name__)
+                    continue
+                properties[prop.name] = prop
+
+        for prop in properties.itervalues():
+            setattr(cls, prop.name, prop)
+
+        slots = []
+        for c in inspect.getmro(cls):
+            names = c.__dict__.get('__slots__', ())
+            for slot in [names] if isinstance(names, basestring) else names:
+                if slot in ('__dict__', '__weakref__'):
+                    continue
+                if slot.startswith('__') and not slot.endswith('__'):
+                    slot = '_{}{}'.format(c.__name__.lstrip('_'), slot)
+                slots.append(slot)
+
+        cls._NodeBase__error = error
+        cls._NodeBase__defaults = dict((k, p.default) for k, p in properties.iteritems())
+        cls._NodeBase__required = tuple(k for k, p in properties.iteritems() if p.required)
+        cls._NodeBase__slotnames = tuple(slots)
+
+class NodeBase(object):
     """
     Base class for tree nodes that accepts defined properties and arbitrary attributes.
 
@@ -98,42 +146,37 @@ class NodeBase(anytree.NodeMixin):
         node['class'] = 'not fancy'
 
 
+    The tree structure (parent, children, root, path, etc.) follows the anytree.NodeMixin interface,
+    so the anytree iterators and rendering tools may be used, but the nodes use __slots__ and a
+    list for storing the children to limit the per-node overhead. Derived classes that do not
+    require arbitrary instance attributes should define an empty __slots__.
+
     Inputs:
         parent[NodeBase]: (Optional) Set the parent node of the node being created, if not
                           supplied the resulting node will be the root node.
         kwargs: (Optional) Any key, value pairs supplied are stored as properties or attributes.
     """
+    __metaclass__ = NodeMeta
+    __slots__ = ('name', '__parent', '__children', '__properties', '__attributes')
+
     COLOR = 'RESET'
     PROPERTIES = []
 
     def __init__(self, parent=None, name=None, **kwargs):
-        anytree.NodeMixin.__init__(self)
-
-        # Create a set of unique properties from all classes in the inheritance chain
-        properties = set()
-        for cls in inspect.getmro(type(self)):
-            properties.update(getattr(cls, 'PROPERTIES', []))
 
-        # anytree.NodeMixin properties
-        self.parent = parent
-        self.name = name if name is not None else self.__class__.__name__
+        # Errors in the PROPERTIES definition, see NodeMeta
+        if self.__error is not None:
+            raise exceptions.MooseDocsException(*self.__error)
 
         # NodeBase content
-        self.__properties = dict() # storage for property values
+        self.__parent = None
+        self.__children = list()
+        self.__properties = dict(self.__defaults) # storage for property values
         self.__attributes = dict() # storage for attributes (i.e., unknown key, values)
 
-        # Check PROPERTIES type
-        if not isinstance(self.PROPERTIES, list):
-            raise exceptions.MooseDocsException("The class attribute 'PROPERTIES' must be a list.")
-
-        # Apply the default values
-        for prop in properties:
-            if not isinstance(prop, Property):
-                msg = "The supplied property must be a Property object, but {} provided."
-                raise exceptions.MooseDocsException(msg, type(prop).__name__)
-
-            setattr(self.__class__, prop.name, prop)
-            self.__properties[prop.name] = prop.default
+        # Tree properties
+        self.parent = parent
+        self.name = name if name is not None else self.__class__.__name__
 
         # Update the properties from the key value pairs
         for key, value in kwargs.iteritems():
@@ -145,9 +188,128 @@ class NodeBase(anytree.NodeMixin):
                 self.__attributes[key.strip('_')] = value
 
         # Check required
-        for prop in properties:
-            if prop.required and self.__properties[prop.name] is None:
-                raise exceptions.MooseDocsException("The property '{}' is required.", prop.name)
+        for key in self.__required:
+            if self.__properties[key] is None:
+                raise exceptions.MooseDocsException("The property '{}' is required.", key)
+
+    @property
+    def parent(self):
+        """Return the parent node, None is returned for the root node."""
+        return self.__parent
+
+    @parent.setter
+    def parent(self, value):
+        """Set the parent node, the node is removed from the children of the current parent."""
+        if (value is not None) and (not isinstance(value, NodeBase)):
+            msg = "The supplied parent must be a NodeBase object, but '{}' was provided."
+            raise exceptions.MooseDocsException(msg, type(value).__name__)
+
+        old = self.__parent
+        if old is value:
+            return
+
+        node = value
+        while node is not None:
+            if node is self:
+                raise exceptions.MooseDocsException("Setting the parent of '{}' creates a loop.",
+                                                    self.name)
+            node = node.__parent
+
+        if old is not None:
+            siblings = old.__children
+            for i, child in enumerate(siblings):
+                if child is self:
+                    del siblings[i]
+                    break
+
+        self.__parent = value
+        if value is not None:
+            value.__children.append(self)
+
+    @property
+    def children(self):
+        """Return a tuple of the child nodes."""
+        return tuple(self.__children)
+
+    @children.setter
+    def children(self, value):
+        """Replace the child nodes."""
+        value = tuple(value)
+        for child in self.__children[:]:
+            child.parent = None
+        for child in value:
+            child.parent = self
+
+    @property
+    def root(self):
+        """Return the root node of the tree."""
+        node = self
+        while node.__parent is not None:
+            node = node.__parent
+        return node
+
+    @property
+    def path(self):
+        """Return a tuple of nodes from the root to this node."""
+        out = [self]
+        node = self.__parent
+        while node is not None:
+            out.append(node)
+            node = node.__parent
+        return tuple(reversed(out))
+
+    @property
+    def ancestors(self):
+        """Return a tuple of nodes from the root to the parent of this node."""
+        return self.path[:-1]
+
+    @property
+    def descendants(self):
+        """Return a tuple of all nodes below this node."""
+        return tuple(anytree.PreOrderIter(self))[1:]
+
+    @property
+    def siblings(self):
+        """Return a tuple of the other children of the parent node."""
+        if self.__parent is None:
+            return tuple()
+        return tuple(node for node in self.__parent.__children if node is not self)
+
+    @property
+    def is_root(self):
+        """Return True if the node does not have a parent."""
+        return self.__parent is None
+
+    @property
+    def is_leaf(self):
+        """Return True if the node does not have children."""
+        return not self.__children
+
+    @property
+    def depth(self):
+        """Return the number of nodes between this node and the root."""
+        count = 0
+        node = self.__parent
+        while node is not None:
+            count += 1
+            node = node.__parent
+        return count
+
+    def __getstate__(self):
+        """Return the slot and instance dictionary values for pickling."""
+        slots = dict()
+        for key in self.__slotnames:
+            if hasattr(self, key):
+                slots[key] = getattr(self, key)
+        return getattr(self, '__dict__', None), slots
+
+    def __setstate__(self, state):
+        """Restore the slot and instance dictionary values when unpickling."""
+        attributes, slots = state
+        if attributes:
+            self.__dict__.update(attributes)
+        for key, value in slots.iteritems():
+            setattr(self, key, value)
 
     def console(self):
         """
@@ -178,17 +340,17 @@ class NodeBase(anytree.NodeMixin):
             index[int]: The numeric index of the child object to return, this is the same
                         as doing self.children[index].
         """
-        if len(self.children) <= index:
+        if len(self.__children) <= index:
             LOG.error('A child node with index %d does not exist, there are %d children.',
-                      index, len(self.children))
+                      index, len(self.__children))
             return None
-        return self.children[index]
+        return self.__children[index]
 
     def __iter__(self):
         """
         Allows for iterator access over the child nodes.
         """
-        for child in self.children:
+        for child in tuple(self.__children):
             yield child
 
     def __getitem__(self, key):
@@ -211,7 +373,7 @@ class NodeBase(anytree.NodeMixin):
 
     def __len__(self):
         """Return the number of children."""
-        return len(self.children)
+        return len(self.__children)
 
     def __nonzero__(self):
         """
@@ -243,10 +405,22 @@ class NodeBase(anytree.NodeMixin):
         """
         Abstract method for outputting content of node to a string.
         """
-        out = ''
-        for child in self.children:
-            out += child.write()
-        return out
+        return ''.join(self.iterwrite())
+
+    def iterwrite(self):
+        """
+        Generator for outputting the content of the node in pieces, see write().
+
+        If write() is overridden the complete string from that method is returned, otherwise the
+        content of the children is generated. Nodes that support incremental output (e.g.,
+        html.Tag) should override this method.
+        """
+        if type(self).write.im_func is not NodeBase.write.im_func:
+            yield self.write()
+        else:
+            for child in self:
+                for item in child.iterwrite():
+                    yield item
 
     def find(self, name, attr=None, maxlevel=None):
         """
@@ -15,6 +15,7 @@ import logging
 import mooseutils
 
 import MooseDocs
+from MooseDocs import common
 from MooseDocs.tree import page
 
 LOG = logging.getLogger(__name__)
@@ -153,7 +154,7 @@ def doc_tree(items):
             root = os.path.join(MooseDocs.ROOT_DIR, root)
 
         # Update the project files
-        MooseDocs.PROJECT_FILES.update(mooseutils.git_ls_files(mooseutils.git_root_dir(root)))
+        common.add_project_directory(root)
 
         files = doc_import(root, content=value.get('content', None))
         for filename in files:
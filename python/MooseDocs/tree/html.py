@@ -16,6 +16,7 @@ class Tag(NodeBase):
     """
     A node representing an HTML tag (e.g., h1, strong).
     """
+    __slots__ = ()
     PROPERTIES = [Property('close', default=True, ptype=bool), Property('string', ptype=unicode)]
 
     def __init__(self, parent, name, **kwargs):
@@ -44,7 +45,31 @@ class Tag(NodeBase):
 
     def write(self):
         """Write the HTML as a string, e.g., <foo>...</foo>."""
-        out = ''
+        return ''.join(self.iterwrite())
+
+    def iterwrite(self):
+        """
+        Generator for writing the HTML in pieces, e.g., '<foo>', ..., '</foo>'.
+
+        The tree is traversed without recursion, so the memory required for writing the content is
+        limited by the size of the tree rather than by the size of the complete HTML string.
+        """
+        stack = [(self, False)]
+        while stack:
+            node, closing = stack.pop()
+            if closing:
+                yield '</{}>'.format(node.name)
+            elif isinstance(node, Tag):
+                yield node.start()
+                if node.close: #pylint: disable=no-member
+                    stack.append((node, True))
+                stack.extend((child, False) for child in reversed(node.children))
+            else:
+                for item in node.iterwrite():
+                    yield item
+
+    def start(self):
+        """Return the opening tag with attributes, e.g., <foo class="bar">."""
         attr_list = []
         for key, value in self.attributes.iteritems():
             if value:# and (key != 'class'):
@@ -52,15 +77,8 @@ class Tag(NodeBase):
 
         attr = ' '.join(attr_list)
         if attr:
-            out += '<{} {}>'.format(self.name, attr)
-        else:
-            out += '<{}>'.format(self.name)
-
-        for child in self.children:
-            out += child.write()
-        if self.close: #pylint: disable=no-member
-            out += '</{}>'.format(self.name)
-        return out
+            return '<{} {}>'.format(self.name, attr)
+        return '<{}>'.format(self.name)
 
     def text(self):
         """
@@ -76,6 +94,7 @@ class String(NodeBase):
     """
     A node for containing string content, the parent must always be a Tag.
     """
+    __slots__ = ()
     PROPERTIES = [Property('content', default=u'', ptype=unicode),
                   Property('escape', default=False, ptype=bool),
                   Property('hide', default=False, ptype=bool)]
@@ -43,6 +43,7 @@ class Enclosure(NodeBase):
     """
     Class for enclosing other nodes in characters, e.g. [], {}.
     """
+    __slots__ = ()
     PROPERTIES = [Property('enclose', ptype=tuple, required=True),
                   Property('string', ptype=unicode)]
 
@@ -65,6 +66,7 @@ class Bracket(Enclosure):
     """
     Square bracket enclosure ([]).
     """
+    __slots__ = ()
     def __init__(self, *args, **kwargs):
         Enclosure.__init__(self, *args, enclose=('[', ']'), **kwargs)
 
@@ -72,6 +74,7 @@ class Brace(Enclosure):
     """
     Curly brace enclosure ({}).
     """
+    __slots__ = ()
     def __init__(self, *args, **kwargs):
         Enclosure.__init__(self, *args, enclose=('{', '}'), **kwargs)
 
@@ -79,6 +82,7 @@ class InlineMath(Enclosure):
     """
     Math enclosure ($$).
     """
+    __slots__ = ()
     def __init__(self, *args, **kwargs):
         Enclosure.__init__(self, *args, enclose=('$', '$'), **kwargs)
 
@@ -88,6 +92,7 @@ class Command(NodeBase):
 
     If children do not exist then the braces are not included (e.g., \foo).
     """
+    __slots__ = ()
     PROPERTIES = [Property('string', ptype=unicode),
                   Property('start', ptype=str, default=''),
                   Property('end', ptype=str, default=''),
@@ -115,6 +120,7 @@ class CustomCommand(NodeBase):
 
     Children should be Bracket or Brace objects to build up the command.
     """
+    __slots__ = ()
     PROPERTIES = [Property('start', ptype=str, default=''),
                   Property('end', ptype=str, default='')]
 
@@ -133,6 +139,7 @@ class Environment(NodeBase):
     """
     Class for LaTeX environment: \\begin{foo}...\\end{foo}
     """
+    __slots__ = ()
     PROPERTIES = [Property('string', ptype=unicode),
                   Property('start', ptype=str, default='\n'),
                   Property('end', ptype=str, default=''),
@@ -158,6 +165,7 @@ class String(NodeBase):
     """
     A node for containing string content, the parent must always be a Tag.
     """
+    __slots__ = ()
     PROPERTIES = [Property('content', default=u'', ptype=unicode),
                   Property('escape', default=True, ptype=bool)]
 
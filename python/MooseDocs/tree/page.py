@@ -10,8 +10,8 @@
 #pylint: enable=missing-docstring
 import os
 import shutil
+import filecmp
 import logging
-import codecs
 import types
 import urlparse
 
@@ -25,6 +25,16 @@ from MooseDocs.tree import base, tokens
 LOG = logging.getLogger(__name__)
 CACHE = dict() # Creates a global cache for faster searching, anytree search is very slow
 
+def reset_cache(root):
+    """
+    Reset the search cache to contain the nodes in the supplied tree, this is needed when nodes
+    are added or removed after searches have been performed (e.g., by the livereload watcher).
+    """
+    CACHE.clear()
+    for node in anytree.PreOrderIter(root):
+        if isinstance(node, LocationNodeBase):
+            CACHE[node.fullpath] = set([node])
+
 class PageNodeBase(base.NodeBase, mixins.TranslatorObject):
     """
     Base class for content tree.
@@ -40,13 +50,22 @@ class PageNodeBase(base.NodeBase, mixins.TranslatorObject):
         base.NodeBase.__init__(self, *args, **kwargs)
 
     def build(self):
-        """Performs a 'build', this is called by Translator."""
-        self.write()
+        """
+        Performs a 'build', this is called by Translator.
+
+        Returns True if a file was written, False if the file was unchanged, and None if the node
+        does not write a file.
+        """
+        return self.write()
 
     def write(self):
         """Write the file to the destination, see LocationNodeBase."""
         pass
 
+    def addDependency(self, filename): #pylint: disable=unused-argument,no-self-use
+        """Add a file that is used to create the page content, see MarkdownNode."""
+        pass
+
 class LocationNodeBase(PageNodeBase):
     """
     Base class for locations (Directories and Files).
@@ -160,9 +179,18 @@ class FileNode(LocationNodeBase):
     COLOR = 'MAGENTA'
 
     def write(self):
+        """
+        Copy the file to the destination, the copy is skipped if the destination is unchanged.
+        """
         LocationNodeBase.write(self)
+        if os.path.isfile(self.destination) and filecmp.cmp(self.source, self.destination):
+            return False
+
+        # The modification time is copied so that unchanged files are located by filecmp.cmp
+        # without reading the content
         LOG.debug('COPY: %s-->%s', self.source, self.destination)
-        shutil.copyfile(self.source, self.destination)
+        shutil.copy2(self.source, self.destination)
+        return True
 
 class MarkdownNode(FileNode):
     """
@@ -187,6 +215,8 @@ class MarkdownNode(FileNode):
         self._ast = None
         self._result = None
         self._index = None
+        self._dependencies = dict()
+        self._bookmarks = None # first heading and tokens with an 'id', see findBookmark
 
     @property
     def destination(self):
@@ -209,6 +239,21 @@ class MarkdownNode(FileNode):
         """Return the index."""
         return self._index
 
+    @property
+    def dependencies(self):
+        """Return the files (and modified times) used to create the content, see addDependency."""
+        return self._dependencies
+
+    def addDependency(self, filename):
+        """
+        Add a file that is used to create the page content (e.g., !include and !listing files).
+
+        The page is considered modified if a dependency is modified or removed, see modified().
+        """
+        if filename not in self._dependencies:
+            self._dependencies[filename] = os.path.getmtime(filename) \
+                                           if os.path.exists(filename) else None
+
     def tokenize(self):
         """
         Perform tokenization of content, using cache if the content has not changed.
@@ -219,6 +264,8 @@ class MarkdownNode(FileNode):
             self.read()
 
         if self._ast is None:
+            self._dependencies.clear()
+            self._bookmarks = None
             self._ast = tokens.Token(None)
             self.translator.reader.parse(self._ast, self.content)
 
@@ -243,10 +290,15 @@ class MarkdownNode(FileNode):
 
     def modified(self):
         """
-        Returns True if the content has been modified from the last call.
+        Returns True if the content or a dependency has been modified from the last call.
         """
         if self.source and os.path.exists(self.source):
-            return os.path.getmtime(self.source) > self._modified
+            if os.path.getmtime(self.source) > self._modified:
+                return True
+            for filename, mtime in self._dependencies.iteritems():
+                if not os.path.exists(filename) or (os.path.getmtime(filename) != mtime):
+                    return True
+            return False
         return True
 
     def write(self):
@@ -256,8 +308,66 @@ class MarkdownNode(FileNode):
         if self._result is not None:
             LOG.debug('WRITE %s -> %s', self.source, self.destination)
             LocationNodeBase.write(self) # Creates directories
-            with codecs.open(self.destination, 'w', encoding='utf-8') as fid:
-                fid.write(self._result.write())
+            return common.write(self.destination, self._result.iterwrite())
+        return None
+
+    def release(self):
+        """
+        Remove the AST and rendered result of the page to reduce memory use (see the Translator
+        'release' configuration option).
+
+        The tokens needed for linking to the page (see findHeading and findBookmark) are detached
+        from the AST and kept, the page is tokenized again (from the stored content) if needed.
+        """
+        if self._ast is not None:
+            heading, bookmarks = self.__bookmarks()
+            keep = set(bookmarks.itervalues())
+            keep.add(heading)
+            for tok in keep:
+                if (tok is not None) and not any(a in keep for a in tok.ancestors):
+                    tok.parent = None
+
+        self._ast = None
+        self._result = None
+
+    def findHeading(self):
+        """Return the first Heading token of the page, None is returned if it does not exist."""
+        return self.__bookmarks()[0]
+
+    def findBookmark(self, name):
+        """
+        Return the token with the supplied 'id' (e.g., a heading), None is returned if it does not
+        exist.
+
+        Inputs:
+            name[unicode]: The 'id' of the token, without the leading '#'.
+        """
+        return self.__bookmarks()[1].get(name, None)
+
+    def __bookmarks(self):
+        """
+        Return the first heading and a dict() of the tokens with an 'id' attribute.
+
+        If the page was tokenized only to create the index and the Translator is releasing pages
+        the AST is released, since the page may never be built by this process.
+        """
+        if self._bookmarks is None:
+            existing = self._ast is not None
+            with self.translator.lock:
+                ast = self.tokenize()
+            heading = None
+            bookmarks = dict()
+            for node in anytree.PreOrderIter(ast):
+                if (heading is None) and isinstance(node, tokens.Heading):
+                    heading = node
+                if ('id' in node) and node['id']:
+                    bookmarks.setdefault(node['id'], node)
+            self._bookmarks = (heading, bookmarks)
+
+            if not existing and (self.translator.current is not self) and self.translator.release:
+                self.release()
+
+        return self._bookmarks
 
     def buildIndex(self, home):
         """
@@ -280,7 +390,14 @@ class MarkdownNode(FileNode):
         """
         self.translator.current = self
         self.translator.reinit()
-        ast = self.tokenize()
-        self.render(ast)
-        self.write()
+        timing = self.translator.timing
+        if timing is None:
+            ast = self.tokenize()
+            self.render(ast)
+            status = self.write()
+        else:
+            ast = timing.page(self.source, 'tokenize', self.tokenize)
+            timing.page(self.source, 'render', self.render, ast)
+            status = timing.page(self.source, 'write', self.write)
         self.translator.current = None
+        return status
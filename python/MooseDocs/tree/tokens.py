@@ -26,6 +26,7 @@ class Token(NodeBase):
         *args, **kwarg: (Optional) All arguments and key, value pairs supplied are stored in the
                         settings property and may be retrieved via the various access methods.
     """
+    __slots__ = ('_info',)
     PROPERTIES = [Property('recursive', default=True), # TODO: Can this go away?
                   Property('string', ptype=unicode)]
                   #Property('info')] # TODO: use property, which should work with property override
@@ -84,6 +85,7 @@ class CountToken(Token):
     """
     Token that maintains counts based on prefix, the Translator clears the counts prior to building.
     """
+    __slots__ = ()
     PROPERTIES = [Property('prefix', ptype=unicode),
                   Property('number', ptype=int)]
     COUNTS = collections.defaultdict(int)
@@ -95,15 +97,17 @@ class CountToken(Token):
             self.number = CountToken.COUNTS[self.prefix]
 
 class Section(Token):
-    pass
+    __slots__ = ()
 
 class String(Token):
     """
     Base class for all tokens meant to contain characters.
     """
+    __slots__ = ()
     PROPERTIES = [Property('content', ptype=unicode)]
 
 class ErrorToken(Token):
+    __slots__ = ()
     PROPERTIES = [Property('message', ptype=unicode)]
 
     def report(self, current):
@@ -123,6 +127,7 @@ class ExceptionToken(ErrorToken):
     """
     When the lexer object fails create a token, an error token will be created.
     """
+    __slots__ = ()
     PROPERTIES = [Property('traceback', required=False, ptype=str)]
 
 
@@ -136,12 +141,13 @@ class Word(String):
     """
     Letters without any spaces.
     """
-    pass
+    __slots__ = ()
 
 class Space(String):
     """
     Space token that can define the number of space via count property.
     """
+    __slots__ = ()
     PROPERTIES = [Property('count', ptype=int, default=1)]
     def __init__(self, *args, **kwargs):
         super(Space, self).__init__(*args, **kwargs)
@@ -151,6 +157,7 @@ class Break(Space):
     """
     Line breaks that can define the number of breaks via count property.
     """
+    __slots__ = ()
     def __init__(self, *args, **kwargs):
         super(Break, self).__init__(*args, **kwargs)
         self.content = u'\n'
@@ -159,18 +166,19 @@ class Punctuation(String):
     """
     Token for non-letters and non-numbers.
     """
-    pass
+    __slots__ = ()
 
 class Number(String):
     """
     Token for numbers.
     """
-    pass
+    __slots__ = ()
 
 class Code(Token):
     """
     Code content (i.e., Monospace content)
     """
+    __slots__ = ()
     PROPERTIES = [Property('code', ptype=unicode, required=True),
                   Property('language', ptype=unicode, default=u'text'),
                   Property('escape', ptype=bool, default=True)]
@@ -179,6 +187,7 @@ class Heading(Token):
     """
     Section headings.
     """
+    __slots__ = ()
     PROPERTIES = [Property('level', ptype=int)]
     def __init__(self, *args, **kwargs):
         Token.__init__(self, *args, **kwargs)
@@ -191,24 +200,26 @@ class Paragraph(Token):
     """
     Paragraph token.
     """
-    pass
+    __slots__ = ()
 
 class UnorderedList(Token):
     """
     Token for an un-ordered list (i.e., bulleted list)
     """
-    pass
+    __slots__ = ()
 
 class OrderedList(Token):
     """
     Token for a numbered list.
     """
+    __slots__ = ()
     PROPERTIES = [Property('start', default=1, ptype=int)]
 
 class ListItem(Token):
     """
     List item token.
     """
+    __slots__ = ()
     def __init__(self, *args, **kwargs):
         Token.__init__(self, *args, **kwargs)
         if not isinstance(self.parent, (OrderedList, UnorderedList)):
@@ -219,6 +230,7 @@ class Link(Token):
     """
     Token for urls.
     """
+    __slots__ = ()
     PROPERTIES = [Property('url', required=True, ptype=unicode),
                   Property('tooltip', default=True)]
 
@@ -238,40 +250,45 @@ class Shortcut(Token):
         link[unicode]: (Required) The content to which the shortcut links against, e.g., the value
                        of 'href' for HTML.
     """
+    __slots__ = ()
     PROPERTIES = [Property('key', required=True, ptype=unicode),
                   Property('link', required=True, ptype=unicode)]
 
 class ShortcutLink(Token):
+    __slots__ = ()
     PROPERTIES = [Property('key', ptype=unicode, required=True)]
 
 class Monospace(Token):
+    __slots__ = ()
     PROPERTIES = [Property('code', ptype=unicode, required=True)]
 
 class Strong(Token):
-    pass
+    __slots__ = ()
 
 class Emphasis(Token):
-    pass
+    __slots__ = ()
 
 class Underline(Token):
-    pass
+    __slots__ = ()
 
 class Strikethrough(Token):
-    pass
+    __slots__ = ()
 
 class Quote(Token):
-    pass
+    __slots__ = ()
 
 class Superscript(Token):
-    pass
+    __slots__ = ()
 
 class Subscript(Token):
-    pass
+    __slots__ = ()
 
 class Label(Token):
+    __slots__ = ()
     PROPERTIES = [Property('text', required=True, ptype=unicode)]
 
 class Float(Token):
+    __slots__ = ()
     PROPERTIES = [Property('id', ptype=str),
                   Property('caption', ptype=unicode),
                   Property('label', ptype=str, required=True)]
@@ -2,8 +2,15 @@
 """
 Tests for the Renderer objects.
 """
+import os
+import shutil
+import tempfile
 import unittest
 import logging
+import subprocess
+import mock
+from MooseDocs import common
+from MooseDocs.extensions import core
 from MooseDocs.common import exceptions
 from MooseDocs.tree import tokens, html, page
 from MooseDocs.base import renderers, Translator, MarkdownReader
@@ -104,5 +111,83 @@ class TestHTMLRenderer(unittest.TestCase):
         self.assertIsInstance(root(0)(0), html.String)
         self.assertEqual(root(0)(0).content, u'foo')
 
+class TestLatexRenderer(unittest.TestCase):
+    """
+    Test that the LaTeX files from the previous build are used for the unchanged pages.
+    """
+    def setUp(self):
+        self._loc = tempfile.mkdtemp()
+        self._content = os.path.join(self._loc, 'content')
+        os.makedirs(os.path.join(self._content, 'sub'))
+        self.write('index.md', u'# Title\n\nIndex')
+        self.write('sub/a.md', u'# A\n\nPage A')
+        self.write('sub/b.md', u'# B\n\nPage B')
+
+    def tearDown(self):
+        shutil.rmtree(self._loc)
+
+    def write(self, name, content):
+        with open(os.path.join(self._content, name), 'w') as fid:
+            fid.write(content)
+
+    def execute(self, num_threads=1, error=None):
+        """
+        Build the pages, returns the number of times pdflatex was executed. The error, if supplied,
+        is raised by pdflatex.
+        """
+        root = page.DirectoryNode(None, source=self._content)
+        page.MarkdownNode(root, source=os.path.join(self._content, 'index.md'))
+        sub = page.DirectoryNode(root, source=os.path.join(self._content, 'sub'))
+        page.MarkdownNode(sub, source=os.path.join(self._content, 'sub', 'a.md'))
+        page.MarkdownNode(sub, source=os.path.join(self._content, 'sub', 'b.md'))
+
+        translator = Translator(root, MarkdownReader(), renderers.LatexRenderer(),
+                                common.load_extensions([core]),
+                                destination=os.path.join(self._loc, 'site'), costs=None)
+        translator.init()
+        with mock.patch.object(renderers, 'subprocess') as proc:
+            proc.CalledProcessError = subprocess.CalledProcessError
+            proc.check_output.side_effect = error
+            translator.execute(num_threads)
+        return proc.check_output.call_count
+
+    def destination(self, name):
+        return os.path.join(self._loc, 'site', 'content', name)
+
+    def testFragments(self):
+        self.assertEqual(self.execute(), 1)
+        with open(os.path.join(self._loc, 'site', 'main.tex'), 'r') as fid:
+            main = fid.read()
+        self.assertIn('Title', main)
+        for name in ['index.tex', 'sub/a.tex', 'sub/b.tex']:
+            self.assertIn(self.destination(name), main)
+        self.assertNotIn('Title', common.read(self.destination('index.tex')))
+
+        # Unchanged pages and an existing PDF
+        open(os.path.join(self._loc, 'site', 'main.pdf'), 'w').close()
+        mtime = os.path.getmtime(self.destination('sub/b.tex'))
+        with mock.patch('MooseDocs.tree.page.MarkdownNode.build') as build:
+            self.assertEqual(self.execute(num_threads=2), 0)
+            self.assertFalse(build.called)
+        self.assertNotIn('Title', common.read(self.destination('index.tex')))
+
+        # Changed page
+        self.write('sub/a.md', u'# A\n\nChanged')
+        self.assertEqual(self.execute(num_threads=2), 1)
+        self.assertIn('Changed', common.read(self.destination('sub/a.tex')))
+        self.assertEqual(os.path.getmtime(self.destination('sub/b.tex')), mtime)
+
+        # Failed PDF, the PDF of the previous build is removed so that the next build creates it
+        self.write('sub/a.md', u'# A\n\nFailed')
+        with self.assertRaises(exceptions.MooseDocsException):
+            self.execute(error=subprocess.CalledProcessError(1, 'pdflatex', 'error'))
+        self.assertFalse(os.path.isfile(os.path.join(self._loc, 'site', 'main.pdf')))
+        self.assertEqual(self.execute(), 1)
+
+        # Cleaned destination
+        shutil.rmtree(os.path.join(self._loc, 'site', 'content'))
+        self.assertEqual(self.execute(), 1)
+        self.assertTrue(os.path.isfile(self.destination('sub/b.tex')))
+
 if __name__ == '__main__':
     unittest.main(verbosity=2)
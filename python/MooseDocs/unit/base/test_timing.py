@@ -0,0 +1,109 @@
+#!/usr/bin/env python2
+"""
+Testing for Timing object.
+"""
+import os
+import json
+import time
+import shutil
+import tempfile
+import unittest
+from MooseDocs import common
+from MooseDocs.extensions import core
+from MooseDocs.tree import page
+from MooseDocs.base import components, Translator, MarkdownReader, HTMLRenderer
+from MooseDocs.base.timing import Timing
+
+class PostExtension(components.Extension):
+    """Extension with a postTokenize function."""
+    def postTokenize(self, ast, config): #pylint: disable=no-self-use,unused-argument
+        time.sleep(0.001)
+
+class TestTiming(unittest.TestCase):
+    """
+    Test the recording of the component, extension, and page times.
+    """
+    def testCall(self):
+        """
+        Test that the nested time is excluded.
+        """
+        timing = Timing()
+        def outer():
+            time.sleep(0.01)
+            timing.call('reader', 'Inner', None, time.sleep, 0.02)
+            return 42
+        self.assertEqual(timing.call('reader', 'Outer', None, outer), 42)
+
+        comps, _ = timing.data
+        self.assertEqual(comps[('reader', 'Outer', None)][0], 1)
+        self.assertLess(comps[('reader', 'Outer', None)][1], 0.02)
+        self.assertGreaterEqual(comps[('reader', 'Inner', None)][1], 0.02)
+
+    def testMerge(self):
+        """
+        Test combining the data from multiple objects.
+        """
+        a = Timing()
+        a.call('render', 'Word', None, lambda: None)
+        a.page('a.md', 'render', lambda: None)
+        b = Timing()
+        b.call('render', 'Word', None, lambda: None)
+        b.page('b.md', 'tokenize', lambda: None)
+
+        a.merge(b.data)
+        comps, pages = a.data
+        self.assertEqual(comps[('render', 'Word', None)][0], 2)
+        self.assertEqual(sorted(pages.keys()), ['a.md', 'b.md'])
+
+        a.clear()
+        self.assertEqual(a.data, (dict(), dict()))
+
+    def testExecute(self):
+        """
+        Test that the times are returned from the processes that build the pages.
+        """
+        loc = tempfile.mkdtemp()
+        root = page.DirectoryNode(None, source=os.path.join(loc, 'content'))
+        os.makedirs(root.source)
+        for i in range(4):
+            filename = os.path.join(root.source, 'page{}.md'.format(i))
+            with open(filename, 'w') as fid:
+                fid.write('# Page {}\n\nContent'.format(i))
+            page.MarkdownNode(root, source=filename)
+
+        translator = Translator(root, MarkdownReader(), HTMLRenderer(),
+                                common.load_extensions([core]) + [PostExtension()],
+                                destination=os.path.join(loc, 'site'),
+                                costs=None, timing=True)
+        translator.init()
+        translator.execute(num_threads=2)
+
+        comps, pages = translator.timing.data
+        self.assertEqual(sorted(pages.keys()), sorted(n.source for n in root.children))
+        self.assertEqual(comps[('reader', 'HeadingHash', 'CoreExtension')][0], 4)
+        self.assertEqual(comps[('render', 'Heading', 'CoreExtension')][0], 4)
+        self.assertEqual(comps[('extension', 'postTokenize', 'PostExtension')][0], 4)
+        self.assertIn('Slowest pages (of 4):', translator.timing.report())
+
+        filename = os.path.join(loc, 'timing.json')
+        translator.timing.write(filename, commit='abc')
+        with open(filename, 'r') as fid:
+            data = json.load(fid)
+        self.assertEqual(data['commit'], 'abc')
+        self.assertEqual(len(data['pages']), 4)
+        self.assertIn('PostExtension', data['extensions'])
+
+        shutil.rmtree(loc)
+
+    def testDisabled(self):
+        """
+        Test that the Timing object is not created by default.
+        """
+        translator = Translator(page.PageNodeBase(None), MarkdownReader(), HTMLRenderer(), [])
+        translator.init()
+        self.assertIsNone(translator.timing)
+        self.assertIsNone(translator.reader.lexer.timing)
+        self.assertIsNone(translator.renderer.timing)
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
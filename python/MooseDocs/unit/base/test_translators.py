@@ -2,9 +2,16 @@
 """
 Testing for Translator object.
 """
+import os
+import json
+import collections
+import shutil
+import tempfile
 import unittest
+from MooseDocs import common
+from MooseDocs.extensions import core
 from MooseDocs.tree import page
-from MooseDocs.base import Translator, MarkdownReader, HTMLRenderer
+from MooseDocs.base import Translator, MarkdownReader, HTMLRenderer, MaterializeRenderer
 from MooseDocs.common import exceptions
 
 class TestTranslator(unittest.TestCase):
@@ -46,5 +53,102 @@ class TestTranslator(unittest.TestCase):
             Translator(content, MarkdownReader(), HTMLRenderer(), ['foo'])
         self.assertIn("The argument 'extensions' must be", e.exception.message)
 
+    def testUniqueID(self):
+        """
+        Test the IDs are repeatable and unique within a page.
+        """
+        content = page.PageNodeBase(None)
+        translator = Translator(content, MarkdownReader(), HTMLRenderer(), [])
+        translator.init()
+
+        ids = [translator.uniqueID(u'foo'), translator.uniqueID(u'foo'), translator.uniqueID()]
+        self.assertEqual(len(set(ids)), 3)
+
+        translator.reinit()
+        self.assertEqual(translator.uniqueID(u'foo'), ids[0])
+        self.assertEqual(translator.uniqueID(), ids[2])
+
+    def testExecute(self):
+        """
+        Test the parallel build and the storage of the page conversion times.
+        """
+        loc = tempfile.mkdtemp()
+        root = page.DirectoryNode(None, source=os.path.join(loc, 'content'))
+        os.makedirs(root.source)
+        for i in range(5):
+            filename = os.path.join(root.source, 'page{}.md'.format(i))
+            with open(filename, 'w') as fid:
+                fid.write('# Page {}\n\nContent'.format(i))
+            page.MarkdownNode(root, source=filename)
+
+        filename = os.path.join(root.source, 'file.txt')
+        with open(filename, 'w') as fid:
+            fid.write('file')
+        page.FileNode(root, source=filename)
+
+        costs = os.path.join(loc, 'costs.json')
+        translator = Translator(root, MarkdownReader(), HTMLRenderer(),
+                                common.load_extensions([core]),
+                                destination=os.path.join(loc, 'site'), costs=costs)
+        translator.init()
+        translator.execute(num_threads=2)
+
+        for i in range(5):
+            self.assertTrue(os.path.isfile(os.path.join(loc, 'site', 'content',
+                                                        'page{}.html'.format(i))))
+        self.assertTrue(os.path.isfile(os.path.join(loc, 'site', 'content', 'file.txt')))
+
+        with open(costs, 'r') as fid:
+            data = json.load(fid)
+        self.assertEqual(sorted(data.keys()), sorted(n.source for n in root.children[:5]))
+
+        shutil.rmtree(loc)
+
+    def testSearchIndex(self):
+        """
+        Test the 'list' and 'trie' search index formats contain the same entries.
+        """
+        def expand(node, prefix, out):
+            """Python version of the javascript function in the 'trie' search index."""
+            for key, value in node.iteritems():
+                if isinstance(value, list):
+                    for text, fragment in value[1]:
+                        out.append(dict(name=value[0], text=text,
+                                        location=prefix + key + '#' + fragment))
+                else:
+                    expand(value, prefix + key, out)
+            return out
+
+        loc = tempfile.mkdtemp()
+        source = os.path.join(loc, 'content')
+        os.makedirs(os.path.join(source, 'sub'))
+        for name in ['index.md', 'sub/page.md']:
+            with open(os.path.join(source, name), 'w') as fid:
+                fid.write('# Title\n\nContent\n\n## Section\n\n## Other\n')
+
+        data = dict()
+        for fmt in ['list', 'trie']:
+            root = page.DirectoryNode(None, source=source)
+            page.MarkdownNode(root, source=os.path.join(source, 'index.md'))
+            sub = page.DirectoryNode(root, source=os.path.join(source, 'sub'))
+            page.MarkdownNode(sub, source=os.path.join(source, 'sub', 'page.md'))
+
+            translator = Translator(root, MarkdownReader(),
+                                    MaterializeRenderer(**{'search-index':fmt}),
+                                    common.load_extensions([core]),
+                                    destination=os.path.join(loc, fmt), costs=None)
+            translator.init()
+            translator.execute(num_threads=1)
+            data[fmt] = common.read(os.path.join(loc, fmt, 'js', 'search_index.js'))
+
+        items = json.loads(data['list'][len('var index_data = '):-1])
+        trie = json.loads(data['trie'][data['trie'].rindex('})(') + 3:-2],
+                          object_pairs_hook=collections.OrderedDict)
+        self.assertEqual(len(items), 6)
+        self.assertEqual(expand(trie, '', []), items)
+        self.assertLess(len(data['trie']), len(data['list']))
+
+        shutil.rmtree(loc)
+
 if __name__ == '__main__':
     unittest.main(verbosity=2)
@@ -9,7 +9,12 @@
 #* Licensed under LGPL 2.1, please see LICENSE for details
 #* https://www.gnu.org/licenses/lgpl-2.1.html
 
+import os
+import sys
+import shutil
+import tempfile
 import unittest
+import mock
 from MooseDocs.common import build_class_database
 
 class TestClassDatabase(unittest.TestCase):
@@ -56,6 +61,24 @@ class TestClassDatabaseEmptyInput(unittest.TestCase):
         self.assertIn('modules/heat_conduction/include/kernels/HeatConduction.h', info.children)
         self.assertIn('test/tests/mesh/named_entities/named_entities_test_xda.i', info.inputs)
 
+class TestClassDatabaseCache(unittest.TestCase):
+    def testCache(self):
+        cache = os.path.join(tempfile.mkdtemp(), 'class_database.pkl')
+        args = (['${MOOSE_DIR}/framework/include/markers'], ['${MOOSE_DIR}/test/tests/markers'])
+
+        database = build_class_database(*args, cache=cache)
+        self.assertTrue(os.path.isfile(cache))
+        self.assertIn('test/tests/markers/box_marker/box_marker_test.i',
+                      database['BoxMarker'].inputs)
+
+        module = sys.modules['MooseDocs.common.build_class_database']
+        with mock.patch.object(module, '_scan') as scan:
+            database = build_class_database(*args, cache=cache)
+            scan.assert_not_called()
+        self.assertEqual(database['BoxMarker'].header, 'framework/include/markers/BoxMarker.h')
+        self.assertIn('test/tests/markers/box_marker/box_marker_test.i',
+                      database['BoxMarker'].inputs)
+        shutil.rmtree(os.path.dirname(cache))
 
 if __name__ == '__main__':
     unittest.main(verbosity=2)
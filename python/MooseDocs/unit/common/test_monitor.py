@@ -0,0 +1,156 @@
+#!/usr/bin/env python2
+import os
+import shutil
+import tempfile
+import unittest
+import mock
+
+from MooseDocs import common
+from MooseDocs.common import monitor
+from MooseDocs.commands import watcher
+from MooseDocs.extensions import core
+from MooseDocs.tree import page
+from MooseDocs.base import Translator, MarkdownReader, HTMLRenderer
+
+class TestPollingMonitor(unittest.TestCase):
+    """
+    Test the file monitor objects detect modified, added, and removed files.
+    """
+    MONITOR = common.PollingMonitor
+
+    def setUp(self):
+        self._loc = tempfile.mkdtemp()
+        self._dir = os.path.join(self._loc, 'content')
+        os.makedirs(self._dir)
+        self._file = os.path.join(self._loc, 'file.txt')
+        self.write(self._file)
+        self.write(os.path.join(self._dir, 'page.md'))
+
+    def tearDown(self):
+        shutil.rmtree(self._loc)
+
+    @staticmethod
+    def write(filename, time=None):
+        with open(filename, 'w') as fid:
+            fid.write('content')
+        if time is not None:
+            os.utime(filename, (time, time))
+
+    def testChanges(self):
+        mon = self.MONITOR()
+        mon.watch(self._dir)
+        mon.watch(self._file)
+        self.assertEqual(mon.changes(), set())
+
+        # Modified file
+        self.write(self._file, time=1)
+        self.assertEqual(mon.changes(), set([self._file]))
+        self.assertEqual(mon.changes(), set())
+
+        # Added file
+        new = os.path.join(self._dir, 'new.md')
+        self.write(new)
+        os.utime(self._dir, (2, 2))
+        self.assertIn(new, mon.changes())
+
+        # Removed file
+        os.remove(new)
+        os.utime(self._dir, (3, 3))
+        self.assertIn(new, mon.changes())
+        self.assertEqual(mon.changes(), set())
+
+        # Removed directory
+        shutil.rmtree(self._dir)
+        self.assertIn(os.path.join(self._dir, 'page.md'), mon.changes())
+
+    def testUnwatch(self):
+        mon = self.MONITOR()
+        mon.watch(self._dir)
+        mon.unwatch(self._dir)
+        self.write(os.path.join(self._dir, 'new.md'))
+        os.utime(self._dir, (2, 2))
+        self.assertEqual(mon.changes(), set())
+
+@unittest.skipIf(monitor.pyinotify is None, "The pyinotify package is not available.")
+class TestINotifyMonitor(TestPollingMonitor):
+    MONITOR = common.INotifyMonitor
+
+class StubMonitor(object):
+    """A monitor that returns the supplied paths as changes, for testing the watcher."""
+    def __init__(self):
+        self.paths = set()
+        self.watched = set()
+
+    def watch(self, path):
+        self.watched.add(path)
+
+    def unwatch(self, path):
+        self.watched.discard(path)
+
+    def changes(self):
+        out = self.paths
+        self.paths = set()
+        return out
+
+class TestMooseDocsWatcher(unittest.TestCase):
+    """
+    Test the pages built, added, and removed by the watcher for the changes of the monitor.
+    """
+    def setUp(self):
+        self._loc = tempfile.mkdtemp()
+        self._root = page.DirectoryNode(None, source=os.path.join(self._loc, 'content'))
+        os.makedirs(self._root.source)
+        self._pages = []
+        for name in ['a.md', 'b.md']:
+            filename = os.path.join(self._root.source, name)
+            TestPollingMonitor.write(filename)
+            self._pages.append(page.MarkdownNode(self._root, source=filename))
+        self._include = os.path.join(self._loc, 'include.txt')
+        TestPollingMonitor.write(self._include)
+
+        self._translator = Translator(self._root, MarkdownReader(), HTMLRenderer(),
+                                      common.load_extensions([core]),
+                                      destination=os.path.join(self._loc, 'site'))
+        self._translator.init()
+        self._pages[0].addDependency(self._include)
+
+        self._monitor = StubMonitor()
+        with mock.patch.object(common, 'create_monitor', return_value=self._monitor):
+            self._watcher = watcher.MooseDocsWatcher(self._translator, mock.Mock(num_threads=1))
+
+    def tearDown(self):
+        shutil.rmtree(self._loc)
+
+    def testWatch(self):
+        self.assertEqual(self._monitor.watched,
+                         set([self._root.source, self._include] + [n.source for n in self._pages]))
+        self.assertEqual(self._watcher.examine(), (None, None))
+
+    def testDependency(self):
+        self._monitor.paths = set([self._include])
+        with mock.patch.object(page.MarkdownNode, 'build', autospec=True) as build:
+            self.assertEqual(self._watcher.examine(), (self._include, None))
+        self.assertEqual([c[0][0] for c in build.call_args_list], [self._pages[0]])
+
+    def testAddRemove(self):
+        filename = os.path.join(self._root.source, 'c.md')
+        TestPollingMonitor.write(filename)
+        self._monitor.paths = set([filename])
+        with mock.patch.object(page.MarkdownNode, 'build', autospec=True) as build:
+            self._watcher.examine()
+        node = build.call_args[0][0]
+        self.assertEqual(node.source, filename)
+        self.assertIs(node.parent, self._root)
+        self.assertIn(filename, self._monitor.watched)
+
+        # Removed page is not watched
+        os.remove(self._pages[1].source)
+        self._monitor.paths = set([self._pages[1].source])
+        with mock.patch.object(page.MarkdownNode, 'build', autospec=True) as build:
+            self._watcher.examine()
+        self.assertFalse(build.called)
+        self.assertIsNone(self._pages[1].parent)
+        self.assertNotIn(self._pages[1].source, self._monitor.watched)
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,64 @@
+#!/usr/bin/env python2
+import os
+import sys
+import shutil
+import tempfile
+import subprocess
+import unittest
+import mock
+
+import MooseDocs
+from MooseDocs import common
+
+class TestProjectFind(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.mkdtemp()
+        self._repo = os.path.join(self._tmp, 'repo')
+        os.makedirs(self._repo)
+        subprocess.check_output(['git', 'init'], cwd=self._repo)
+
+        module = sys.modules['MooseDocs.common.project_find']
+        self._patch = mock.patch.object(module, 'CACHE_DIR', os.path.join(self._tmp, 'cache'))
+        self._patch.start()
+
+    def tearDown(self):
+        self._patch.stop()
+        shutil.rmtree(self._tmp)
+
+    def _add(self, name):
+        with open(os.path.join(self._repo, name), 'w') as fid:
+            fid.write(name)
+        subprocess.check_output(['git', 'add', name], cwd=self._repo)
+
+    def testProjectFind(self):
+        filename = os.path.join(MooseDocs.MOOSE_DIR, 'framework', 'src', 'kernels', 'Diffusion.C')
+        self.assertIn(filename, common.project_files())
+        self.assertEqual(common.project_find('src/kernels/Diffusion.C'), [filename])
+
+    def testCache(self):
+        module = sys.modules['MooseDocs.common.project_find']
+        self._add('a.md')
+        self.assertIn(os.path.join(self._repo, 'a.md'), module._git_ls_files(self._repo))
+
+        # Unchanged index uses the cache
+        with mock.patch('mooseutils.git_ls_files') as ls_files:
+            files = module._git_ls_files(self._repo)
+            self.assertFalse(ls_files.called)
+        self.assertIn(os.path.join(self._repo, 'a.md'), files)
+
+        # Changed index lists the files
+        self._add('b.md')
+        files = module._git_ls_files(self._repo)
+        self.assertIn(os.path.join(self._repo, 'b.md'), files)
+
+    def testAddProjectDirectory(self):
+        module = sys.modules['MooseDocs.common.project_find']
+        self._add('a.md')
+        with mock.patch.object(module, '_DIRECTORIES', []), \
+             mock.patch.object(module, '_FILES', set()), \
+             mock.patch.object(module, '_LISTED', set()):
+            common.add_project_directory(self._repo)
+            self.assertIn(os.path.join(self._repo, 'a.md'), common.project_files())
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
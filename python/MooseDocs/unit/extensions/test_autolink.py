@@ -215,6 +215,32 @@ class TestRenderAutoShortcutLinkMaterialize(TestRenderAutoShortcutLinkHTML):
         self.build()
         return self.root(0).result.find('moose-content', attr='class')(0)
 
+class TestRelease(TestAutoLinkBase):
+    """Test that links to released pages use the stored heading and bookmark tokens."""
+    RENDERER = renderers.HTMLRenderer
+
+    def testRelease(self):
+        self.build()
+        self.assertFalse(self._translator.release) # the main process keeps the pages
+
+        node = self.root(1)
+        heading = node.findHeading()
+        sub = node.findBookmark(u'sub')
+        self.assertIsNone(node.findBookmark(u'wrong'))
+
+        node.release()
+        self.assertIsNone(node.ast)
+        self.assertIsNone(node.result)
+        self.assertIs(node.findHeading(), heading)
+        self.assertIsNone(heading.parent)
+        self.assertIs(node.findBookmark(u'sub'), sub)
+        self.assertIsNone(sub.parent)
+
+        self.root(0).release()
+        self.root(0).build()
+        content = self.root(0).result.write()
+        self.assertIn(u'>Page 1</a>', content)
+        self.assertIn(u'>Page 1:Sub</a>', content)
 
 @unittest.skip('WIP LaTeX')
 class TestRenderAutoShortcutLinkLatex(testing.MooseDocsTestCase):
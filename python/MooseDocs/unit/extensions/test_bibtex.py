@@ -0,0 +1,88 @@
+#!/usr/bin/env python2
+#pylint: disable=missing-docstring
+import os
+import shutil
+import tempfile
+import unittest
+import logging
+import mock
+
+from MooseDocs import common
+from MooseDocs.extensions import core, command, bibtex
+from MooseDocs.tree import page, tokens
+from MooseDocs.base import MarkdownReader, HTMLRenderer, Translator
+
+logging.basicConfig()
+
+BIBTEX = u"""@article{slaughter2015continuous,
+  title={Continuous integration for rapid development},
+  author={Slaughter, Andrew E and Peterson, John W and Gaston, Derek R},
+  journal={Journal},
+  year={2015}
+}
+"""
+
+class TestBibtexCache(unittest.TestCase):
+    """Test that the parsed BibTeX database is stored and reused."""
+    def setUp(self):
+        self._tmp = tempfile.mkdtemp()
+        self._bib = os.path.join(self._tmp, 'test.bib')
+        with open(self._bib, 'w') as fid:
+            fid.write(BIBTEX)
+        self._patch = mock.patch.object(bibtex, 'CACHE_DIR', os.path.join(self._tmp, 'cache'))
+        self._patch.start()
+
+    def tearDown(self):
+        self._patch.stop()
+        shutil.rmtree(self._tmp)
+
+    def _translator(self, **kwargs):
+        root = page.DirectoryNode(None, source=self._tmp)
+        page.FileNode(root, source=self._bib)
+        config = {'MooseDocs.extensions.bibtex':kwargs}
+        extensions = common.load_extensions([core, command, bibtex], config)
+        translator = Translator(root, MarkdownReader(), HTMLRenderer(), extensions)
+        translator.init()
+        return translator
+
+    def testCache(self):
+        translator = self._translator()
+        self.assertEqual(len(os.listdir(bibtex.CACHE_DIR)), 1)
+
+        # Cached database is used
+        with mock.patch('MooseDocs.extensions.bibtex.parse_file') as parse_file:
+            translator = self._translator()
+            self.assertFalse(parse_file.called)
+        ext = translator.extensions[-1]
+        self.assertIn('slaughter2015continuous', ext.database.entries)
+
+        # Changed content is parsed
+        with open(self._bib, 'a') as fid:
+            fid.write(BIBTEX.replace(u'slaughter2015continuous', u'slaughter2015other'))
+        translator = self._translator()
+        self.assertIn('slaughter2015other', translator.extensions[-1].database.entries)
+        self.assertEqual(len(os.listdir(bibtex.CACHE_DIR)), 1)
+
+        # Replaced entry is used
+        with mock.patch('MooseDocs.extensions.bibtex.parse_file') as parse_file:
+            translator = self._translator()
+            self.assertFalse(parse_file.called)
+        self.assertIn('slaughter2015other', translator.extensions[-1].database.entries)
+
+    def testNoCache(self):
+        translator = self._translator(cache=False)
+        self.assertFalse(os.path.exists(bibtex.CACHE_DIR))
+        self.assertIn('slaughter2015continuous', translator.extensions[-1].database.entries)
+
+    def testCite(self):
+        translator = self._translator()
+        ast = tokens.Token(None)
+        translator.reader.parse(ast, u'[cite:slaughter2015continuous]')
+        self.assertIsInstance(ast(0)(0), bibtex.BibtexCite)
+
+        html = translator.renderer.render(ast).write()
+        self.assertIn(u'Slaughter et al. (2015)', html)
+        self.assertIn(u'Slaughter et al. (2015)', translator.renderer.render(ast).write())
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -56,6 +56,16 @@ class TestIncludeTokenize(TestIncludeBase):
             self.assertEqual(ast(0)(0).content, u'File')
             self.assertEqual(ast(0)(2).content, unicode(i))
 
+    def testDependencies(self):
+        self.assertEqual(sorted(self.root(0).dependencies.keys()), self.files[1:3]) # nested
+        self.assertEqual(self.root(1).dependencies.keys(), [self.files[2]])
+        self.assertEqual(self.root(2).dependencies.keys(), [])
+        self.assertFalse(self.root(0).modified())
+
+        os.utime(self.files[1], (0, 0))
+        self.assertTrue(self.root(0).modified())
+        self.assertFalse(self.root(2).modified())
+
 # RENDERER TESTS
 @unittest.skip('WIP')
 class TestRenderIncludeHTML(TestIncludeBase):
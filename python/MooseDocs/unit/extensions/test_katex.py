@@ -3,7 +3,7 @@
 import unittest
 
 import MooseDocs
-from MooseDocs.extensions import katex
+from MooseDocs.extensions import core, katex
 from MooseDocs.tree import tokens, html, latex
 from MooseDocs.base import testing, renderers
 
@@ -0,0 +1,122 @@
+#!/usr/bin/env python2
+#pylint: disable=missing-docstring
+import os
+import shutil
+import tempfile
+import unittest
+import logging
+
+import mooseutils
+
+import MooseDocs
+from MooseDocs import common
+from MooseDocs.common import exceptions
+from MooseDocs.extensions import core, command, floats, listing
+from MooseDocs.tree import tokens
+from MooseDocs.base import testing
+
+logging.basicConfig()
+
+class TestFileListingTokenize(testing.MooseDocsTestCase):
+    """Test tokenization of FileListingCommand"""
+
+    EXTENSIONS = [core, command, floats, listing]
+
+    def testToken(self):
+        ast = self.ast(u'!listing framework/src/kernels/Diffusion.C '
+                       u'start=Diffusion::computeQpResidual end=Real link=False')
+        self.assertIsInstance(ast(0), floats.Float)
+        self.assertIsInstance(ast(0)(0), tokens.Code)
+        self.assertIn(u'Diffusion::computeQpResidual', ast(0)(0).code)
+        self.assertNotIn(u'computeQpJacobian', ast(0)(0).code)
+
+    def testRepeated(self):
+        ast = self.ast(u'!listing framework/src/kernels/Diffusion.C line=registerMooseObject '
+                       u'link=False')
+        code = ast(0)(0).code
+        self.assertIn(u'registerMooseObject', code)
+
+        ast = self.ast(u'!listing framework/src/kernels/Diffusion.C line=registerMooseObject '
+                       u'link=False indent=2')
+        self.assertEqual(ast(0)(0).code, u'  ' + code)
+
+class TestInputListingTokenize(testing.MooseDocsTestCase):
+    """Test tokenization of InputListingCommand"""
+
+    EXTENSIONS = [core, command, floats, listing]
+
+    def testToken(self):
+        ast = self.ast(u'!listing test/tests/kernels/2d_diffusion/2d_diffusion_test.i '
+                       u'block=Kernels link=False')
+        self.assertIsInstance(ast(0), floats.Float)
+        self.assertIn(u'[Kernels]', ast(0)(0).code)
+        self.assertNotIn(u'[Mesh]', ast(0)(0).code)
+
+    def testMissingBlock(self):
+        ast = self.ast(u'!listing test/tests/kernels/2d_diffusion/2d_diffusion_test.i '
+                       u'block=Wrong link=False')
+        errors = [n for n in ast.children if isinstance(n, tokens.ExceptionToken)]
+        self.assertEqual(len(errors), 1)
+        self.assertIn(u"Unable to find block 'Wrong'", errors[0].message)
+
+class TestCache(unittest.TestCase):
+    """Test that the file content and parsed input files are reused."""
+    def setUp(self):
+        self._tmp = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self._tmp)
+
+    def _write(self, name, content, mtime):
+        filename = os.path.join(self._tmp, name)
+        with open(filename, 'w') as fid:
+            fid.write(content)
+        os.utime(filename, (mtime, mtime))
+        return filename
+
+    def testRead(self):
+        filename = self._write('foo.txt', 'foo', 1)
+        self.assertEqual(common.read(filename, cache=True), u'foo')
+
+        # Content is not read when the modification time is the same
+        self._write('foo.txt', 'bar', 1)
+        self.assertEqual(common.read(filename, cache=True), u'foo')
+        self.assertEqual(common.read(filename), u'bar')
+
+        self._write('foo.txt', 'bar', 2)
+        self.assertEqual(common.read(filename, cache=True), u'bar')
+
+    def testInputBlocks(self):
+        gold = os.path.join(MooseDocs.MOOSE_DIR, 'test', 'tests', 'kernels', 'simple_diffusion',
+                            'simple_diffusion.i')
+        root = mooseutils.hit_load(gold)
+        filename = self._write('input.i', root.render(), 1)
+        func = listing.InputListingCommand.extractInputBlocks
+        for block in ['Kernels', 'Variables/u', 'u', 'BCs/right', 'Outputs']:
+            self.assertEqual(func(filename, block), root.find(block).render())
+
+        self.assertEqual(func(filename, 'Mesh Executioner'),
+                         root.find('Mesh').render() + '\n' + root.find('Executioner').render())
+
+        # Modified file
+        self._write('input.i', '[Kernels]\n  [foo]\n  []\n[]', 2)
+        self.assertIn(u'[foo]', func(filename, 'Kernels'))
+        with self.assertRaisesRegexp(exceptions.TokenizeException, "Unable to find block 'Mesh'"):
+            func(filename, 'Mesh')
+
+    def testRegions(self):
+        filename = self._write('foo.txt', 'foo\nbar', 1)
+        command = listing.FileListingCommand()
+        settings = command.defaultSettings()
+        settings = dict((k, v[0]) for k, v in settings.iteritems())
+        settings['line'] = u'bar'
+        self.assertEqual(command.extractContent(filename, settings), u'bar')
+        count = len(listing._REGIONS)
+
+        # The region of a modified file replaces the stored region
+        self._write('foo.txt', 'foo\nbar2', 2)
+        self.assertEqual(command.extractContent(filename, settings), u'bar2')
+        self.assertEqual(len(listing._REGIONS), count)
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -2,6 +2,7 @@
 #pylint: disable=missing-docstring
 import unittest
 import mock
+import anytree
 
 from MooseDocs.common import exceptions
 from MooseDocs.tree import base
@@ -52,13 +53,64 @@ class TestNodeBase(unittest.TestCase):
         node = base.NodeBase(None)
         self.assertEqual(node.name, 'NodeBase')
 
-    @unittest.skip("Needs work")
     def testParent(self):
         with self.assertRaises(exceptions.MooseDocsException) as e:
             base.NodeBase(parent=42)
         gold = "The supplied parent must be a NodeBase object, but 'int' was provided."
         self.assertEqual(e.exception.message, gold)
 
+    def testParentChange(self):
+        root = base.NodeBase(None)
+        node0 = base.NodeBase(root)
+        node1 = base.NodeBase(root)
+        node2 = base.NodeBase(node0)
+        self.assertEqual(root.children, (node0, node1))
+
+        node2.parent = node1
+        self.assertEqual(node0.children, tuple())
+        self.assertEqual(node1.children, (node2,))
+        self.assertIs(node2.root, root)
+        self.assertEqual(node2.path, (root, node1, node2))
+        self.assertEqual(node2.depth, 2)
+
+        node0.parent = None
+        self.assertEqual(root.children, (node1,))
+        self.assertTrue(node0.is_root)
+
+        with self.assertRaises(exceptions.MooseDocsException) as e:
+            root.parent = node2
+        self.assertIn("creates a loop", e.exception.message)
+
+    def testChildren(self):
+        root = base.NodeBase(None)
+        node0 = base.NodeBase(root)
+        node1 = base.NodeBase(root)
+        other = base.NodeBase(None)
+        other.children = root.children
+        self.assertEqual(root.children, tuple())
+        self.assertEqual(other.children, (node0, node1))
+        self.assertIs(node0.parent, other)
+        self.assertEqual(node0.siblings, (node1,))
+        self.assertEqual(other.descendants, (node0, node1))
+        self.assertEqual([n.name for n in anytree.PreOrderIter(other)], ['NodeBase'] * 3)
+
+    def testSlots(self):
+        class SlotNode(base.NodeBase):
+            __slots__ = ()
+            PROPERTIES = [base.Property('foo', default=1)]
+
+        node = SlotNode(None)
+        self.assertFalse(hasattr(node, '__dict__'))
+        with self.assertRaises(AttributeError):
+            node.bar = 1
+
+        class DictNode(SlotNode):
+            pass
+        node = DictNode(None)
+        node.bar = 1
+        self.assertEqual(node.bar, 1)
+        self.assertEqual(node.foo, 1)
+
 class TestProperty(unittest.TestCase):
     """
     Tests for base.Property() class.
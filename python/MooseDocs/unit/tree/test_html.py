@@ -1,6 +1,9 @@
 #!/usr/bin/env python2
+import os
 import unittest
+import tempfile
 
+from MooseDocs import common
 from MooseDocs.tree import html
 
 class TestHTML(unittest.TestCase):
@@ -29,6 +32,41 @@ class TestHTML(unittest.TestCase):
                "'String'  was provided."
         self.assertEqual(e.exception.message, gold)
 
+    def testIterWrite(self):
+        tag = html.Tag(None, 'div', class_='foo')
+        html.Tag(tag, 'br', close=False)
+        h1 = html.Tag(tag, 'h1', string=u'bar')
+        html.String(h1, content=u'<baz>', escape=True)
+        self.assertEqual(list(tag.iterwrite()),
+                         ['<div class="foo">', '<br>', '<h1>', u'bar', u'&lt;baz&gt;', '</h1>',
+                          '</div>'])
+        self.assertEqual(tag.write(), u'<div class="foo"><br><h1>bar&lt;baz&gt;</h1></div>')
+
+    def testWriteFile(self):
+        tag = html.Tag(None, 'p')
+        for i in range(100):
+            html.Tag(tag, 'span', string=u'\u00e9{}'.format(i))
+
+        filename = tempfile.mkstemp(suffix='.html')[1]
+        self.assertTrue(common.write(filename, tag.iterwrite(), buffer_size=64))
+        self.assertEqual(common.read(filename), tag.write())
+
+        # Unchanged content is not written
+        self.assertFalse(common.write(filename, tag.iterwrite()))
+        self.assertTrue(common.write(filename, tag.write() + u'foo'))
+        self.assertEqual(common.read(filename), tag.write() + u'foo')
+        self.assertEqual(os.listdir(os.path.dirname(filename)).count(os.path.basename(filename)), 1)
+
+        # The temporary file is removed if the content fails
+        def content():
+            yield u'foo'
+            raise ValueError('failed')
+        with self.assertRaises(ValueError):
+            common.write(filename, content())
+        self.assertEqual(common.read(filename), tag.write() + u'foo')
+        self.assertFalse(os.path.exists('{}.{}.tmp'.format(filename, os.getpid())))
+        os.remove(filename)
+
 
 if __name__ == '__main__':
     unittest.main(verbosity=2)
@@ -9,9 +9,8 @@
 
 import platform, os, re
 import subprocess
-from mooseutils import colorText
+from mooseutils import colorText, syntax_dump
 from collections import OrderedDict
-import json
 
 TERM_COLS = int(os.getenv('MOOSE_TERM_COLS', '110'))
 TERM_FORMAT = os.getenv('MOOSE_TERM_FORMAT', 'njcst')
@@ -624,12 +623,9 @@ def addObjectNames(objs, node):
 
 def getExeJSON(exe):
     """
-    Extracts the JSON from the dump
+    Extracts the JSON from the dump, the result is cached (see mooseutils.syntax_dump)
     """
-    output = runCommand("%s --json" % exe)
-    output = output.split('**START JSON DATA**\n')[1]
-    output = output.split('**END JSON DATA**\n')[0]
-    return json.loads(output)
+    return syntax_dump(exe)
 
 def getExeObjects(exe):
     """
@@ -13,12 +13,24 @@ import collections
 import bisect
 import contextlib
 import fcntl
+import threading
+import multiprocessing
+import Queue
+import numpy as np
 import vtk
 
 import mooseutils
 from .. import utils
 from .. import base
 
+#: The FileInformation for each file (by absolute path) that has been read by an ExodusReader, see
+#: ExodusReader.__getFileInformation
+_FILE_INFORMATION = dict()
+
+#: The ExodusII and netCDF libraries are not thread-safe, the vtkExodusIIReader objects are only
+#: updated while holding this lock (see ExodusPrefetcher)
+_VTKREADER_LOCK = threading.Lock()
+
 @contextlib.contextmanager
 def lock_file(filename):
     """
@@ -30,6 +42,353 @@ def lock_file(filename):
         yield
         fcntl.flock(f, fcntl.LOCK_UN)
 
+def _reset_vtkreader_lock():
+    """
+    Create the lock in a forked process, it may have been held by another thread of the parent.
+    """
+    global _VTKREADER_LOCK #pylint: disable=global-statement
+    _VTKREADER_LOCK = threading.Lock()
+
+def update_vtkreader(vtkreader, filename, index, state):
+    """
+    Read a timestep with a vtkExodusIIReader.
+
+    Inputs:
+        vtkreader[vtkExodusIIReader]: The reader to update.
+        filename[str]: The file to read.
+        index[int]: The timestep index within the file.
+        state[tuple]: The displacement, squeeze, block, and variable settings
+                      (see ExodusReader.__getReaderState).
+    """
+    displacements, magnitude, squeeze, blocks, arrays = state
+    vtkreader.SetFileName(None) # http://vtk.1045678.n5.nabble.com/How-to-re-load-time-information-in-ExodusIIReader-tp5741615.html pylint: disable=line-too-long
+    with _VTKREADER_LOCK, lock_file(filename):
+        vtkreader.SetFileName(filename)
+        vtkreader.SetTimeStep(index)
+        vtkreader.UpdateInformation()
+        vtkreader.Modified()
+
+        # Displacement Settings
+        if displacements:
+            vtkreader.ApplyDisplacementsOn()
+            vtkreader.SetDisplacementMagnitude(magnitude)
+        else:
+            vtkreader.ApplyDisplacementsOff()
+
+        # Set the geometric objects to load (i.e., subdomains, nodesets, sidesets)
+        for object_type, object_index, status in blocks:
+            vtkreader.SetObjectStatus(object_type, object_index, status)
+
+        # According to the VTK documentation setting this to False (not the default) speeds
+        # up data loading. In my testing I was seeing load times cut in half or more with
+        # "squeezing" disabled. I am leaving this as an option just in case we discover some
+        # reason it shouldn't be disabled.
+        vtkreader.SetSqueezePoints(squeeze)
+
+        # Set the data arrays to load
+        #
+        # If the object has not been initialized then all of the variables should be enabled
+        # so that the block and variable information are complete when populated. After this
+        # only the variables listed in the 'variables' options, if any, are activated, which
+        # reduces loading times. If 'variables' is not given, all the variables are loaded.
+        for object_type, name, status in arrays:
+            vtkreader.SetObjectArrayStatus(object_type, name, status)
+
+        vtkreader.Update()
+
+def file_key(filename):
+    """
+    Return the size, modified time, and inode of a file, which identify the FileInformation.
+    """
+    stat = os.stat(filename)
+    return (stat.st_size, stat.st_mtime, stat.st_ino)
+
+def read_block_information(vtkreader):
+    """
+    Queries the vtkExodusIIReader object for the subdomain, sideset, nodeset information.
+    """
+    blockinfo = dict()
+
+    # Index to be used with the vtkExtractBlock::AddIndex method
+    index = 0
+
+    # Loop over all blocks of the vtk.MultiBlockDataSet
+    for obj_type in ExodusReader.MULTIBLOCK_INDEX_TO_OBJECTTYPE:
+        index += 1
+        blockinfo[obj_type] = dict()
+        for j in range(vtkreader.GetNumberOfObjects(obj_type)):
+            index += 1
+            name = vtkreader.GetObjectName(obj_type, j)
+            vtkid = str(vtkreader.GetObjectId(obj_type, j))
+            if name.startswith('Unnamed'):
+                name = vtkid
+
+            binfo = ExodusReader.BlockInformation(object_type=obj_type, name=name, number=vtkid,
+                                                  object_index=j, multiblock_index=index)
+            blockinfo[obj_type][vtkid] = binfo
+    return blockinfo
+
+def read_variable_information(vtkreader):
+    """
+    Queries the vtkExodusIIReader for the variable information.
+    """
+    unsorted = dict()
+    for variable_type in ExodusReader.VARIABLE_TYPES:
+        for i in range(vtkreader.GetNumberOfObjectArrays(variable_type)):
+            var_name = vtkreader.GetObjectArrayName(variable_type, i)
+            if var_name is not None:
+                num = vtkreader.GetNumberOfObjectArrayComponents(variable_type, i)
+                vinfo = ExodusReader.VariableInformation(name=var_name,
+                                                         object_type=variable_type,
+                                                         num_components=num)
+                unsorted[var_name] = vinfo
+
+    return collections.OrderedDict(sorted(unsorted.items(), key=lambda x: x[0].lower()))
+
+def read_file_information(filename, vtkreader=None):
+    """
+    Read the time, block, and variable information of an ExodusII file.
+
+    The information is returned as plain python types, so this function may be executed by
+    other processes (see load_file_information) and the result given to store_file_information.
+
+    Inputs:
+        filename[str]: The file to read.
+        vtkreader[vtkExodusIIReader]: The reader to use, if not given a reader is created.
+    """
+    if vtkreader is None:
+        vtkreader = vtk.vtkExodusIIReader()
+
+    key = file_key(filename)
+    with _VTKREADER_LOCK, lock_file(filename):
+        vtkreader.SetFileName(filename)
+        vtkreader.Modified()
+        vtkreader.UpdateInformation()
+
+        vtkinfo = vtkreader.GetExecutive().GetOutputInformation(0)
+        time_key = vtk.vtkStreamingDemandDrivenPipeline.TIME_STEPS()
+        steps = range(vtkreader.GetNumberOfTimeSteps())
+        times = [vtkinfo.Get(time_key, i) for i in steps]
+
+        if not times:
+            times = [None] # When --mesh-only is used, not time information is written
+
+        # The VTK enumerations can not be pickled, so the object types are stored as integers
+        blocks = [tuple(binfo._replace(object_type=int(binfo.object_type))) \
+                  for data in read_block_information(vtkreader).itervalues() \
+                  for binfo in data.itervalues()]
+        variables = [tuple(vinfo._replace(object_type=int(vinfo.object_type))) \
+                     for vinfo in read_variable_information(vtkreader).itervalues()]
+
+    return key, times, blocks, variables
+
+def store_file_information(filename, data):
+    """
+    Create the FileInformation from the data returned by read_file_information and store it for
+    use by all ExodusReader objects.
+
+    Inputs:
+        filename[str]: The file that was read.
+        data[tuple]: The information returned by read_file_information.
+    """
+    key, times, blocks, variables = data
+    enums = {int(obj_type):obj_type for obj_type in ExodusReader.MULTIBLOCK_INDEX_TO_OBJECTTYPE + \
+             ExodusReader.VARIABLE_TYPES}
+
+    blockinfo = {obj_type:dict() for obj_type in ExodusReader.MULTIBLOCK_INDEX_TO_OBJECTTYPE}
+    for item in blocks:
+        binfo = ExodusReader.BlockInformation(*item)
+        binfo = binfo._replace(object_type=enums[binfo.object_type])
+        blockinfo[binfo.object_type][binfo.number] = binfo
+
+    variableinfo = collections.OrderedDict()
+    for item in variables:
+        vinfo = ExodusReader.VariableInformation(*item)
+        variableinfo[vinfo.name] = vinfo._replace(object_type=enums[vinfo.object_type])
+
+    tinfo = ExodusReader.FileInformation(filename=filename, times=times, modified=None, key=key,
+                                         blockinfo=blockinfo, variableinfo=variableinfo)
+    _FILE_INFORMATION[os.path.abspath(filename)] = tinfo
+    return tinfo
+
+def load_file_information(filenames, jobs=1):
+    """
+    Read the information of the supplied files that is not already stored, the files are read by a
+    pool of processes when more than one job is requested (see MultiAppExodusReader).
+
+    Inputs:
+        filenames[list]: The files to read.
+        jobs[int]: The number of processes to use.
+    """
+    filenames = [f for f in filenames if (os.path.abspath(f) not in _FILE_INFORMATION) or \
+                 (_FILE_INFORMATION[os.path.abspath(f)].key != file_key(f))]
+
+    if (jobs > 1) and (len(filenames) > 1):
+        pool = multiprocessing.Pool(min(jobs, len(filenames)), initializer=_reset_vtkreader_lock)
+        try:
+            results = pool.map(read_file_information, filenames)
+        finally:
+            pool.close()
+            pool.join()
+    else:
+        results = [read_file_information(f) for f in filenames]
+
+    for filename, data in zip(filenames, results):
+        store_file_information(filename, data)
+
+def read_global_time_series(filename, variable):
+    """
+    Read the values of a global variable for all timesteps of an ExodusII file.
+
+    The values are read from the "vals_glo_var" netCDF variable, without the mesh. Files that are
+    not netCDF classic files (i.e., netCDF-4) are read with a vtkExodusIIReader that loads only the
+    first subdomain, because VTK stores the global data as field data of the blocks.
+
+    Inputs:
+        filename[str]: The file to read.
+        variable[str]: The global variable name.
+    """
+    with lock_file(filename):
+        try:
+            data = mooseutils.netcdf_read(filename, 'name_glo_var', 'vals_glo_var')
+        except ValueError: # netCDF-4 file
+            data = None
+        if data is not None:
+            return data['vals_glo_var'][:, data['name_glo_var'].index(variable)]
+
+        vtkreader = vtk.vtkExodusIIReader()
+        with _VTKREADER_LOCK:
+            vtkreader.SetFileName(filename)
+            vtkreader.UpdateInformation()
+            for obj_type in ExodusReader.MULTIBLOCK_INDEX_TO_OBJECTTYPE:
+                for i in range(vtkreader.GetNumberOfObjects(obj_type)):
+                    vtkreader.SetObjectStatus(obj_type, i,
+                                              obj_type == ExodusReader.BLOCK and i == 0)
+            vtkreader.SetGlobalResultArrayStatus(variable, 1)
+            vtkreader.Update()
+
+    iterator = vtkreader.GetOutput().NewIterator()
+    iterator.InitTraversal()
+    vtk_array = iterator.GetCurrentDataObject().GetFieldData().GetAbstractArray(variable)
+    return np.array([vtk_array.GetComponent(i, 0) for i in range(vtk_array.GetNumberOfTuples())])
+
+class ExodusPrefetcher(object):
+    """
+    Reads timesteps with a separate vtkExodusIIReader in a background thread, see the ExodusReader
+    'prefetch' option.
+
+    Copies of the data are stored until the memory limit is exceeded, at which point the least
+    recently used data is removed. The thread runs until the stop method is called.
+    """
+    def __init__(self):
+        self.__size = 0                          # memory limit (KB)
+        self.__data = collections.OrderedDict()  # key: (vtkMultiBlockDataSet, memory (KB))
+        self.__pending = set()                   # keys of the timesteps being read
+        self.__condition = threading.Condition()
+        self.__queue = Queue.Queue()
+        self.__thread = None
+
+    def setSize(self, size):
+        """
+        Set the memory limit (KB) for the stored data.
+        """
+        with self.__condition:
+            self.__size = size
+            self.__reduce()
+
+    def get(self, key):
+        """
+        Return the data for the supplied key, None is returned if it does not exist.
+
+        If the data is being read it waits for the read to complete.
+        """
+        with self.__condition:
+            while key in self.__pending:
+                self.__condition.wait()
+            item = self.__data.pop(key, None)
+            if item is None:
+                return None
+            self.__data[key] = item
+            return item[0]
+
+    def prefetch(self, key, filename, index, state):
+        """
+        Read the timestep in the background, see update_vtkreader.
+        """
+        with self.__condition:
+            if (key in self.__data) or (key in self.__pending):
+                return
+            self.__pending.add(key)
+
+        if self.__thread is None:
+            self.__thread = threading.Thread(target=self.__run)
+            self.__thread.daemon = True
+            self.__thread.start()
+        self.__queue.put((key, filename, index, state))
+
+    def stop(self):
+        """
+        Stop the background thread and remove the stored data, the timesteps that have not been
+        read are discarded.
+        """
+        with self.__condition:
+            while True:
+                try:
+                    self.__pending.discard(self.__queue.get_nowait()[0])
+                except Queue.Empty:
+                    break
+            self.__condition.notify_all()
+
+        if self.__thread is not None:
+            self.__queue.put(None)
+            self.__thread.join()
+            self.__thread = None
+
+        with self.__condition:
+            self.__data.clear()
+
+    def __run(self):
+        """
+        Read the requested timesteps until None is received. (private)
+        """
+        vtkreader = vtk.vtkExodusIIReader()
+        observer = ExodusReaderErrorObserver()
+        vtkreader.AddObserver('ErrorEvent', observer)
+        while True:
+            item = self.__queue.get()
+            if item is None:
+                break
+
+            # A failed read is not stored, the timestep is read again by the ExodusReader, which
+            # reports the error
+            key, filename, index, state = item
+            data = None
+            try:
+                if os.path.isfile(filename):
+                    num_errors = len(observer.errors())
+                    update_vtkreader(vtkreader, filename, index, state)
+                    if len(observer.errors()) == num_errors:
+                        data = vtk.vtkMultiBlockDataSet()
+                        data.DeepCopy(vtkreader.GetOutput())
+            except Exception: #pylint: disable=broad-except
+                data = None
+            finally:
+                with self.__condition:
+                    self.__pending.discard(key)
+                    if data is not None:
+                        self.__data[key] = (data, data.GetActualMemorySize())
+                        self.__reduce()
+                    self.__condition.notify_all()
+
+    def __reduce(self):
+        """
+        Remove the least recently used data until the memory limit is satisfied. (private)
+        """
+        total = sum(item[1] for item in self.__data.itervalues())
+        while self.__data and (total > self.__size):
+            _, item = self.__data.popitem(last=False)
+            total -= item[1]
+
 class ExodusReaderErrorObserver(object):
     """
     Observes the errors that occur in ExodusReader.
@@ -67,6 +426,10 @@ class ExodusReader(base.ChiggerObject):
 
     Additionally, it also investigates the modified times of the file(s) so that adaptive files that
     are older do not get loaded with newer data.
+
+    The time, block, and variable information of each file is stored with the size, modified time,
+    and inode of the file and shared by all ExodusReader objects, so the information is only read
+    from files that changed or were created.
     """
 
     # The vtkMultiBlockDataSet stored by vtkExodusIIReader has 8 data blocks, each data block is
@@ -103,7 +466,9 @@ class ExodusReader(base.ChiggerObject):
                                                                    'multiblock_index'])
     VariableInformation = collections.namedtuple('VariableInformation', ['name', 'object_type',
                                                                          'num_components'])
-    FileInformation = collections.namedtuple('FileInformation', ['filename', 'times', 'modified'])
+    FileInformation = collections.namedtuple('FileInformation', ['filename', 'times', 'modified',
+                                                                 'key', 'blockinfo',
+                                                                 'variableinfo'])
     TimeData = collections.namedtuple('TimeData', ['timestep', 'time', 'filename', 'index'])
 
     @staticmethod
@@ -126,10 +491,15 @@ class ExodusReader(base.ChiggerObject):
                 vtype=list)
         opt.add('squeeze', False, "Calls SetSqueezePoints on vtkExodusIIReader, according to the "
                                   "VTK documentation setting this to False should be faster.")
+        opt.add('prefetch', 0, "The amount of memory (MB) for storing timesteps read in the "
+                               "background, when greater than zero the next timestep (or previous "
+                               "when moving backward in time) is read after each update.",
+                vtype=int)
         return opt
 
     def __init__(self, filename, **kwargs):
         super(ExodusReader, self).__init__(**kwargs)
+        self.__prefetcher = None # see 'prefetch' option
 
         # Set the filename for the reader.
         self.__filename = filename
@@ -144,10 +514,19 @@ class ExodusReader(base.ChiggerObject):
         self.__blockinfo = dict() # BlockInformation objects
         self.__variableinfo = collections.OrderedDict() # VariableInformation objects
 
+        # The data for the current timestep, which is either the vtkExodusIIReader output or data
+        # from the ExodusPrefetcher
+        self.__vtkproducer = vtk.vtkTrivialProducer()
+        self.__vtkproducer.SetOutput(self.__vtkreader.GetOutput())
+
         # Error handling
         self._error_observer = ExodusReaderErrorObserver()
         self.__vtkreader.AddObserver('ErrorEvent', self._error_observer)
 
+    def __del__(self):
+        if self.__prefetcher is not None:
+            self.__prefetcher.stop()
+
     def update(self, **kwargs):
         """
         After changing settings and prior to using data accessing methods, this method should be
@@ -165,52 +544,34 @@ class ExodusReader(base.ChiggerObject):
 
         # Initialize the current time data
         self.__initializeTimeInformation()
+        previous = self.__current
         self.__current = self.__getTimeInformation()
-        self.__vtkreader.SetFileName(None) # http://vtk.1045678.n5.nabble.com/How-to-re-load-time-information-in-ExodusIIReader-tp5741615.html pylint: disable=line-too-long
-        with lock_file(self.__current.filename):
-            self.__vtkreader.SetFileName(self.__current.filename)
-            self.__vtkreader.SetTimeStep(self.__current.index)
-            self.__vtkreader.UpdateInformation()
-            self.__vtkreader.Modified()
-
-            # Displacement Settings
-            if self.getOption('displacements'):
-                self.__vtkreader.ApplyDisplacementsOn()
-                self.__vtkreader.SetDisplacementMagnitude(self.getOption('displacement_magnitude'))
-            else:
-                self.__vtkreader.ApplyDisplacementsOff()
-
-            # Set the geometric objects to load (i.e., subdomains, nodesets, sidesets)
-            active_blockinfo = self.__getActiveBlocks()
-            blockinfo = self.getBlockInformation()
-            for object_type in ExodusReader.BLOCK_TYPES:
-                for data in blockinfo[object_type].itervalues():
-                    if (not active_blockinfo) or (data in active_blockinfo):
-                        self.__vtkreader.SetObjectStatus(data.object_type, data.object_index, 1)
-                    else:
-                        self.__vtkreader.SetObjectStatus(data.object_type, data.object_index, 0)
-
-            # According to the VTK documentation setting this to False (not the default) speeds
-            # up data loading. In my testing I was seeing load times cut in half or more with
-            # "squeezing" disabled. I am leaving this as an option just in case we discover some
-            # reason it shouldn't be disabled.
-            self.__vtkreader.SetSqueezePoints(self.getOption('squeeze'))
-
-            # Set the data arrays to load
-            #
-            # If the object has not been initialized then all of the variables should be enabled
-            # so that the block and variable information are complete when populated. After this
-            # only the variables listed in the 'variables' options, if any, are activated, which
-            # reduces loading times. If 'variables' is not given, all the variables are loaded.
-            variables = self.getOption('variables')
-            variable_info = self.getVariableInformation()
-            for vinfo in variable_info.itervalues():
-                if (not variables) or (vinfo.name in variables):
-                    self.__vtkreader.SetObjectArrayStatus(vinfo.object_type, vinfo.name, 1)
-                else:
-                    self.__vtkreader.SetObjectArrayStatus(vinfo.object_type, vinfo.name, 0)
-
-            self.__vtkreader.Update()
+        state = self.__getReaderState()
+
+        # Use the data read by the prefetch thread, if it exists
+        output = None
+        if self.getOption('prefetch'):
+            if self.__prefetcher is None:
+                self.__prefetcher = ExodusPrefetcher()
+            self.__prefetcher.setSize(self.getOption('prefetch') * 1024)
+            output = self.__prefetcher.get(self.__getPrefetchKey(self.__current, state))
+        elif self.__prefetcher is not None:
+            self.__prefetcher.stop()
+            self.__prefetcher = None
+
+        if output is None:
+            update_vtkreader(self.__vtkreader, self.__current.filename, self.__current.index, state)
+            output = self.__vtkreader.GetOutput()
+        self.__vtkproducer.SetOutput(output)
+
+        # Read the next timestep (or previous timestep when moving backward) in the background
+        if self.getOption('prefetch'):
+            step = -1 if previous and (self.__current.timestep < previous.timestep) else 1
+            index = self.__current.timestep + step
+            if 0 <= index < len(self.__timedata):
+                tdata = self.__timedata[index]
+                self.__prefetcher.prefetch(self.__getPrefetchKey(tdata, state), tdata.filename,
+                                           tdata.index, state)
 
     def needsUpdate(self):
         """ Determine the status of the object to indicate if the "update" method should be called.
@@ -247,7 +608,7 @@ class ExodusReader(base.ChiggerObject):
         reader.GetFieldData('Info_Records') """
         self.checkUpdateState()
 
-        field_data = self.__vtkreader.GetOutput().GetBlock(0).GetBlock(0).GetFieldData()
+        field_data = self.__vtkproducer.GetOutputDataObject(0).GetBlock(0).GetBlock(0).GetFieldData()
         varinfo = self.__variableinfo[variable]
 
         if varinfo.object_type != self.GLOBAL:
@@ -257,6 +618,26 @@ class ExodusReader(base.ChiggerObject):
         vtk_array = field_data.GetAbstractArray(variable)
         return vtk_array.GetComponent(self.__current.index, 0)
 
+    def getGlobalTimeSeries(self, variable):
+        """
+        Access the global (i.e., Postprocessor) data for all timesteps. (public)
+
+        The data is read directly from the active file(s) without reading the timesteps, so the
+        "update" method is not required.
+
+        Inputs: variable[str]: An available GLOBAL variable name.
+
+        Returns: numpy.ndarray: The global data for each timestep (see getTimes).
+        """
+        output = []
+        for filename, modified in self.__getActiveFilenames():
+            varinfo = self.__getFileInformation(filename, modified).variableinfo.get(variable)
+            if (varinfo is None) or (varinfo.object_type != self.GLOBAL):
+                msg = 'The variable "{}" must be a global variable.'.format(variable)
+                raise mooseutils.MooseException(msg)
+            output.append(read_global_time_series(filename, variable))
+        return np.concatenate(output)
+
     def getTimeData(self):
         """
         The current time information. (public)
@@ -320,11 +701,47 @@ class ExodusReader(base.ChiggerObject):
         """
         Return the underlying vtkExodusIIReder object. (public)
 
-        Generally, this should not be utilized. This method exists for connecting output ports with
-        the ExodusSource.
+        Generally, this should not be utilized, use getOutputPort to connect to the data.
         """
         return self.__vtkreader
 
+    def getOutputPort(self):
+        """
+        Return the output port containing the data for the current timestep. (public)
+
+        This method exists for connecting output ports with the ExodusSource, the data is either
+        from the vtkExodusIIReader or from the timesteps read in the background ('prefetch').
+        """
+        return self.__vtkproducer.GetOutputPort()
+
+    def __getReaderState(self):
+        """
+        Return the settings for reading the data, see update_vtkreader. (private)
+        """
+        active_blockinfo = self.__getActiveBlocks()
+        blockinfo = self.getBlockInformation()
+        blocks = []
+        for object_type in ExodusReader.BLOCK_TYPES:
+            for data in blockinfo[object_type].itervalues():
+                status = int((not active_blockinfo) or (data in active_blockinfo))
+                blocks.append((data.object_type, data.object_index, status))
+
+        variables = self.getOption('variables')
+        arrays = []
+        for vinfo in self.getVariableInformation().itervalues():
+            status = int((not variables) or (vinfo.name in variables))
+            arrays.append((vinfo.object_type, vinfo.name, status))
+
+        return (self.getOption('displacements'), self.getOption('displacement_magnitude'),
+                self.getOption('squeeze'), tuple(sorted(blocks)), tuple(arrays))
+
+    def __getPrefetchKey(self, tdata, state):
+        """
+        Return the key for the data of a timestep stored by the ExodusPrefetcher. (private)
+        """
+        tinfo = self.__fileinfo[tdata.filename]
+        return (os.path.abspath(tdata.filename), tinfo.key, tdata.index, state)
+
     def __getTimeInformation(self):
         """
         Helper for getting the current TimeData object using the 'time' and 'timestep' options.
@@ -419,27 +836,8 @@ class ExodusReader(base.ChiggerObject):
                 self.__fileinfo.pop(fname)
 
         # Loop through each file and determine the times
-        key = vtk.vtkStreamingDemandDrivenPipeline.TIME_STEPS()
         for filename, current_modified in filenames:
-
-            tinfo = self.__fileinfo.get(filename, None)
-            if tinfo and (tinfo.modified == current_modified):
-                continue
-
-            with lock_file(filename):
-                self.__vtkreader.SetFileName(filename)
-                self.__vtkreader.Modified()
-                self.__vtkreader.UpdateInformation()
-
-                vtkinfo = self.__vtkreader.GetExecutive().GetOutputInformation(0)
-                steps = range(self.__vtkreader.GetNumberOfTimeSteps())
-                times = [vtkinfo.Get(key, i) for i in steps]
-
-                if not times:
-                    times = [None] # When --mesh-only is used, not time information is written
-                self.__fileinfo[filename] = ExodusReader.FileInformation(filename=filename,
-                                                                         times=times,
-                                                                         modified=current_modified)
+            self.__fileinfo[filename] = self.__getFileInformation(filename, current_modified)
 
         # Re-populate the time data
         self.__timedata = []
@@ -451,48 +849,37 @@ class ExodusReader(base.ChiggerObject):
                 self.__timedata.append(tdata)
                 timestep += 1
 
-    def __initializeBlockInformation(self):
+    def __getFileInformation(self, filename, modified):
         """
-        Queries the vtkExodusIIReader object for the subdomain, sideset, nodeset information.
-        (private)
-        """
-        self.__blockinfo = dict()
+        Return the FileInformation for a file, the information is read if the file changed. (private)
 
-        # Index to be used with the vtkExtractBlock::AddIndex method
-        index = 0
+        Inputs:
+            filename[str]: The file to query.
+            modified[float]: The modified time of the file (see utils.get_active_filenames).
+        """
+        tinfo = _FILE_INFORMATION.get(os.path.abspath(filename), None)
+        if (tinfo is None) or (tinfo.key != file_key(filename)):
+            tinfo = store_file_information(filename,
+                                           read_file_information(filename, self.__vtkreader))
+        return tinfo._replace(filename=filename, modified=modified)
 
-        # Loop over all blocks of the vtk.MultiBlockDataSet
-        for obj_type in ExodusReader.MULTIBLOCK_INDEX_TO_OBJECTTYPE:
-            index += 1
-            self.__blockinfo[obj_type] = dict()
-            for j in range(self.__vtkreader.GetNumberOfObjects(obj_type)):
-                index += 1
-                name = self.__vtkreader.GetObjectName(obj_type, j)
-                vtkid = str(self.__vtkreader.GetObjectId(obj_type, j))
-                if name.startswith('Unnamed'):
-                    name = vtkid
-
-                binfo = ExodusReader.BlockInformation(object_type=obj_type, name=name, number=vtkid,
-                                                      object_index=j, multiblock_index=index)
-                self.__blockinfo[obj_type][vtkid] = binfo
+    def __initializeBlockInformation(self):
+        """
+        Set the subdomain, sideset, nodeset information for the current file. (private)
+        """
+        if self.__current is not None:
+            self.__blockinfo = self.__fileinfo[self.__current.filename].blockinfo
+        else:
+            self.__blockinfo = read_block_information(self.__vtkreader)
 
     def __initializeVariableInformation(self):
         """
-        Queries the vtkExodusIIReader for the current time information. (private)
+        Set the variable information for the current file. (private)
         """
-        unsorted = dict()
-        for variable_type in ExodusReader.VARIABLE_TYPES:
-            for i in range(self.__vtkreader.GetNumberOfObjectArrays(variable_type)):
-                var_name = self.__vtkreader.GetObjectArrayName(variable_type, i)
-                if var_name is not None:
-                    num = self.__vtkreader.GetNumberOfObjectArrayComponents(variable_type, i)
-                    vinfo = ExodusReader.VariableInformation(name=var_name,
-                                                             object_type=variable_type,
-                                                             num_components=num)
-                    unsorted[var_name] = vinfo
-
-        self.__variableinfo = collections.OrderedDict(sorted(unsorted.items(),
-                                                             key=lambda x: x[0].lower()))
+        if self.__current is not None:
+            self.__variableinfo = self.__fileinfo[self.__current.filename].variableinfo
+        else:
+            self.__variableinfo = read_variable_information(self.__vtkreader)
 
     def __str__(self):
         """
@@ -71,7 +71,7 @@ class ExodusSource(base.ChiggerSource):
 
         self.__extract_indices = []
         self.__vtkextractblock = vtk.vtkExtractBlock()
-        self.__vtkextractblock.SetInputConnection(self.__reader.getVTKReader().GetOutputPort())
+        self.__vtkextractblock.SetInputConnection(self.__reader.getOutputPort())
 
         self._required_filters = [filters.GeometryFilter()]
 
@@ -9,7 +9,9 @@
 #* https://www.gnu.org/licenses/lgpl-2.1.html
 
 import glob
-from ExodusReader import ExodusReader
+import multiprocessing
+from ExodusReader import ExodusReader, load_file_information
+from .. import utils
 from .. import base
 
 class MultiAppExodusReader(base.ChiggerObject):
@@ -19,9 +21,15 @@ class MultiAppExodusReader(base.ChiggerObject):
     This class is simply a wrapper that creates and ExodusReader object for each file found using
     glob from the supplied pattern.
 
+    The time, block, and variable information of the files is read by a pool of processes when
+    the reader is created and shared with the ExodusReader objects (see ExodusReader.py), which
+    then only need to read the data for the current timestep.
+
     Inputs:
         pattern[str]: A string containing a glob pattern for MultiApp ExodusII output files from
                       MOOSE.
+        jobs[int]: The number of processes used to read the file information, by default the
+                   number of processors.
     """
 
     @staticmethod
@@ -29,13 +37,20 @@ class MultiAppExodusReader(base.ChiggerObject):
         opt = base.ChiggerObject.getOptions()
         return opt
 
-    def __init__(self, pattern, **kwargs):
+    def __init__(self, pattern, jobs=None, **kwargs):
         super(MultiAppExodusReader, self).__init__(**kwargs)
 
         self.__readers = []
-        for filename in glob.glob(pattern):
+        for filename in sorted(glob.glob(pattern)):
             self.__readers.append(ExodusReader(filename, **kwargs))
 
+        # Read the information for all the files, including the adaptive files
+        filenames = []
+        for reader in self.__readers:
+            active = utils.get_active_filenames(reader.filename(), reader.filename() + '-s*')
+            filenames += [filename for filename, _ in active]
+        load_file_information(filenames, jobs or multiprocessing.cpu_count())
+
     def __iter__(self):
         """
         Provide iterator access to the readers.
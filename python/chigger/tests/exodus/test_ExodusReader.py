@@ -13,6 +13,9 @@ import os
 import unittest
 import shutil
 import time
+import threading
+import importlib
+import mock
 import mooseutils
 import chigger
 
@@ -186,8 +189,158 @@ class TestExodusReader(unittest.TestCase):
         shutil.copy(filenames[0], common)
         reader.update()
         self.assertEqual(reader.getVTKReader().GetNumberOfTimeSteps(), 2)
+        os.remove(common)
 
+    def testFileInformation(self):
+        """
+        Test that the file information is shared and only read from changed files.
+        """
+        module = importlib.import_module('chigger.exodus.ExodusReader')
+        testfiles = chigger.utils.copy_adaptive_exodus_test_files('{}_info'.format(self.__class__.__name__))
+        reader = chigger.exodus.ExodusReader(testfiles[0])
+        reader.update()
+        info = [module._FILE_INFORMATION[os.path.abspath(f)] for f in testfiles]
+        self.assertEqual(sum(len(i.times) for i in info), len(reader.getTimes()))
+        self.assertEqual(info[0].variableinfo.keys(), reader.getVariableInformation().keys())
+
+        # Unchanged files are not read
+        other = chigger.exodus.ExodusReader(testfiles[0])
+        other.update()
+        self.assertEqual(other.getTimes(), reader.getTimes())
+        for i, fname in enumerate(testfiles):
+            self.assertIs(module._FILE_INFORMATION[os.path.abspath(fname)], info[i])
+
+        # Only the modified file is read
+        time.sleep(0.1)
+        mooseutils.touch(testfiles[-1])
+        reader.update()
+        for i, fname in enumerate(testfiles[:-1]):
+            self.assertIs(module._FILE_INFORMATION[os.path.abspath(fname)], info[i])
+        self.assertIsNot(module._FILE_INFORMATION[os.path.abspath(testfiles[-1])], info[-1])
+        self.assertEqual(reader.getTimes(), other.getTimes())
+
+        for fname in testfiles:
+            os.remove(fname)
+
+    def testGlobalTimeSeries(self):
+        """
+        Test that the global data for all timesteps matches the data from each timestep.
+        """
+        reader = chigger.exodus.ExodusReader(self.single)
+        series = reader.getGlobalTimeSeries('func_pp')
+        reader.update()
+        self.assertEqual(len(series), len(reader.getTimes()))
+        for i in range(len(series)):
+            reader.update(timestep=i)
+            self.assertEqual(series[i], reader.getGlobalData('func_pp'))
+
+        # Adaptive files
+        reader = chigger.exodus.ExodusReader(self.multiple)
+        reader.update()
+        series = reader.getGlobalTimeSeries('k_eff')
+        self.assertEqual(len(series), len(reader.getTimes()))
+        for i in range(len(series)):
+            reader.update(timestep=i)
+            self.assertEqual(series[i], reader.getGlobalData('k_eff'))
+
+        # VTK is used for files that are not netCDF classic files
+        module = importlib.import_module('chigger.exodus.ExodusReader')
+        expected = chigger.exodus.ExodusReader(self.single).getGlobalTimeSeries('func_pp')
+        with mock.patch('mooseutils.netcdf_read', side_effect=ValueError()):
+            series = module.read_global_time_series(self.single, 'func_pp')
+        self.assertEqual(list(series), list(expected))
+
+        with self.assertRaisesRegexp(mooseutils.MooseException, 'must be a global variable'):
+            reader.getGlobalTimeSeries('phi')
 
+    def testMultiAppFileInformation(self):
+        """
+        Test that the file information for the MultiApp files is read by the pool of processes.
+        """
+        module = importlib.import_module('chigger.exodus.ExodusReader')
+        prefix = '{}_multiapp'.format(self.__class__.__name__)
+        testfiles = []
+        for i in range(5):
+            testfiles.append('{}_sub{}.e'.format(prefix, i))
+            shutil.copyfile(os.path.abspath('../input/multiapps_out_sub{}.e'.format(i)),
+                            testfiles[-1])
+
+        multiapp = chigger.exodus.MultiAppExodusReader(prefix + '_sub*.e', jobs=2)
+        self.assertEqual([r.filename() for r in multiapp], testfiles)
+        info = [module._FILE_INFORMATION[os.path.abspath(f)] for f in testfiles]
+
+        # The information matches the information read by this process and is not read again
+        for i, reader in enumerate(multiapp):
+            data = module.read_file_information(testfiles[i])
+            self.assertEqual(info[i].key, data[0])
+            self.assertEqual(info[i].times, data[1])
+            self.assertEqual([tuple(v) for v in info[i].variableinfo.itervalues()], data[3])
+
+            reader.update()
+            self.assertIs(module._FILE_INFORMATION[os.path.abspath(testfiles[i])], info[i])
+            self.assertEqual(reader.getTimes(), info[i].times)
+            self.assertEqual(reader.getBlockInformation(), info[i].blockinfo)
+            self.assertIn('u', reader.getVariableInformation())
+
+        for fname in testfiles:
+            os.remove(fname)
+
+    def testPrefetch(self):
+        """
+        Test that the timesteps read in the background are used.
+        """
+        reader = chigger.exodus.ExodusReader(self.single, prefetch=10)
+        vtkreader = reader.getVTKReader()
+        gold = [r/10. for r in range(0, 21, 2)]
+
+        # Next timestep is read in the background
+        reader.update(timestep=0)
+        self.assertEqual(vtkreader.GetTimeStep(), 0)
+        reader.update(timestep=1)
+        self.assertEqual(vtkreader.GetTimeStep(), 0)
+        self.assertAlmostEqual(reader.getGlobalData('func_pp'), gold[1])
+        reader.update(timestep=2)
+        self.assertEqual(vtkreader.GetTimeStep(), 0)
+        self.assertAlmostEqual(reader.getGlobalData('func_pp'), gold[2])
+
+        # Previous timestep is read when moving backward
+        reader.update(timestep=8)
+        reader.update(timestep=7)
+        self.assertEqual(vtkreader.GetTimeStep(), 7)
+        reader.update(timestep=6)
+        self.assertEqual(vtkreader.GetTimeStep(), 7)
+        self.assertAlmostEqual(reader.getGlobalData('func_pp'), gold[6])
+
+        # Changing the settings reads the data again
+        reader.update(variables=['func_pp'])
+        self.assertEqual(vtkreader.GetTimeStep(), 6)
+
+    def testPrefetchStop(self):
+        """
+        Test that a failed read in the background does not block and that the thread is stopped.
+        """
+        module = importlib.import_module('chigger.exodus.ExodusReader')
+        count = threading.active_count()
+        prefetcher = module.ExodusPrefetcher()
+        prefetcher.setSize(10 * 1024)
+        with mock.patch.object(module, 'update_vtkreader', side_effect=IOError) as update:
+            prefetcher.prefetch('key', self.single, 0, None)
+            self.assertIsNone(prefetcher.get('key'))
+            self.assertTrue(update.called)
+        self.assertEqual(threading.active_count(), count + 1)
+        prefetcher.stop()
+        self.assertEqual(threading.active_count(), count)
+
+        # Disabling the option or releasing the reader stops the thread
+        reader = chigger.exodus.ExodusReader(self.single, prefetch=10, timestep=0)
+        reader.update()
+        self.assertEqual(threading.active_count(), count + 1)
+        reader.update(prefetch=0)
+        self.assertEqual(threading.active_count(), count)
+        reader.update(prefetch=10, timestep=1)
+        self.assertEqual(threading.active_count(), count + 1)
+        del reader
+        self.assertEqual(threading.active_count(), count)
 
 if __name__ == '__main__':
     unittest.main(module=__name__, verbosity=2)
@@ -0,0 +1,263 @@
+#!/usr/bin/env python2
+#pylint: disable=missing-docstring
+#* This file is part of the MOOSE framework
+#* https://www.mooseframework.org
+#*
+#* All rights reserved, see COPYRIGHT for full restrictions
+#* https://github.com/idaholab/moose/blob/master/COPYRIGHT
+#*
+#* Licensed under LGPL 2.1, please see LICENSE for details
+#* https://www.gnu.org/licenses/lgpl-2.1.html
+"""
+Benchmark suite for chigger, which runs offscreen scenarios with the ExodusII files in the
+tests/input directory and records the wall time and peak memory (RSS) of each sample.
+
+Each sample is executed in a separate process, so the peak memory is that of the scenario. The
+results are added to a JSON history file by revision and compared with the previous revision in the
+history, the time changes are tested with the Mann-Whitney U test (see TestHarness/testers/bench.py)
+and an exit code of 1 is returned when a regression is detected. The time comparison requires
+scipy, without it only the peak memory is compared and an exit code of 1 is returned.
+
+    ./benchmarks.py --list
+    ./benchmarks.py
+    ./benchmarks.py --scenarios open_file step_through --samples 20
+    ./benchmarks.py --compare 2a5f1c9 7e381fa
+"""
+import os
+import sys
+import json
+import time
+import argparse
+import pkgutil
+import resource
+import subprocess
+import collections
+
+import chigger
+from TestHarness.testers.bench import Bench, BenchComp, git_revision
+
+INPUT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'input')
+MUG = os.path.join(INPUT, 'mug_blocks_out.e')
+MULTIAPP = os.path.join(INPUT, 'multiapps_out_sub*.e')
+
+#: The scenarios by name, see scenario
+SCENARIOS = collections.OrderedDict()
+
+def scenario(func):
+    """Decorator for adding a scenario, the docstring is used as the description."""
+    SCENARIOS[func.__name__] = func
+    return func
+
+def create_window(*results):
+    """Return an offscreen RenderWindow for the supplied results."""
+    return chigger.RenderWindow(*results, size=[600, 600], offscreen=True)
+
+@scenario
+def open_file():
+    """Read the information and the last timestep of an ExodusII file."""
+    reader = chigger.exodus.ExodusReader(MUG)
+    reader.update()
+
+@scenario
+def first_render():
+    """Read and render the last timestep."""
+    reader = chigger.exodus.ExodusReader(MUG)
+    result = chigger.exodus.ExodusResult(reader, variable='diffused', cmap='viridis')
+    create_window(result).update()
+
+@scenario
+def step_through():
+    """Render each timestep, from the first to the last."""
+    reader = chigger.exodus.ExodusReader(MUG, timestep=0)
+    result = chigger.exodus.ExodusResult(reader, variable='diffused', cmap='viridis')
+    window = create_window(result)
+    window.update()
+    for timestep in range(1, len(reader.getTimes())):
+        reader.setOptions(timestep=timestep)
+        window.update()
+
+@scenario
+def clip():
+    """Render the last timestep with a PlaneClipper."""
+    reader = chigger.exodus.ExodusReader(MUG)
+    result = chigger.exodus.ExodusResult(reader, variable='diffused', cmap='viridis',
+                                         filters=[chigger.filters.PlaneClipper()])
+    create_window(result).update()
+
+@scenario
+def contour():
+    """Render the last timestep with a ContourFilter."""
+    reader = chigger.exodus.ExodusReader(MUG)
+    result = chigger.exodus.ExodusResult(reader, variable='diffused', cmap='viridis',
+                                         filters=[chigger.filters.ContourFilter(count=10)])
+    create_window(result).update()
+
+@scenario
+def line_sample():
+    """Sample a variable along a line for each timestep."""
+    reader = chigger.exodus.ExodusReader(MUG, timestep=0)
+    result = chigger.exodus.ExodusResult(reader, variable='diffused')
+    result.update()
+    sampler = chigger.exodus.ExodusResultLineSampler(result, point1=(0, 0, -2), point2=(0, 0, 2),
+                                                     resolution=200)
+    for timestep in range(len(reader.getTimes())):
+        reader.setOptions(timestep=timestep)
+        result.update()
+        sampler.update()
+        sampler[0].getSample('diffused')
+
+@scenario
+def multiapp():
+    """Read and render the last timestep of MultiApp files."""
+    reader = chigger.exodus.MultiAppExodusReader(MULTIAPP)
+    result = chigger.exodus.ExodusResult(reader, variable='u', cmap='coolwarm')
+    create_window(result).update()
+
+def command_line_options():
+    parser = argparse.ArgumentParser(description="Benchmark suite for chigger.")
+    parser.add_argument('--scenarios', nargs='+', default=SCENARIOS.keys(),
+                        choices=SCENARIOS.keys(), help="The scenarios to run.")
+    parser.add_argument('--samples', type=int, default=10,
+                        help="The number of samples for each scenario.")
+    parser.add_argument('--history', default=os.getenv('CHIGGER_BENCHMARK_HISTORY',
+                                                       'chigger_benchmarks.json'),
+                        help="The JSON file containing the results for each revision.")
+    parser.add_argument('--revision', default=os.getenv('MOOSE_REVISION', None),
+                        help="The revision for the results, by default the current git revision.")
+    parser.add_argument('--compare', nargs=2, metavar=('OLD', 'NEW'),
+                        help="Compare two revisions in the history without running.")
+    parser.add_argument('--psig', type=float, default=0.01,
+                        help="The p-value for a significant time change.")
+    parser.add_argument('--memory', type=float, default=0.1,
+                        help="The fraction of peak memory increase that is a regression.")
+    parser.add_argument('--list', action='store_true', help="List the scenarios.")
+    parser.add_argument('--sample', choices=SCENARIOS.keys(), help=argparse.SUPPRESS)
+    return parser.parse_args()
+
+def sample(name):
+    """Run a scenario in this process and print the time (sec.) and peak memory (KB) as JSON."""
+    start = time.time()
+    SCENARIOS[name]()
+    elapsed = time.time() - start
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    print json.dumps(dict(time=elapsed, rss=rss))
+
+def run(name, samples):
+    """Run the samples for a scenario, each in a separate process."""
+    times, rss = [], []
+    for _ in range(samples):
+        cmd = [sys.executable, os.path.abspath(__file__), '--sample', name]
+        proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+        stdout, stderr = proc.communicate()
+        if proc.returncode != 0:
+            raise RuntimeError("The '{}' scenario failed:\n{}".format(name, stderr))
+        data = json.loads(stdout.strip().splitlines()[-1])
+        times.append(data['time'])
+        rss.append(data['rss'])
+    return times, rss
+
+def load_history(filename):
+    """Return the list of results in the history file."""
+    if not os.path.exists(filename):
+        return []
+    with open(filename, 'r') as fid:
+        return json.load(fid)
+
+def find(history, revision, name):
+    """Return the latest results for the revision (which may be abbreviated) and scenario."""
+    for entry in reversed(history):
+        if entry['revision'].startswith(revision) and entry['scenario'] == name:
+            return entry
+    return None
+
+def previous(history, revision, name):
+    """Return the latest results for the scenario from a different revision."""
+    for entry in reversed(history):
+        if not entry['revision'].startswith(revision) and entry['scenario'] == name:
+            return entry
+    return None
+
+def has_scipy():
+    """Return True if scipy, which is required by BenchComp for comparing the times, exists."""
+    return pkgutil.find_loader('scipy') is not None
+
+def compare(old, new, psig, memory, times=True):
+    """
+    Print the comparison of the time and peak memory for the results of each scenario, returns the
+    number of regressions. The times are not compared if 'times' is False.
+    """
+    print BenchComp.header(old[0]['revision'], new[0]['revision'])
+    regressions = 0
+    for a, b in zip(old, new):
+        rss_old = sorted(a['rss'])[len(a['rss']) // 2]
+        rss_new = sorted(b['rss'])[len(b['rss']) // 2]
+        rss_change = float(rss_new - rss_old) / rss_old
+
+        flags = []
+        if times:
+            cmp = BenchComp(Bench(a['scenario'], realruns=a['times']),
+                            Bench(b['scenario'], realruns=b['times']), psig=psig)
+            if (cmp.pvalue <= psig) and (cmp.speed_change > 0):
+                flags.append('time')
+        else:
+            cmp = '{:>30s}:   {:^51s}'.format(a['scenario'], 'time not compared')
+        if rss_change > memory:
+            flags.append('memory')
+        regressions += len(flags)
+
+        print '{}   {:+5.1f}% RSS{}'.format(cmp, rss_change * 100,
+                                           '   REGRESSION ({})'.format(', '.join(flags)) \
+                                           if flags else '')
+    print BenchComp.footer()
+    return regressions
+
+def main():
+    opt = command_line_options()
+
+    if opt.sample:
+        sample(opt.sample)
+        return 0
+
+    if opt.list:
+        for name, func in SCENARIOS.iteritems():
+            print '{:>15}: {}'.format(name, func.__doc__)
+        return 0
+
+    history = load_history(opt.history)
+    if opt.compare:
+        pairs = [(find(history, opt.compare[0], name), find(history, opt.compare[1], name)) \
+                 for name in opt.scenarios]
+    else:
+        revision, date = opt.revision, time.time()
+        if revision is None:
+            revision, date = git_revision(os.path.dirname(os.path.abspath(__file__)))
+
+        print 'Running {} samples of each scenario for {}'.format(opt.samples, revision[:12])
+        pairs = []
+        for name in opt.scenarios:
+            times, rss = run(name, opt.samples)
+            entry = dict(revision=revision, date=date, timestamp=time.time(), scenario=name,
+                         samples=opt.samples, times=times, rss=rss)
+            print '  {:>15}: {:.4f} sec. (min), {:.1f} MB (max)'.format(name, min(times),
+                                                                       max(rss) / 1024.)
+            pairs.append((previous(history, revision, name), entry))
+            history.append(entry)
+
+        with open(opt.history, 'w') as fid:
+            json.dump(history, fid, indent=2, sort_keys=True)
+
+    pairs = [(old, new) for old, new in pairs if (old is not None) and (new is not None)]
+    if not pairs:
+        print 'No results to compare in {}.'.format(opt.history)
+        return 0
+
+    times = has_scipy()
+    regressions = compare([p[0] for p in pairs], [p[1] for p in pairs], opt.psig, opt.memory,
+                          times)
+    if not times:
+        print 'ERROR: The time comparison requires scipy, only the peak memory was compared.'
+        return 1
+    return 1 if regressions else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
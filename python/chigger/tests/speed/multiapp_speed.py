@@ -0,0 +1,92 @@
+#!/usr/bin/env python2
+#pylint: disable=missing-docstring
+#* This file is part of the MOOSE framework
+#* https://www.mooseframework.org
+#*
+#* All rights reserved, see COPYRIGHT for full restrictions
+#* https://github.com/idaholab/moose/blob/master/COPYRIGHT
+#*
+#* Licensed under LGPL 2.1, please see LICENSE for details
+#* https://www.gnu.org/licenses/lgpl-2.1.html
+"""
+Benchmark for opening MultiApp and Nemesis file sets with the file information read by a single
+process and by a pool of processes (see MultiAppExodusReader).
+
+The file sets are created by copying the gold files from the MOOSE tests into a temporary
+directory, e.g., 512 sub-application files are created from the files of a MultiApp test.
+
+    ./multiapp_speed.py
+    ./multiapp_speed.py --copies 1024 --jobs 16
+"""
+import os
+import sys
+import time
+import glob
+import shutil
+import tempfile
+import argparse
+import multiprocessing
+import importlib
+import chigger
+
+MOOSE_TESTS = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', '..', '..',
+                           'test', 'tests')
+
+def command_line_options():
+    parser = argparse.ArgumentParser(description="Benchmark for opening MultiApp file sets.")
+    parser.add_argument('--copies', type=int, default=512,
+                        help="The number of files in each file set.")
+    parser.add_argument('--jobs', type=int, default=multiprocessing.cpu_count(),
+                        help="The number of processes for reading the file information.")
+    parser.add_argument('--repeat', type=int, default=3, help="The number of repetitions.")
+    return parser.parse_args()
+
+def create_files(location, copies):
+    """Create the MultiApp and Nemesis file sets, returns the patterns for the readers."""
+    multiapp = sorted(glob.glob(os.path.join(MOOSE_TESTS, 'multiapps', 'transient_multiapp',
+                                             'gold', 'dt_from_multi_out_sub_app*.e')))
+    nemesis = sorted(glob.glob(os.path.join(MOOSE_TESTS, 'mesh', 'nemesis', 'gold', 'out.e.4.*')))
+
+    for i in range(copies):
+        shutil.copy(multiapp[i % len(multiapp)], os.path.join(location, 'sub{:05d}.e'.format(i)))
+        shutil.copy(nemesis[i % len(nemesis)],
+                    os.path.join(location, 'out.e.{}.{:05d}'.format(copies, i)))
+
+    return [(chigger.exodus.MultiAppExodusReader, os.path.join(location, 'sub*.e')),
+            (chigger.exodus.NemesisReader, os.path.join(location, 'out.e.*'))]
+
+def benchmark(cls, pattern, jobs, repeat):
+    """Return the best time for creating and updating the reader."""
+    module = importlib.import_module('chigger.exodus.ExodusReader')
+    times = []
+    for _ in range(repeat):
+        module._FILE_INFORMATION.clear() #pylint: disable=protected-access
+        start = time.time()
+        reader = cls(pattern, jobs=jobs)
+        for sub in reader:
+            sub.update()
+        times.append(time.time() - start)
+    return min(times)
+
+def main():
+    opt = command_line_options()
+
+    location = tempfile.mkdtemp()
+    try:
+        readers = create_files(location, opt.copies)
+        print '{} files per set, {} CPUs (best of {})'.format(opt.copies,
+                                                              multiprocessing.cpu_count(),
+                                                              opt.repeat)
+        print '  {:>20} {:>10} {:>10} {:>10}'.format('reader', 'jobs=1',
+                                                     'jobs={}'.format(opt.jobs), 'speedup')
+        for cls, pattern in readers:
+            serial = benchmark(cls, pattern, 1, opt.repeat)
+            parallel = benchmark(cls, pattern, opt.jobs, opt.repeat)
+            print '  {:>20} {:10.4f} {:10.4f} {:9.1f}x'.format(cls.__name__, serial, parallel,
+                                                               serial / parallel)
+    finally:
+        shutil.rmtree(location)
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
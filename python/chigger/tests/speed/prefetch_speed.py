@@ -0,0 +1,65 @@
+#!/usr/bin/env python2
+#pylint: disable=missing-docstring
+#* This file is part of the MOOSE framework
+#* https://www.mooseframework.org
+#*
+#* All rights reserved, see COPYRIGHT for full restrictions
+#* https://github.com/idaholab/moose/blob/master/COPYRIGHT
+#*
+#* Licensed under LGPL 2.1, please see LICENSE for details
+#* https://www.gnu.org/licenses/lgpl-2.1.html
+"""
+Benchmark for the latency of stepping through the timesteps of an ExodusII file with and without
+the background reading of timesteps (see the ExodusReader 'prefetch' option).
+
+The delay is the time between steps (e.g., rendering or a user pressing a button).
+
+    ./prefetch_speed.py
+    ./prefetch_speed.py --filename ~/projects/app/output_out.e --delay 0.1
+"""
+import os
+import sys
+import time
+import argparse
+import chigger
+
+def command_line_options():
+    default = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'input',
+                           'mug_blocks_out.e')
+    parser = argparse.ArgumentParser(description="Benchmark for stepping through timesteps.")
+    parser.add_argument('--filename', default=default, help="The ExodusII file to read.")
+    parser.add_argument('--delay', type=float, default=0.05,
+                        help="The time (sec.) between timesteps.")
+    parser.add_argument('--prefetch', type=int, default=256,
+                        help="The memory (MB) for the timesteps read in the background.")
+    return parser.parse_args()
+
+def step(filename, delay, prefetch):
+    """Step forward then backward through all timesteps, returns the update times."""
+    reader = chigger.exodus.ExodusReader(filename, prefetch=prefetch)
+    reader.update()
+    n = len(reader.getTimes())
+
+    times = []
+    for timestep in range(n) + range(n - 2, -1, -1):
+        start = time.time()
+        reader.update(timestep=timestep)
+        times.append(time.time() - start)
+        time.sleep(delay)
+    return times
+
+def main():
+    opt = command_line_options()
+
+    print '{} ({:.1f} MB), {} sec. between steps'.format(os.path.basename(opt.filename),
+                                                         os.path.getsize(opt.filename) / 1024.**2,
+                                                         opt.delay)
+    print '  {:>10} {:>10} {:>10} {:>10}'.format('prefetch', 'mean', 'max', 'total')
+    for prefetch in [0, opt.prefetch]:
+        times = step(opt.filename, opt.delay, prefetch)
+        print '  {:>10} {:10.4f} {:10.4f} {:10.4f}'.format(prefetch, sum(times) / len(times),
+                                                            max(times), sum(times))
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
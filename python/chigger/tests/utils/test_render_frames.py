@@ -0,0 +1,94 @@
+#!/usr/bin/env python2
+#pylint: disable=missing-docstring
+#* This file is part of the MOOSE framework
+#* https://www.mooseframework.org
+#*
+#* All rights reserved, see COPYRIGHT for full restrictions
+#* https://github.com/idaholab/moose/blob/master/COPYRIGHT
+#*
+#* Licensed under LGPL 2.1, please see LICENSE for details
+#* https://www.gnu.org/licenses/lgpl-2.1.html
+
+import os
+import unittest
+import mock
+import vtk
+from vtk.util import numpy_support
+import numpy as np
+import mooseutils
+import chigger
+
+def create_reader():
+    """
+    Create the reader for rendering the images.
+    """
+    return chigger.exodus.ExodusReader(os.path.abspath('../input/mug_blocks_out.e'))
+
+def create_window(reader):
+    """
+    Create the scene for rendering the images.
+    """
+    mug = chigger.exodus.ExodusResult(reader, variable='diffused', cmap='viridis', range=[0, 2])
+    return chigger.RenderWindow(mug, size=[300, 300], test=True)
+
+def read_image(filename):
+    """
+    Return the pixel data of an image.
+    """
+    reader = vtk.vtkPNGReader()
+    reader.SetFileName(filename)
+    reader.Update()
+    return numpy_support.vtk_to_numpy(reader.GetOutput().GetPointData().GetScalars())
+
+class TestRenderFrames(unittest.TestCase):
+    def setUp(self):
+        self._images = []
+
+    def tearDown(self):
+        for filename in self._images:
+            if os.path.exists(filename):
+                os.remove(filename)
+
+    def testParallel(self):
+        """
+        Test that the images rendered by the processes match the serial images.
+        """
+        serial = chigger.utils.render_frames(create_reader, create_window, 'serial_{:02d}.png',
+                                             num_processes=1)
+        self._images += serial
+        parallel = chigger.utils.render_frames(create_reader, create_window,
+                                               'parallel_{:02d}.png', num_processes=3)
+        self._images += parallel
+
+        self.assertEqual(len(serial), 21)
+        self.assertEqual(parallel, ['parallel_{:02d}.png'.format(i) for i in range(21)])
+        for a, b in zip(serial, parallel):
+            self.assertTrue(np.array_equal(read_image(a), read_image(b)), b)
+
+    def testTimesteps(self):
+        """
+        Test that only the supplied timesteps are rendered.
+        """
+        images = chigger.utils.render_frames(create_reader, create_window, 'steps_{:02d}.png',
+                                             timesteps=[2, 4, 6], num_processes=2)
+        self._images += images
+        self.assertEqual(images, ['steps_02.png', 'steps_04.png', 'steps_06.png'])
+        self.assertEqual(len([f for f in os.listdir('.') if f.startswith('steps_')]), 3)
+
+    def testEncoderError(self):
+        """
+        Test that an error is raised when ffmpeg fails.
+        """
+        self._images += ['movie_00.png', 'movie_01.png']
+        with mock.patch('subprocess.Popen') as popen:
+            popen.return_value.returncode = 1
+            with self.assertRaises(mooseutils.MooseException) as e:
+                chigger.utils.render_frames(create_reader, create_window, 'movie_{:02d}.png',
+                                            timesteps=[0, 1], num_processes=1,
+                                            movie='movie.mp4')
+        self.assertIn("Failed to create the movie 'movie.mp4', ffmpeg returned 1.",
+                      str(e.exception))
+        self.assertEqual(popen.return_value.stdin.close.call_count, 1)
+
+if __name__ == '__main__':
+    unittest.main(module=__name__, verbosity=2)
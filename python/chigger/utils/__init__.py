@@ -12,6 +12,8 @@ import os
 import glob
 import shutil
 import subprocess
+import itertools
+import multiprocessing
 import numpy as np
 import vtk
 import mooseutils
@@ -185,3 +187,120 @@ def img2mov(pattern, output, ffmpeg='ffmpeg', duration=60, framerate=None, bitra
     print '{0}\n{1}\n{0}'.format('-'*(len(c)), c)
     if not dry_run:
         subprocess.call(cmd)
+
+#: The RenderWindow and readers for the process rendering images, see render_frames
+_FRAME_SCENE = dict()
+
+def _create_frame_readers(create_readers):
+    """
+    Create the list of readers with the function supplied to render_frames.
+    """
+    readers = create_readers()
+    if not isinstance(readers, (list, tuple)):
+        readers = [readers]
+    return readers
+
+def _create_frame_scene(create_readers, create_window, readers=None):
+    """
+    Create the offscreen RenderWindow and, if not supplied, the readers with the functions supplied
+    to render_frames.
+    """
+    if readers is None:
+        readers = _create_frame_readers(create_readers)
+    window = create_window(*readers)
+    window.setOptions(offscreen=True)
+    _FRAME_SCENE['window'] = window
+    _FRAME_SCENE['readers'] = readers
+
+def _render_frame(frame):
+    """
+    Render a timestep of the current scene to an image, returns the image filename.
+    """
+    timestep, filename = frame
+    for reader in _FRAME_SCENE['readers']:
+        reader.setOptions(timestep=timestep)
+    _FRAME_SCENE['window'].write(filename)
+    return filename
+
+def render_frames(create_readers, create_window, filename, timesteps=None, num_processes=None,
+                  movie=None, ffmpeg='ffmpeg', duration=60, framerate=None, bitrate='10M',
+                  quality=1):
+    """
+    Render the timesteps of a scene to images using a pool of processes and, optionally, encode
+    the images to a movie with ffmpeg.
+
+    Each process creates the scene with an offscreen RenderWindow and renders contiguous ranges of
+    timesteps in order, this process only creates the readers for determining the timesteps. The
+    images are returned in timestep order as they are completed, so they are streamed to ffmpeg
+    while the remaining timesteps are rendered.
+
+    Args:
+        create_readers[function]: A module level function, without arguments, that returns the
+                                  reader (or list of readers) for the scene.
+        create_window[function]: A module level function that returns the RenderWindow for the
+                                 scene, the readers are the arguments.
+        filename[str]: The image filename with a format field for the timestep (e.g.,
+                       'frame_{:04d}.png').
+        timesteps[list]: The timesteps to render, by default all timesteps of the first reader.
+        num_processes[int]: The number of processes, by default the number of processors.
+        movie[str]: The name of the movie to create, including the extension.
+        ffmpeg, duration, framerate, bitrate, quality: The ffmpeg settings (see img2mov).
+
+    Returns:
+        list: The image filenames in timestep order.
+
+    Raises:
+        MooseException: If ffmpeg fails to encode the movie.
+    """
+    readers = _create_frame_readers(create_readers)
+    if timesteps is None:
+        readers[0].update()
+        timesteps = range(len(readers[0].getTimes()))
+    frames = [(timestep, filename.format(timestep)) for timestep in timesteps]
+    num_processes = min(num_processes or multiprocessing.cpu_count(), len(frames))
+
+    encoder = None
+    if movie:
+        if not framerate:
+            framerate = max(len(frames) / float(duration), 1)
+        cmd = [ffmpeg, '-y', '-f', 'image2pipe', '-framerate', str(framerate), '-i', '-']
+        cmd += ['-b:v', bitrate, '-pix_fmt', 'yuv420p', '-q:v', str(quality), movie]
+        c = ' '.join(cmd)
+        print '{0}\n{1}\n{0}'.format('-'*(len(c)), c)
+        encoder = subprocess.Popen(cmd, stdin=subprocess.PIPE)
+
+    # Several chunks per process, so the first images are available to the encoder early
+    pool = None
+    if num_processes > 1:
+        pool = multiprocessing.Pool(num_processes, _create_frame_scene,
+                                    (create_readers, create_window))
+        images = pool.imap(_render_frame, frames, max(len(frames) // (4 * num_processes), 1))
+    else:
+        _create_frame_scene(create_readers, create_window, readers)
+        images = itertools.imap(_render_frame, frames)
+
+    output = []
+    complete = False
+    try:
+        for image in images:
+            output.append(image)
+            if encoder:
+                with open(image, 'rb') as fid:
+                    encoder.stdin.write(fid.read())
+        complete = True
+    finally:
+        if pool:
+            if complete:
+                pool.close()
+            else:
+                pool.terminate()
+            pool.join()
+        _FRAME_SCENE.clear()
+        if encoder:
+            encoder.stdin.close()
+            encoder.wait()
+
+    if encoder and encoder.returncode:
+        raise mooseutils.MooseException("Failed to create the movie '{}', ffmpeg returned {}."
+                                        .format(movie, encoder.returncode))
+    return output
@@ -8,6 +8,7 @@
 #* https://www.gnu.org/licenses/lgpl-2.1.html
 
 import os
+import io
 import pandas
 
 import message
@@ -18,6 +19,9 @@ class MooseDataFrame(object):
 
     This utilizes a pandas.DataFrame for storing and accessing CSV data, while
     allowing for the file to exist/not-exist.
+
+    The position of the last complete line read and the header are stored, so when the file
+    grows only the appended rows are read (see update).
     """
 
     NOCHANGE = 0
@@ -32,6 +36,10 @@ class MooseDataFrame(object):
         self.data = pandas.DataFrame()
         self._index = index
         self._run_start_time = run_start_time
+        self._header = None    # the first line of the file (including the newline)
+        self._columns = None   # column names from the header
+        self._offset = 0       # position after the last complete line that was read
+        self._partial = False  # True if the last row of data is from an incomplete line
         self.update()
 
     def __getitem__(self, key):
@@ -63,10 +71,17 @@ class MooseDataFrame(object):
         """
         self.modified = None
         self.data = pandas.DataFrame()
+        self._header = None
+        self._columns = None
+        self._offset = 0
+        self._partial = False
 
     def update(self):
         """
         Update with new data.
+
+        If the file was modified only the rows after the previously read data are read and
+        appended, the complete file is read if the file is smaller or the header changed.
         """
         retcode = MooseDataFrame.NOCHANGE
 
@@ -87,12 +102,55 @@ class MooseDataFrame(object):
                 retcode = MooseDataFrame.UPDATED
                 try:
                     self.modified = modified
-                    self.data = pandas.read_csv(self.filename)
-                    if self._index:
-                        self.data.set_index(self._index, inplace=True)
+                    if not self._append():
+                        self._read()
                     message.mooseDebug("Reading csv file: {}".format(self.filename))
                 except:
                     self.clear()
                     message.mooseDebug("Unable to read file {} it likely does not contain data.".format(self.filename))
 
         return retcode
+
+    def _read(self):
+        """
+        Read the complete file.
+        """
+        with open(self.filename, 'rb') as fid:
+            content = fid.read()
+
+        self.data = pandas.read_csv(io.BytesIO(content))
+        self._header = content[:content.find('\n') + 1]
+        self._columns = list(self.data.columns)
+        self._offset = content.rfind('\n') + 1
+        self._partial = self._offset < len(content.rstrip())
+        if self._index:
+            self.data.set_index(self._index, inplace=True)
+
+    def _append(self):
+        """
+        Read the rows appended to the file, returns False if the complete file must be read.
+        """
+        if (not self._header) or (os.path.getsize(self.filename) < self._offset):
+            return False
+
+        with open(self.filename, 'rb') as fid:
+            if fid.readline() != self._header:
+                return False
+            fid.seek(self._offset)
+            content = fid.read()
+
+        # The row from an incomplete line is removed, it is read again with the new content
+        data = self.data
+        if content.strip():
+            if self._partial:
+                data = data.iloc[:-1]
+            new = pandas.read_csv(io.BytesIO(content), header=None, names=self._columns)
+            if self._index:
+                new.set_index(self._index, inplace=True)
+            data = pandas.concat([data, new], ignore_index=not self._index)
+
+        end = content.rfind('\n') + 1
+        self._offset += end
+        self._partial = end < len(content.rstrip())
+        self.data = data
+        return True
@@ -8,9 +8,11 @@
 #* https://www.gnu.org/licenses/lgpl-2.1.html
 
 import os
+import csv
 import glob
 import pandas
 import bisect
+import collections
 
 from MooseDataFrame import MooseDataFrame
 import message
@@ -21,6 +23,7 @@ class VectorPostprocessorReader(object):
 
     Args:
        pattern[str]: A pattern of files (for use with glob) for loading.
+       cache_size[int]: The maximum number of timesteps to keep in memory.
 
     MOOSE outputs VectorPostprocessor data in separate files for each timestep, using the timestep as a prefix. For
     example: file_000.csv, file_001.csv, etc.
@@ -30,6 +33,11 @@ class VectorPostprocessorReader(object):
 
     This object manages the loading and unloading of data and should always be in a valid state, regardless of the
     existence of a file. It will also append new data and remove old/deleted data on subsequent calls to "update()".
+
+    A file is not read until the data for the time is requested, the data is stored as a numpy record array and only
+    the most recently used timesteps are kept (see "load"). Calls to "update()" only check the modified time of the
+    files, so runs with many timesteps open without reading every file. The column names are read from the header of
+    each file, which is also done without reading the data.
     """
 
     #: Status flags for loading/reloading/removing csv files (see "_modified").
@@ -37,14 +45,22 @@ class VectorPostprocessorReader(object):
     NEW_DATA = 1
     OLD_DATA = 2
 
-    def __init__(self, pattern, run_start_time=None):
+    #: The name of the column containing the row index, which is added to the data of each file.
+    INDEX = 'index (Peacock)'
+
+    def __init__(self, pattern, run_start_time=None, cache_size=100):
 
         self.filename = pattern
         self._timedata = MooseDataFrame(self.filename.replace('*', 'time'), run_start_time=None, index='timestep')
 
         self._modified_times = dict()
         #self._run_start_time = run_start_time
-        self.data = pandas.Panel()
+        self._cache_size = cache_size
+        self._cache = collections.OrderedDict() # filename: numpy.recarray, least recently used first
+        self._headers = dict()                  # filename: column names
+        self._files = dict()                    # time: filename
+        self._times = []                        # sorted times
+        self._timesteps = dict()                # timestep: time, from the "_time.csv" file
         self.update()
 
         self._minimum_modified = 0.0#self._run_start_time if self._run_start_time else 0.0
@@ -61,28 +77,27 @@ class VectorPostprocessorReader(object):
                           less than the provided time is returned, when false an empty DataFrame is returned.
         """
 
-        # Return the latest time
-        if time == None:
-            return self.data.iloc[-1][keys]
+        # No data
+        if not self._times:
+            return pandas.DataFrame()
 
-        # Return the specified time
-        elif time in self.data.keys().values:
-            return self.data[time][keys]
+        # Return the latest time
+        elif time == None:
+            time = self._times[-1]
 
         # Time not found and 'exact=True'
-        elif exact:
-           return pandas.DataFrame()
+        elif (time not in self._files) and exact:
+            return pandas.DataFrame()
 
         # Time not found and 'exact=False'
-        else:
-            times = self.data.keys()
-            n = len(times)
-            idx = bisect.bisect_right(times, time) - 1
-            if idx < 0:
-                idx = 0
-            elif idx > n:
-                idx = -1
-            return self.data.iloc[idx][keys]
+        elif time not in self._files:
+            idx = bisect.bisect_right(self._times, time) - 1
+            time = self._times[max(idx, 0)]
+
+        data = self.load(time)
+        if data is None:
+            return pandas.DataFrame()
+        return pandas.DataFrame.from_records(data)[keys]
 
 
     def __getitem__(self, key):
@@ -95,11 +110,21 @@ class VectorPostprocessorReader(object):
         Returns:
             pandas.DataFrame containing the data for all available times (column).
 
+        Data already in memory is used, otherwise only the requested column is read from each file. The files read
+        are not added to the memory cache, so every call reads the column from all times that are not in memory.
         """
-        if self.data.empty:
-            return pandas.DataFrame()
-        else:
-            return self.data.minor_xs(key)
+        columns = collections.OrderedDict()
+        for time in self._times:
+            filename = self._files[time]
+            data = self._cache.get(filename, None)
+            if data is not None:
+                if key in data.dtype.names:
+                    columns[time] = pandas.Series(data[key])
+            elif key == self.INDEX or key in self._header(filename):
+                column = self._readColumn(filename, key)
+                if column is not None:
+                    columns[time] = column
+        return pandas.DataFrame(columns)
 
     def __nonzero__(self):
         """
@@ -110,7 +135,7 @@ class VectorPostprocessorReader(object):
             if not data:
                 print 'No data found!'
         """
-        return not self.data.empty
+        return bool(self._times)
 
     def __contains__(self, variable):
         """
@@ -122,25 +147,67 @@ class VectorPostprocessorReader(object):
         """
         Returns the list of available time indices contained in the data.
         """
-        return list(self.data.keys().values)
+        return list(self._times)
 
     def clear(self):
         """
         Remove all data.
         """
-        self.data = pandas.Panel()
+        self._cache.clear()
+        self._headers = dict()
+        self._files = dict()
+        self._times = []
         self._modified_times = dict()
         self._minimum_modified = 0.0# self._run_start_time if self._run_start_time else 0.0
 
     def variables(self):
         """
         Return a list of postprocessor variable names listed in the reader.
+
+        The names are the union of the columns of all times, which are read from the file headers.
+        """
+        if not self._times:
+            return []
+
+        names = [self.INDEX]
+        for time in self._times:
+            for name in self._header(self._files[time]):
+                if name not in names:
+                    names.append(name)
+        return names
+
+    def load(self, time):
+        """
+        Return the data for a time as a numpy record array, None is returned if the file failed to load.
+
+        The data is read from the file if it is not in memory. When more than 'cache_size' timesteps are in memory
+        the least recently used data is removed.
+
+        Args:
+            time[float]: The time, which must be one of the values returned by "times()".
         """
-        return self.data.axes[2]
+        filename = self._files[time]
+        data = self._cache.pop(filename, None)
+        if data is None:
+            try:
+                df = pandas.read_csv(filename)
+            except:
+                message.mooseWarning('The file {} failed to load, it is likely empty.'.format(filename))
+                return None
+
+            df.insert(0, self.INDEX, pandas.Series(df.index, index=df.index))
+            data = df.to_records(index=False)
+
+        self._cache[filename] = data
+        while len(self._cache) > self._cache_size:
+            self._cache.popitem(last=False)
+        return data
 
     def update(self):
         """
         Update data by adding/removing files.
+
+        Only the list of files is updated, the data of new or modified files is read when requested.
         """
 
         # Return code (1 = something changed)
@@ -148,6 +215,10 @@ class VectorPostprocessorReader(object):
 
         # Update the time data file
         self._timedata.update()
+        if self._timedata:
+            self._timesteps = dict(zip(self._timedata.data.index, self._timedata['time']))
+        else:
+            self._timesteps = dict()
 
         # The current filenames, time index, and modified status
         filenames, indices, modified = self._filenames()
@@ -158,33 +229,37 @@ class VectorPostprocessorReader(object):
             return 1
 
         # Loop through the filenames
+        files = dict()
         for fname, index, mod in zip(filenames, indices, modified):
 
-            if mod == VectorPostprocessorReader.NEW_DATA:
+            if mod == VectorPostprocessorReader.OLD_DATA:
+                continue
 
-                try:
-                    df = pandas.read_csv(fname)
-                except:
-                    message.mooseWarning('The file {} failed to load, it is likely empty.'.format(fname))
-                    continue
+            # Empty files are checked again on the next update
+            elif os.path.getsize(fname) == 0:
+                self._modified_times.pop(fname, None)
+                continue
 
-                df.insert(0, 'index (Peacock)', pandas.Series(df.index, index=df.index))
-                if self.data.empty:
-                    self.data = pandas.Panel({index:df})
-                else:
-                    self.data[index] = df
-                retcode = 1
-
-            elif (mod == VectorPostprocessorReader.OLD_DATA) and (index in self.data.keys()):
-                self.data.pop(index)
-                retcode = 1
-
-        # Remove missing files
-        for key in self.data.keys():
-            if key not in indices:
-                self.data.pop(key)
+            elif mod == VectorPostprocessorReader.NEW_DATA:
+                self._cache.pop(fname, None)
+                self._headers.pop(fname, None)
                 retcode = 1
 
+            files[index] = fname
+
+        # Removed files or changed times
+        if files != self._files:
+            retcode = 1
+            current = set(files.itervalues())
+            for fname in self._cache.keys():
+                if fname not in current:
+                    self._cache.pop(fname)
+            for fname in self._headers.keys():
+                if fname not in current:
+                    self._headers.pop(fname)
+
+        self._files = files
+        self._times = sorted(files.keys())
         return retcode
 
     def repr(self):
@@ -201,6 +276,28 @@ class VectorPostprocessorReader(object):
         return output, imports
 
 
+    def _header(self, filename):
+        """
+        Return the column names of a file, only the first line of the file is read. (protected)
+        """
+        if filename not in self._headers:
+            with open(filename, 'r') as fid:
+                row = next(csv.reader(fid), [])
+            self._headers[filename] = row
+        return self._headers[filename]
+
+    def _readColumn(self, filename, key):
+        """
+        Return a single column of a file as a pandas.Series, None is returned if the file failed to load. (protected)
+        """
+        index = key == self.INDEX
+        try:
+            df = pandas.read_csv(filename, usecols=[0 if index else key])
+        except:
+            message.mooseWarning('The file {} failed to load, it is likely empty.'.format(filename))
+            return None
+        return pandas.Series(df.index) if index else pandas.Series(df[key].values)
+
     def _filenames(self):
         """
         Returns the available filenames, time index, and modified status. (protected)
@@ -253,10 +350,4 @@ class VectorPostprocessorReader(object):
 
         idx = filename.rfind('_') + 1
         tstep = int(filename[idx:-4])
-        if not self._timedata:
-            return tstep
-        else:
-            try:
-                return self._timedata['time'].loc[tstep]
-            except Exception:
-                return tstep
+        return self._timesteps.get(tstep, tstep)
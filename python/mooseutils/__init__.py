@@ -11,15 +11,18 @@ from mooseutils import colorText, str2bool, find_moose_executable, runExe, check
 from mooseutils import touch, unique_list, gold, make_chunks, check_file_size, camel_to_space
 from mooseutils import text_diff, git_ls_files, git_root_dir, unidiff, text_unidiff
 from message import mooseDebug, mooseWarning, mooseMessage, mooseError
-from hit_load import hit_load, HitNode, hit_parse
+from hit_load import hit_load, HitNode, hit_parse, clear_hit_cache
 from MooseException import MooseException
 from hit_load import hit_load
 from eval_path import eval_path
+from syntax_dump import syntax_dump, clear_syntax_cache
+from spec_reader import read_spec, read_specs, hit_load_many
 
 try:
     from MooseDataFrame import MooseDataFrame
     from PostprocessorReader import PostprocessorReader
     from VectorPostprocessorReader import VectorPostprocessorReader
+    from netcdf import netcdf_read
 except:
     pass
 
@@ -3,6 +3,9 @@ import os
 import hit
 import message
 
+#: In memory storage of the trees created by hit_load, see the 'cache' option
+_TREES = dict()
+
 # The 'HitNode' object is used within the TestHarness, which should operate without any
 # special python libraries. However, the 'anytree' package is used by various utilities within the
 # moose/python tools (e.g., MooseDocs). It is useful to have this hit wrapper use the anytree
@@ -35,13 +38,53 @@ except ImportError:
 class HitNode(NodeMixin):
     """
     An anytree.Node object for building a hit tree.
+
+    The root node stores an index of the complete paths of all nodes (in pre-order), which is
+    created when first needed by find or findall and removed when a node is added or removed
+    from the tree. The index position of each node and the end of its sub-tree are stored on the
+    node, so the searches from any node use the index of the root.
     """
     def __init__(self, parent=None, hitnode=None):
         super(HitNode, self).__init__()
+        self.__index = None          # (paths, nodes, lookup), see __getIndex
+        self.__begin = 0             # index position of this node
+        self.__end = 0               # index position after the last node of the sub-tree
         self.name = hitnode.path()   # anytree.Node property
         self.parent = parent         # anytree.Node property
         self.__hitnode = hitnode     # hit.Node object
 
+    def _post_attach(self, parent):
+        """Remove the index of the tree when this node is added (anytree.NodeMixin callback)."""
+        self.__index = None
+        parent.root.__index = None
+
+    def _post_detach(self, parent):
+        """Remove the index of the tree when this node is removed (anytree.NodeMixin callback)."""
+        self.__index = None
+        parent.root.__index = None
+
+    def __getIndex(self):
+        """
+        Return the index of the tree containing this node, the index is created if needed.
+
+        The index contains the complete paths and nodes in pre-order as well as a dict() of the
+        index positions for each path.
+        """
+        root = self.root
+        if root.__index is None:
+            paths, nodes, lookup = [], [], dict()
+            def build(node, path):
+                node.__begin = len(nodes)
+                lookup.setdefault(path, []).append(len(nodes))
+                paths.append(path)
+                nodes.append(node)
+                for child in node.children:
+                    build(child, '{}/{}'.format(path, child.name))
+                node.__end = len(nodes)
+            build(root, root.name)
+            root.__index = (paths, nodes, lookup)
+        return root.__index
+
     @property
     def line(self):
         """
@@ -72,9 +115,15 @@ class HitNode(NodeMixin):
                          must match exact.
         """
         if HAVE_ANYTREE:
-            for node in anytree.PreOrderIter(self):
-                if (fuzzy and name in node.fullpath) or (not fuzzy and name == node.fullpath):
-                    return node
+            paths, nodes, lookup = self.__getIndex()
+            if not fuzzy:
+                for i in lookup.get(name, []):
+                    if self.__begin <= i < self.__end:
+                        return nodes[i]
+            else:
+                for i in xrange(self.__begin, self.__end):
+                    if name in paths[i]:
+                        return nodes[i]
         else:
             msg = "The 'find' method requires the 'anytree' python package. This can " \
                   "be installed via your python package manager (e.g., pip install anytree --user)."
@@ -91,8 +140,11 @@ class HitNode(NodeMixin):
                          must match exact.
         """
         if HAVE_ANYTREE:
-            filter_ = lambda n: (fuzzy and name in n.name) or (not fuzzy and n.name == name)
-            return [node for node in anytree.PreOrderIter(self, filter_=filter_)]
+            _, nodes, _ = self.__getIndex()
+            nodes = nodes[self.__begin:self.__end]
+            if fuzzy:
+                return [node for node in nodes if name in node.name]
+            return [node for node in nodes if name == node.name]
         else:
             msg = "The 'findall' method requires the 'anytree' python package. This can " \
                   "be installed via your python package manager (e.g., pip install anytree --user)."
@@ -165,16 +217,27 @@ class HitNode(NodeMixin):
             return str(anytree.RenderTree(self))
         return self.__class__
 
-def hit_load(filename):
+def hit_load(filename, cache=False):
     """
     Read and parse a hit file (MOOSE input file format).
 
     Inputs:
         filename[str]: The filename to open and parse.
+        cache[bool]: When True the tree is stored in memory with the file modification time and
+                     returned by subsequent calls until the file changes. The returned tree is
+                     shared, so it should not be modified.
 
     Returns a HitNode object, which is the root of the tree. HitNode objects are custom
     versions of the anytree.Node objects.
     """
+    if cache and os.path.isfile(filename):
+        key = os.path.abspath(filename)
+        mtime = os.path.getmtime(filename)
+        tree = _TREES.get(key, None)
+        if (tree is None) or (tree[0] != mtime):
+            tree = _TREES[key] = (mtime, hit_load(filename))
+        return tree[1]
+
     if os.path.exists(filename):
         with open(filename, 'r') as fid:
             content = fid.read()
@@ -188,6 +251,12 @@ def hit_load(filename):
     hit_parse(root, hit_node, filename)
     return root
 
+def clear_hit_cache():
+    """
+    Remove the trees stored by hit_load.
+    """
+    _TREES.clear()
+
 def hit_parse(root, hit_node, filename):
     """
     Parse the supplied content into a hit tree.
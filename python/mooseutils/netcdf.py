@@ -0,0 +1,174 @@
+#* This file is part of the MOOSE framework
+#* https://www.mooseframework.org
+#*
+#* All rights reserved, see COPYRIGHT for full restrictions
+#* https://github.com/idaholab/moose/blob/master/COPYRIGHT
+#*
+#* Licensed under LGPL 2.1, please see LICENSE for details
+#* https://www.gnu.org/licenses/lgpl-2.1.html
+"""
+Reading of variables from netCDF classic files (e.g., ExodusII files) without the netCDF library.
+
+Only the classic formats (CDF-1, 64-bit offset CDF-2, and CDF-5) are supported, the netCDF-4
+format is stored using HDF5 and must be read with the netCDF library.
+"""
+import struct
+import collections
+import numpy as np
+
+#: The numpy types for the netCDF types (NC_BYTE, NC_CHAR, NC_SHORT, ...)
+NC_TYPES = {1:'>i1', 2:'S1', 3:'>i2', 4:'>i4', 5:'>f4', 6:'>f8',
+            7:'>u1', 8:'>u2', 9:'>u4', 10:'>i8', 11:'>u8'}
+
+#: The tags for the header lists
+NC_DIMENSION = 10
+NC_VARIABLE = 11
+NC_ATTRIBUTE = 12
+
+#: The number of records when the file is being streamed (see netcdf_read)
+STREAMING = 0xFFFFFFFF
+
+#: The information for a variable, the dimensions are the dimension lengths
+NetCDFVariable = collections.namedtuple('NetCDFVariable', ['name', 'dimensions', 'dtype', 'size',
+                                                           'begin', 'record'])
+
+class NetCDFHeader(object):
+    """
+    Reads the header of a netCDF classic file.
+
+    Inputs:
+        fid[file]: The open file, positioned at the beginning of the file.
+    """
+    def __init__(self, fid):
+        self.__fid = fid
+
+        magic = fid.read(4)
+        if (len(magic) != 4) or (magic[:3] != 'CDF') or (ord(magic[3]) not in (1, 2, 5)):
+            raise ValueError("The file {} is not a netCDF classic file.".format(fid.name))
+        version = ord(magic[3])
+        self.__size = '>q' if version == 5 else '>i' # NON_NEG
+        self.__offset = '>i' if version == 1 else '>q' # OFFSET
+
+        self.numrecs = self.__read(self.__size)
+        self.dimensions = [(name, length) for name, length in self.__list(NC_DIMENSION,
+                                                                          self.__dimension)]
+        self.__list(NC_ATTRIBUTE, self.__attribute)
+        self.variables = collections.OrderedDict((var.name, var) for var in \
+                                                 self.__list(NC_VARIABLE, self.__variable))
+
+        # The size of a record, which is not padded when a single record variable exists
+        records = [var for var in self.variables.itervalues() if var.record]
+        if len(records) == 1:
+            var = records[0]
+            self.recsize = np.dtype(var.dtype).itemsize * int(np.prod(var.dimensions[1:]))
+        else:
+            self.recsize = sum(var.size for var in records)
+
+    def __read(self, fmt):
+        """Read a value with the struct format."""
+        return struct.unpack(fmt, self.__fid.read(struct.calcsize(fmt)))[0]
+
+    def __list(self, tag, func):
+        """Read a list of items, which may be absent."""
+        value = self.__read('>i')
+        count = self.__read(self.__size)
+        if value == 0:
+            return []
+        elif value != tag:
+            raise ValueError("Unexpected tag {} in the header of {}.".format(value,
+                                                                          self.__fid.name))
+        return [func() for _ in range(count)]
+
+    def __name(self):
+        """Read a padded name."""
+        count = self.__read(self.__size)
+        name = self.__fid.read(count)
+        self.__fid.read(-count % 4)
+        return name
+
+    def __dimension(self):
+        """Read a dimension name and length."""
+        return self.__name(), self.__read(self.__size)
+
+    def __attribute(self):
+        """Read (and skip) an attribute value."""
+        self.__name()
+        nc_type = self.__read('>i')
+        count = self.__read(self.__size)
+        nbytes = np.dtype(NC_TYPES[nc_type]).itemsize * count
+        self.__fid.read(nbytes + (-nbytes % 4))
+
+    def __variable(self):
+        """Read the information for a variable."""
+        name = self.__name()
+        dimids = [self.__read(self.__size) for _ in range(self.__read(self.__size))]
+        self.__list(NC_ATTRIBUTE, self.__attribute)
+        nc_type = self.__read('>i')
+        size = self.__read(self.__size)
+        begin = self.__read(self.__offset)
+        dimensions = [self.dimensions[i][1] for i in dimids]
+        record = bool(dimids) and (dimensions[0] == 0)
+        return NetCDFVariable(name=name, dimensions=dimensions, dtype=NC_TYPES[nc_type],
+                              size=size, begin=begin, record=record)
+
+def netcdf_read(filename, *names):
+    """
+    Read the data for the supplied variables from a netCDF classic file.
+
+    The data for record variables (e.g., ExodusII "vals_glo_var") is read in a single pass, the
+    first dimension of the returned array is the record (e.g., timestep). The records that are not
+    completely written (e.g., the file is being written by a running simulation) are not returned.
+
+    Inputs:
+        filename[str]: The netCDF file to read.
+        names[str]: The names of the variables to read.
+
+    Returns:
+        dict: The numpy.ndarray for each variable name, character arrays are returned as a list
+              of (null terminated) strings.
+    """
+    with open(filename, 'rb') as fid:
+        header = NetCDFHeader(fid)
+
+        fid.seek(0, 2)
+        filesize = fid.tell()
+
+        numrecs = header.numrecs
+        if (numrecs == STREAMING) and header.recsize:
+            start = min(var.begin for var in header.variables.itervalues() if var.record)
+            numrecs = (filesize - start) // header.recsize
+
+        output = dict()
+        for name in names:
+            if name not in header.variables:
+                raise KeyError("The variable {} does not exist in {}.".format(name, filename))
+            var = header.variables[name]
+            dtype = np.dtype(var.dtype)
+
+            if var.record:
+                # The header may be updated before the data of the records is written
+                count = int(np.prod(var.dimensions[1:]))
+                written = (filesize - var.begin - count * dtype.itemsize) // header.recsize + 1
+                shape = [max(min(numrecs, written), 0)] + var.dimensions[1:]
+                nbytes = (shape[0] - 1) * header.recsize + count * dtype.itemsize if shape[0] else 0
+                fid.seek(var.begin)
+                data = np.ndarray(shape=(shape[0], count), dtype=dtype, buffer=fid.read(nbytes),
+                                  strides=(header.recsize, dtype.itemsize))
+            else:
+                shape = var.dimensions
+                nbytes = int(np.prod(shape)) * dtype.itemsize
+                fid.seek(var.begin)
+                buf = fid.read(nbytes)
+                if len(buf) != nbytes:
+                    raise ValueError("The variable {} is not complete in {}.".format(name,
+                                                                                     filename))
+                data = np.frombuffer(buf, dtype=dtype)
+            data = data.reshape(shape)
+
+            if dtype.char == 'S':
+                rows = data.reshape(-1, shape[-1]) if shape else data.reshape(1, 1)
+                output[name] = [row.tostring().split('\x00', 1)[0] for row in rows]
+            else:
+                output[name] = data.astype(dtype.newbyteorder('='))
+
+    return output
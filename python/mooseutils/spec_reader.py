@@ -0,0 +1,220 @@
+#* This file is part of the MOOSE framework
+#* https://www.mooseframework.org
+#*
+#* All rights reserved, see COPYRIGHT for full restrictions
+#* https://github.com/idaholab/moose/blob/master/COPYRIGHT
+#*
+#* Licensed under LGPL 2.1, please see LICENSE for details
+#* https://www.gnu.org/licenses/lgpl-2.1.html
+"""
+Tools for reading the parameters of test specification files (e.g., 'tests') and other hit files
+in parallel.
+"""
+import os
+import tempfile
+import multiprocessing
+import cPickle
+
+import hit
+
+#: Default location of the cached specification data, this is shared by the MooseDocs sqa
+#: extension and the scripts that report requirement information
+CACHE = os.path.join(os.path.expanduser('~'), '.local', 'share', 'moose', 'cache', 'specs.pkl')
+
+#: Change this if the stored data changes
+CACHE_VERSION = 2
+
+#: Files are read serially unless more than this number need to be read
+MIN_PARALLEL = 64
+
+class SpecBlock(object):
+    """
+    Storage for the parameters of a block within a specification file (or any hit file, see
+    hit_load_many).
+
+    The name, line number, and parameters are stored as plain python data, so the objects are
+    inexpensive to create, pickle, and send between processes.
+    """
+    __slots__ = ('name', 'line', 'params', 'children')
+    def __init__(self, name, line, params, children=None):
+        self.name = name
+        self.line = line
+        self.params = params
+        self.children = children or []
+
+    def get(self, name, default=None):
+        """Return a parameter, if it does not exist return the default."""
+        return self.params.get(name, default)
+
+    def __getitem__(self, name):
+        """Return a parameter, None is returned if it does not exist (see HitNode)."""
+        return self.params.get(name, None)
+
+    def __contains__(self, name):
+        """Return True if the parameter exists."""
+        return name in self.params
+
+    def __iter__(self):
+        """Loop over the child blocks."""
+        for child in self.children:
+            yield child
+
+    def __getstate__(self):
+        """Return the data for pickling."""
+        return self.name, self.line, self.params, self.children
+
+    def __setstate__(self, state):
+        """Restore the data when unpickling."""
+        self.name, self.line, self.params, self.children = state
+
+def read_spec(filename):
+    """
+    Parse a specification file and return a list of SpecBlock objects for the top-level blocks.
+
+    Only the top-level blocks and the blocks directly within them (i.e., the test specifications)
+    are returned, the hit tree is walked directly rather than creating a HitNode tree.
+
+    Inputs:
+        filename[str]: The specification file to read.
+    """
+    with open(filename, 'r') as fid:
+        content = fid.read()
+
+    out = []
+    root = hit.parse(filename, content) # the root must exist while the children are accessed
+    for section in root.children(hit.NodeType.Section):
+        block = _create_block(section)
+        for child in section.children(hit.NodeType.Section):
+            block.children.append(_create_block(child))
+        out.append(block)
+    return out
+
+def read_specs(filenames, cache=CACHE, num_threads=multiprocessing.cpu_count()):
+    """
+    Return a dict() of the top-level blocks (see read_spec) for each of the supplied filenames.
+
+    The results are stored in the cache file with the file modification time, such that only
+    the files that changed are parsed on subsequent calls. The files that require parsing are
+    read by a pool of processes.
+
+    Inputs:
+        filenames[list]: The specification files to read.
+        cache[str]: The filename for storing the results, use None to disable the cache.
+        num_threads[int]: The number of processes to use for reading files.
+    """
+    data = _load_cache(cache)
+    needed = [fname for fname in filenames \
+              if (fname not in data) or (data[fname][0] != os.path.getmtime(fname))]
+
+    if needed:
+        if (num_threads > 1) and (len(needed) > MIN_PARALLEL):
+            pool = multiprocessing.Pool(num_threads)
+            data.update(pool.imap_unordered(_read, needed, chunksize=16))
+            pool.close()
+            pool.join()
+        else:
+            data.update(_read(fname) for fname in needed)
+
+        if cache:
+            _write_cache(cache, dict((k, v) for k, v in data.iteritems() if os.path.exists(k)))
+
+    return dict((fname, data[fname][1]) for fname in filenames)
+
+def hit_load_many(filenames, jobs=multiprocessing.cpu_count()):
+    """
+    Parse hit files (e.g., input or specification files) using a pool of processes.
+
+    The complete tree of each file is returned as SpecBlock objects, which contain plain python
+    data that is inexpensive to send between processes. Files that fail to be read or parsed do
+    not stop the parsing of the remaining files, the error message is returned instead.
+
+    Returns two dict() objects: the root SpecBlock for each file that was parsed and the error
+    message for each file that failed.
+
+    Inputs:
+        filenames[list]: The hit files to parse.
+        jobs[int]: The number of processes to use for parsing files.
+    """
+    if (jobs > 1) and (len(filenames) > MIN_PARALLEL):
+        pool = multiprocessing.Pool(jobs)
+        try:
+            results = list(pool.imap_unordered(_load, filenames, chunksize=16))
+        finally:
+            pool.close()
+            pool.join()
+    else:
+        results = [_load(fname) for fname in filenames]
+
+    trees, errors = dict(), dict()
+    for filename, tree, error in results:
+        if error is None:
+            trees[filename] = tree
+        else:
+            errors[filename] = error
+    return trees, errors
+
+def _create_block(node):
+    """Create a SpecBlock from a hit.Node."""
+    params = dict((child.path(), _param(child)) for child in node.children(hit.NodeType.Field))
+    return SpecBlock(node.path(), node.line(), params)
+
+def _param(node):
+    """
+    Return the value of a field.
+
+    The numeric values are converted here, because the hit.Node.param method aborts the process
+    if the conversion fails (e.g., 'e00'), in which case the raw string is returned.
+    """
+    kind = node.kind()
+    try:
+        if kind == hit.FieldKind.Int:
+            return int(node.raw())
+        elif kind == hit.FieldKind.Float:
+            return float(node.raw())
+    except ValueError:
+        return node.raw()
+    return node.param()
+
+def _create_tree(node):
+    """Create a SpecBlock from a hit.Node including all of the child blocks."""
+    block = _create_block(node)
+    block.children = [_create_tree(child) for child in node.children(hit.NodeType.Section)]
+    return block
+
+def _load(filename):
+    """Helper for hit_load_many, returns the filename with the tree or the error message."""
+    try:
+        with open(filename, 'r') as fid:
+            content = fid.read()
+        return filename, _create_tree(hit.parse(filename, content)), None
+    except (IOError, OSError, RuntimeError) as e:
+        return filename, None, str(e)
+
+def _read(filename):
+    """Helper for read_specs, returns the filename and the modification time with the data."""
+    return filename, (os.path.getmtime(filename), read_spec(filename))
+
+def _load_cache(filename):
+    """Load the cached data, an empty dict() is returned if the cache is not valid."""
+    if filename and os.path.isfile(filename):
+        try:
+            with open(filename, 'rb') as fid:
+                version, data = cPickle.load(fid)
+            if version == CACHE_VERSION:
+                return data
+        except Exception: #pylint: disable=broad-except
+            pass
+    return dict()
+
+def _write_cache(filename, data):
+    """Write the cached data, a temporary file is used to avoid partially written files."""
+    try:
+        dirname = os.path.dirname(filename)
+        if dirname and not os.path.isdir(dirname):
+            os.makedirs(dirname)
+        fid, tmp = tempfile.mkstemp(dir=dirname or None)
+        with os.fdopen(fid, 'wb') as fid:
+            cPickle.dump((CACHE_VERSION, data), fid, cPickle.HIGHEST_PROTOCOL)
+        os.rename(tmp, filename)
+    except (IOError, OSError):
+        pass
@@ -0,0 +1,139 @@
+#* This file is part of the MOOSE framework
+#* https://www.mooseframework.org
+#*
+#* All rights reserved, see COPYRIGHT for full restrictions
+#* https://github.com/idaholab/moose/blob/master/COPYRIGHT
+#*
+#* Licensed under LGPL 2.1, please see LICENSE for details
+#* https://www.gnu.org/licenses/lgpl-2.1.html
+"""Tools for running and caching the '--json' syntax dump of MOOSE applications."""
+import os
+import json
+import hashlib
+import tempfile
+import subprocess
+import cPickle
+from distutils.spawn import find_executable
+
+from MooseException import MooseException
+
+#: Location of the cached syntax files, the MOOSE_SYNTAX_CACHE environment variable may be used to
+#: change the location
+CACHE_DIR = os.getenv('MOOSE_SYNTAX_CACHE',
+                      os.path.join(os.path.expanduser('~'), '.local', 'share', 'moose', 'cache',
+                                   'syntax'))
+
+#: Change this if the stored data changes
+CACHE_VERSION = 1
+
+#: In memory storage of the syntax (pickled), to avoid running the application or reading the cache
+#: file multiple times in a process
+_SYNTAX = dict()
+
+def syntax_dump(exe, args=None, cache=True):
+    """
+    Return the parsed JSON syntax dump (i.e., '--json') of a MOOSE application.
+
+    The parsed data is stored in memory and, if 'cache' is enabled, on disk as a pickle file. The
+    data is keyed on the executable path, size, creation time and the supplied arguments, so the
+    application is only executed if it changed. A new copy of the data is returned by each call, so
+    it may be modified by the caller.
+
+    Inputs:
+        exe[str]: The MOOSE application executable, a name without a directory is also located
+                  with the PATH environment variable.
+        args[list]: Additional arguments for the executable (e.g., ['--allow-test-objects']).
+        cache[bool]: Enable/disable the on disk cache.
+    """
+    exe = os.path.abspath(find_executable(exe) or exe)
+    cmd = [exe, '-options_left', '0', '--json'] + list(args or [])
+    try:
+        stat = os.stat(exe)
+    except OSError as e:
+        raise MooseException("Failed to locate the executable '{}': {}".format(exe, e))
+
+    key = (CACHE_VERSION, exe, stat.st_size, stat.st_ctime, tuple(cmd))
+    if key not in _SYNTAX:
+        filename = os.path.join(CACHE_DIR, '{}.pkl'.format(hashlib.sha1(repr(cmd)).hexdigest()))
+        data = _read_cache(filename, key) if cache else None
+        if data is None:
+            data = cPickle.dumps(_run(cmd), cPickle.HIGHEST_PROTOCOL)
+            if cache:
+                _write_cache(filename, key, data)
+        _SYNTAX[key] = data
+
+    return cPickle.loads(_SYNTAX[key])
+
+def clear_syntax_cache(exe=None):
+    """
+    Remove the cached syntax from memory and disk.
+
+    Inputs:
+        exe[str]: (Optional) Limit the removal to the supplied executable.
+    """
+    exe = os.path.abspath(find_executable(exe) or exe) if exe else None
+    for key in _SYNTAX.keys():
+        if (exe is None) or (key[1] == exe):
+            _SYNTAX.pop(key)
+
+    if not os.path.isdir(CACHE_DIR):
+        return
+    for fname in os.listdir(CACHE_DIR):
+        filename = os.path.join(CACHE_DIR, fname)
+        if fname.endswith('.pkl') and ((exe is None) or (_read_key(filename)[1:2] == (exe,))):
+            os.remove(filename)
+
+def _run(cmd):
+    """Run the executable and parse the JSON output."""
+    try:
+        proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
+        out = proc.communicate()[0]
+    except OSError as e:
+        raise MooseException("Failed to execute '{}': {}".format(' '.join(cmd), e))
+
+    if (proc.returncode != 0) or ('**START JSON DATA**\n' not in out):
+        msg = "Failed to execute '{}', exit status {}:\n{}"
+        raise MooseException(msg.format(' '.join(cmd), proc.returncode, out))
+
+    out = out.split('**START JSON DATA**\n')[1]
+    out = out.split('**END JSON DATA**')[0]
+    return json.loads(out)
+
+def _read_key(filename):
+    """Return the key stored in the cache file."""
+    try:
+        with open(filename, 'rb') as fid:
+            return cPickle.load(fid)
+    except Exception: #pylint: disable=broad-except
+        return tuple()
+
+def _read_cache(filename, key):
+    """
+    Read the cached (pickled) data, None is returned if the data does not exist or is not current.
+    """
+    if not os.path.isfile(filename):
+        return None
+
+    try:
+        with open(filename, 'rb') as fid:
+            if cPickle.load(fid) == key:
+                return fid.read() or None
+    except Exception: #pylint: disable=broad-except
+        pass
+    return None
+
+def _write_cache(filename, key, data):
+    """
+    Write the cache file with the pickled data, the key is stored first so that it can be checked
+    without the data.
+    """
+    try:
+        if not os.path.isdir(CACHE_DIR):
+            os.makedirs(CACHE_DIR)
+        fid, tmp = tempfile.mkstemp(dir=CACHE_DIR)
+        with os.fdopen(fid, 'wb') as fid:
+            cPickle.dump(key, fid, cPickle.HIGHEST_PROTOCOL)
+            fid.write(data)
+        os.rename(tmp, filename)
+    except (IOError, OSError):
+        pass
@@ -0,0 +1,88 @@
+#!/usr/bin/env python2
+#pylint: disable=missing-docstring
+#* This file is part of the MOOSE framework
+#* https://www.mooseframework.org
+#*
+#* All rights reserved, see COPYRIGHT for full restrictions
+#* https://github.com/idaholab/moose/blob/master/COPYRIGHT
+#*
+#* Licensed under LGPL 2.1, please see LICENSE for details
+#* https://www.gnu.org/licenses/lgpl-2.1.html
+"""
+Benchmark for polling a growing CSV file (e.g., a postprocessor file being written by a running
+simulation), comparing the MooseDataFrame update with reading the complete file each time.
+
+    ./csv_speed.py
+    ./csv_speed.py --rows 100000 --steps 100 --columns 20
+"""
+import os
+import sys
+import time
+import shutil
+import tempfile
+import argparse
+
+import pandas
+import mooseutils
+
+def command_line_options():
+    parser = argparse.ArgumentParser(description="Benchmark for reading a growing CSV file.")
+    parser.add_argument('--rows', type=int, default=100000,
+                        help="The number of rows in the file after all steps.")
+    parser.add_argument('--steps', type=int, default=100,
+                        help="The number of times rows are appended and the file is polled.")
+    parser.add_argument('--columns', type=int, default=10, help="The number of data columns.")
+    return parser.parse_args()
+
+def rows(start, stop, columns):
+    """Return the CSV text for the supplied rows."""
+    fmt = ','.join(['{}'] + ['{:.12e}'] * columns) + '\n'
+    return ''.join(fmt.format(i, *[i * 0.1 + c for c in range(columns)]) \
+                   for i in range(start, stop))
+
+def benchmark(filename, opt, func):
+    """Grow the file, calling func after each step; returns the total time spent in func."""
+    with open(filename, 'w') as fid:
+        fid.write(','.join(['time'] + ['pp{}'.format(c) for c in range(opt.columns)]) + '\n')
+
+    total = 0
+    count = opt.rows / opt.steps
+    for step in range(opt.steps):
+        with open(filename, 'a') as fid:
+            fid.write(rows(step * count, (step + 1) * count, opt.columns))
+        os.utime(filename, (step, step)) # the file is always detected as modified
+
+        start = time.time()
+        data = func()
+        total += time.time() - start
+
+    assert len(data) == count * opt.steps
+    return total
+
+def main():
+    opt = command_line_options()
+
+    loc = tempfile.mkdtemp()
+    filename = os.path.join(loc, 'data.csv')
+    try:
+        reader = mooseutils.MooseDataFrame(filename, index='time')
+        def incremental():
+            reader.update()
+            return reader.data
+        append = benchmark(filename, opt, incremental)
+
+        def complete():
+            return pandas.read_csv(filename).set_index('time')
+        full = benchmark(filename, opt, complete)
+        size = os.path.getsize(filename)
+    finally:
+        shutil.rmtree(loc)
+
+    print '{} rows ({:.1f} MB) written in {} steps'.format(opt.rows, size / 1024.**2, opt.steps)
+    print '  {:>10}: {:.4f} sec.'.format('complete', full)
+    print '  {:>10}: {:.4f} sec.'.format('append', append)
+    print '  {:>10}: {:.1f}x'.format('speedup', full / append)
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
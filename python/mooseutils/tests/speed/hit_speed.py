@@ -0,0 +1,68 @@
+#!/usr/bin/env python2
+#pylint: disable=missing-docstring
+#* This file is part of the MOOSE framework
+#* https://www.mooseframework.org
+#*
+#* All rights reserved, see COPYRIGHT for full restrictions
+#* https://github.com/idaholab/moose/blob/master/COPYRIGHT
+#*
+#* Licensed under LGPL 2.1, please see LICENSE for details
+#* https://www.gnu.org/licenses/lgpl-2.1.html
+"""
+Benchmark for parsing many hit files, comparing hit_load (one file at a time) with
+hit_load_many. By default the test specification ('tests') and input ('.i') files within the
+MOOSE repository are used.
+
+    ./hit_speed.py
+    ./hit_speed.py --directory ~/projects/moose/modules --jobs 4 8
+"""
+import os
+import sys
+import time
+import argparse
+import multiprocessing
+
+import mooseutils
+
+def command_line_options():
+    parser = argparse.ArgumentParser(description="Benchmark for parsing hit files.")
+    parser.add_argument('--directory', default=mooseutils.git_root_dir(os.path.dirname(os.path.abspath(__file__))),
+                        help="The git repository directory containing the files.")
+    parser.add_argument('--jobs', type=int, nargs='+', default=[1, multiprocessing.cpu_count()],
+                        help="The number of processes to use with hit_load_many.")
+    return parser.parse_args()
+
+def serial(filenames):
+    """Parse the files with hit_load, returns the number of errors."""
+    errors = 0
+    for filename in filenames:
+        try:
+            mooseutils.hit_load(filename)
+        except RuntimeError:
+            errors += 1
+    return errors
+
+def main():
+    opt = command_line_options()
+
+    files = mooseutils.git_ls_files(opt.directory)
+    groups = [('tests', [f for f in files if os.path.basename(f) == 'tests']),
+              ('.i', [f for f in files if f.endswith('.i')])]
+
+    for name, filenames in groups:
+        filenames = [f for f in filenames if os.path.isfile(f)]
+        print "{} '{}' files".format(len(filenames), name)
+
+        start = time.time()
+        errors = serial(filenames)
+        print '  {:>18}: {:.4f} sec. ({} errors)'.format('hit_load', time.time() - start, errors)
+
+        for jobs in opt.jobs:
+            start = time.time()
+            _, errors = mooseutils.hit_load_many(filenames, jobs=jobs)
+            label = 'hit_load_many ({})'.format(jobs)
+            print '  {:>18}: {:.4f} sec. ({} errors)'.format(label, time.time() - start, len(errors))
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,81 @@
+#!/usr/bin/env python2
+#pylint: disable=missing-docstring
+#* This file is part of the MOOSE framework
+#* https://www.mooseframework.org
+#*
+#* All rights reserved, see COPYRIGHT for full restrictions
+#* https://github.com/idaholab/moose/blob/master/COPYRIGHT
+#*
+#* Licensed under LGPL 2.1, please see LICENSE for details
+#* https://www.gnu.org/licenses/lgpl-2.1.html
+"""
+Benchmark for opening VectorPostprocessor data with many timestep files, comparing the
+VectorPostprocessorReader with reading every file.
+
+    ./vpp_speed.py
+    ./vpp_speed.py --files 5000 --rows 1000
+"""
+import os
+import sys
+import glob
+import time
+import shutil
+import tempfile
+import argparse
+
+import pandas
+import mooseutils
+
+def command_line_options():
+    parser = argparse.ArgumentParser(description="Benchmark for reading VectorPostprocessor data.")
+    parser.add_argument('--files', type=int, default=2000, help="The number of timestep files.")
+    parser.add_argument('--rows', type=int, default=200, help="The number of rows in each file.")
+    return parser.parse_args()
+
+def create(loc, opt):
+    """Create the timestep files and the "_time.csv" file."""
+    for step in range(opt.files):
+        with open(os.path.join(loc, 'vpp_{:05d}.csv'.format(step)), 'w') as fid:
+            fid.write('x,y,z\n')
+            fid.write(''.join('{},{},{}\n'.format(i, i * step, i * 0.5) for i in range(opt.rows)))
+    with open(os.path.join(loc, 'vpp_time.csv'), 'w') as fid:
+        fid.write('timestep,time\n')
+        fid.write(''.join('{},{}\n'.format(step, step * 0.1) for step in range(opt.files)))
+
+def timer(func, *args):
+    start = time.time()
+    func(*args)
+    return time.time() - start
+
+def main():
+    opt = command_line_options()
+
+    loc = tempfile.mkdtemp()
+    try:
+        create(loc, opt)
+        pattern = os.path.join(loc, 'vpp_*.csv')
+
+        def complete():
+            for filename in sorted(glob.glob(pattern)):
+                pandas.read_csv(filename)
+        full = timer(complete)
+
+        start = time.time()
+        reader = mooseutils.VectorPostprocessorReader(pattern)
+        load = time.time() - start
+        latest = timer(reader, 'y')
+        update = timer(reader.update)
+        column = timer(reader.__getitem__, 'y')
+    finally:
+        shutil.rmtree(loc)
+
+    print '{} files with {} rows'.format(opt.files, opt.rows)
+    print '  {:>16}: {:.4f} sec.'.format('read all files', full)
+    print '  {:>16}: {:.4f} sec.'.format('open', load)
+    print '  {:>16}: {:.4f} sec.'.format('latest time', latest)
+    print '  {:>16}: {:.4f} sec.'.format('update', update)
+    print '  {:>16}: {:.4f} sec.'.format('all times', column)
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -119,6 +119,73 @@ class TestMooseDataFrame(unittest.TestCase):
         data = mooseutils.MooseDataFrame(self._filename, index='time', run_start_time=time.time())
         self.assertFalse(data)
 
+    def _write(self, filename, content, mode='a'):
+        """
+        Write to the file and advance the modified time, so the change is always detected.
+        """
+        with open(filename, mode) as fid:
+            fid.write(content)
+        self._mtime = getattr(self, '_mtime', time.time()) + 1
+        os.utime(filename, (self._mtime, self._mtime))
+
+    def testAppend(self):
+        """
+        Test that only the appended rows are read when the file grows.
+        """
+        filename = "{}_{}.csv".format(self.__class__.__name__, 'append')
+        self._write(filename, 'time,a\n0,1\n1,2\n', 'w')
+        data = mooseutils.MooseDataFrame(filename, index='time')
+        self.assertEqual(list(data['a']), [1, 2])
+
+        # Complete rows, the previous rows are not read again
+        self._write(filename, '2,3\n3,4\n')
+        data.data.loc[0, 'a'] = 42
+        self.assertEqual(data.update(), mooseutils.MooseDataFrame.UPDATED)
+        self.assertEqual(list(data['a']), [42, 2, 3, 4])
+        self.assertEqual(list(data.data.index), [0, 1, 2, 3])
+
+        # Incomplete row is replaced when the line is completed
+        self._write(filename, '4,5')
+        data.update()
+        self.assertEqual(list(data['a']), [42, 2, 3, 4, 5])
+        self._write(filename, '')
+        self.assertEqual(data.update(), mooseutils.MooseDataFrame.UPDATED)
+        self.assertEqual(list(data['a']), [42, 2, 3, 4, 5])
+        self._write(filename, '6\n5,7\n')
+        data.update()
+        self.assertEqual(list(data['a']), [42, 2, 3, 4, 56, 7])
+        self.assertEqual(list(data.data.index), [0, 1, 2, 3, 4, 5])
+        os.remove(filename)
+
+    def testReload(self):
+        """
+        Test that the complete file is read if the file is smaller or the header changes.
+        """
+        filename = "{}_{}.csv".format(self.__class__.__name__, 'reload')
+        self._write(filename, 'time,a\n0,1\n1,2\n', 'w')
+        data = mooseutils.MooseDataFrame(filename)
+        self.assertEqual(list(data['a']), [1, 2])
+
+        # Smaller file
+        self._write(filename, 'time,a\n0,3\n', 'w')
+        data.update()
+        self.assertEqual(list(data['a']), [3])
+
+        # Same size, different header
+        self._write(filename, 'time,b\n0,3\n', 'w')
+        data.update()
+        self.assertNotIn('a', data)
+        self.assertEqual(list(data['b']), [3])
+
+        # Larger file, different header
+        self._write(filename, 'time,c,d\n0,1,2\n1,3,4\n', 'w')
+        data.update()
+        self.assertEqual(list(data['d']), [2, 4])
+        self._write(filename, '2,5,6\n')
+        data.update()
+        self.assertEqual(list(data['d']), [2, 4, 6])
+        self.assertEqual(list(data.data.index), [0, 1, 2])
+        os.remove(filename)
 
 if __name__ == '__main__':
     unittest.main(module=__name__, verbosity=2)
@@ -15,6 +15,8 @@ import unittest
 import mooseutils
 import time
 import subprocess
+import mock
+import pandas
 
 class TestVectorPostprocessorReader(unittest.TestCase):
     """
@@ -58,11 +60,11 @@ class TestVectorPostprocessorReader(unittest.TestCase):
         self.assertTrue(data._timedata)
         self.assertTrue(data)
 
-        # Check axis organized correctly
-        self.assertEqual(data.data.shape, (3,6,3))
+        # Check the number of times
+        self.assertEqual(len(data.times()), 3)
 
         # Check that times are loaded
-        self.assertEqual(list(data.data.keys().values), [1,3,7])
+        self.assertEqual(data.times(), [1,3,7])
 
         # Check data
         y = data['y']
@@ -80,11 +82,11 @@ class TestVectorPostprocessorReader(unittest.TestCase):
         self.assertFalse(data._timedata)
         self.assertTrue(data)
 
-        # Check axis organized correctly
-        self.assertEqual(data.data.shape, (3,6,3))
+        # Check the number of times
+        self.assertEqual(len(data.times()), 3)
 
         # Check that times are loaded
-        self.assertEqual(list(data.data.keys().values), [0,1,2])
+        self.assertEqual(data.times(), [0,1,2])
 
         # Check data
         y = data['y']
@@ -108,9 +110,9 @@ class TestVectorPostprocessorReader(unittest.TestCase):
         self.assertTrue(data._timedata)
         self.assertTrue(data)
 
-        # Check axis organized correctly
-        self.assertEqual(data.data.shape, (3,6,3))
-        self.assertEqual(list(data.data.keys().values), [1,3,7])
+        # Check the number of times
+        self.assertEqual(len(data.times()), 3)
+        self.assertEqual(data.times(), [1,3,7])
         y = data['y']
         self.assertEqual(y[3][4], 8)
         self.assertEqual(y[7][4], 16)
@@ -131,7 +133,7 @@ class TestVectorPostprocessorReader(unittest.TestCase):
         self.copyfiles()
         data = mooseutils.VectorPostprocessorReader('vpp_*.csv')
         self.assertTrue(data)
-        self.assertEqual(data.data.shape, (3,6,3))
+        self.assertEqual(len(data.times()), 3)
 
         # Make the last file old
         time.sleep(2) # wait so new files have newer modified times
@@ -141,8 +143,8 @@ class TestVectorPostprocessorReader(unittest.TestCase):
         # Update and make certain data structure is smaller
         data.update()
         self.assertTrue(data)
-        self.assertEqual(data.data.shape, (2,6,3))
-        self.assertEqual(list(data.data.keys().values), [1,3])
+        self.assertEqual(len(data.times()), 2)
+        self.assertEqual(data.times(), [1,3])
 
         # Test data
         y = data['y']
@@ -153,7 +155,7 @@ class TestVectorPostprocessorReader(unittest.TestCase):
         mooseutils.touch('vpp_002.csv')
         data.update()
         self.assertTrue(data)
-        self.assertEqual(data.data.shape, (3,6,3))
+        self.assertEqual(len(data.times()), 3)
 
     def testRemoveData(self):
         """
@@ -164,7 +166,7 @@ class TestVectorPostprocessorReader(unittest.TestCase):
         self.copyfiles()
         data = mooseutils.VectorPostprocessorReader('vpp_*.csv')
         self.assertTrue(data)
-        self.assertEqual(data.data.shape, (3,6,3))
+        self.assertEqual(len(data.times()), 3)
 
         # Remove the middle file
         os.remove('vpp_001.csv')
@@ -172,8 +174,8 @@ class TestVectorPostprocessorReader(unittest.TestCase):
         # Update and check results
         data.update()
         self.assertTrue(data)
-        self.assertEqual(data.data.shape, (2,6,3))
-        self.assertEqual(list(data.data.keys().values), [1,7])
+        self.assertEqual(len(data.times()), 2)
+        self.assertEqual(data.times(), [1,7])
 
         # Test data
         y = data['y']
@@ -221,6 +223,92 @@ class TestVectorPostprocessorReader(unittest.TestCase):
         self.assertTrue(data)
         self.assertIn('x', data.variables())
         self.assertIn('y', data.variables())
+        self.assertEqual(data.variables(), ['index (Peacock)', 'x', 'y'])
+
+        # The names are the union of all times, which are read w/o loading the data
+        with open('vpp_004.csv', 'w') as fid:
+            fid.write('x,z\n0,1\n')
+        with mock.patch('pandas.read_csv', wraps=pandas.read_csv) as read_csv:
+            self.assertEqual(data.update(), 1)
+            self.assertEqual(data.variables(), ['index (Peacock)', 'x', 'y', 'z'])
+            self.assertIn('z', data)
+            self.assertEqual(read_csv.call_count, 0)
+        self.assertEqual(data._cache.keys(), [])
+
+    def testGetItem(self):
+        """
+        Test that column access reads a single column w/o adding the data to the cache.
+        """
+        self.copyfiles()
+        data = mooseutils.VectorPostprocessorReader('vpp_*.csv', cache_size=1)
+        data.load(7)
+        with mock.patch('pandas.read_csv', wraps=pandas.read_csv) as read_csv:
+            y = data['y']
+            self.assertEqual(list(y.columns), [1, 3, 7])
+            self.assertEqual(list(y[3]), [0, 2, 4, 6, 8, 10])
+            self.assertEqual(list(y[7]), [0, 3, 6, 9, 16, 25])
+            self.assertEqual(read_csv.call_count, 2)
+            for call in read_csv.call_args_list:
+                self.assertEqual(call[1]['usecols'], ['y'])
+
+            index = data['index (Peacock)']
+            self.assertEqual(list(index[1]), [0, 1, 2, 3, 4, 5])
+            self.assertTrue(data['not_a_column'].empty)
+
+        self.assertEqual(data._cache.keys(), ['vpp_002.csv'])
+
+    def testLazyLoad(self):
+        """
+        Test that files are only read when the data is requested and the cache size is limited.
+        """
+        self.copyfiles()
+        with mock.patch('pandas.read_csv', wraps=pandas.read_csv) as read_csv:
+            data = mooseutils.VectorPostprocessorReader('vpp_*.csv', cache_size=2)
+            self.assertEqual(data.times(), [1, 3, 7])
+            self.assertEqual(read_csv.call_count, 1) # the "_time.csv" file
+
+            # Only the requested time is read, the data is stored as a record array
+            y = data('y', time=3)
+            self.assertEqual(y[4], 8)
+            self.assertEqual(read_csv.call_count, 2)
+            self.assertEqual(data.load(3)['y'][4], 8)
+            self.assertEqual(read_csv.call_count, 2)
+            self.assertEqual(data.load(3).dtype.names, ('index (Peacock)', 'x', 'y'))
+
+            # The least recently used data is removed
+            data('y', time=1)
+            data('y', time=7)
+            self.assertEqual(data._cache.keys(), ['vpp_000.csv', 'vpp_002.csv'])
+            data('y', time=3)
+            self.assertEqual(read_csv.call_count, 5)
+
+            # Update w/o changes does not read data
+            self.assertEqual(data.update(), 0)
+            self.assertEqual(read_csv.call_count, 5)
+            self.assertEqual(data._cache.keys(), ['vpp_002.csv', 'vpp_001.csv'])
+
+    def testNewData(self):
+        """
+        Test that new and modified files are added when updated.
+        """
+        self.copyfiles()
+        data = mooseutils.VectorPostprocessorReader('vpp_*.csv')
+        self.assertEqual(data('y')[4], 16)
+
+        # Write the empty file, which is included after the update
+        with open('vpp_004.csv', 'w') as fid:
+            fid.write('x,y\n0,1\n')
+        self.assertEqual(data.update(), 1)
+        self.assertEqual(data.times(), [1, 3, 7, 9])
+        self.assertEqual(data('y')[0], 1)
+
+        # Modified data is read again
+        time.sleep(1) # wait so the modified time is newer
+        with open('vpp_004.csv', 'w') as fid:
+            fid.write('x,y\n0,2\n')
+        self.assertEqual(data.update(), 1)
+        self.assertEqual(data('y')[0], 2)
+        self.assertEqual(data['y'][9][0], 2)
 
     def testRepr(self):
         """
@@ -236,7 +324,7 @@ class TestVectorPostprocessorReader(unittest.TestCase):
         output, imports = data.repr()
 
         # Append testing content
-        output += ["print 'SHAPE:', data.data.shape"]
+        output += ["print 'TIMES:', data.times()"]
         output += ["print 'VALUE:', data['y'][3][4]"]
 
         # Write the test script
@@ -250,7 +338,7 @@ class TestVectorPostprocessorReader(unittest.TestCase):
         out = subprocess.check_output(['python', script])
 
         # Test for output
-        self.assertIn('SHAPE: (3, 6, 3)', out)
+        self.assertIn('TIMES: [1, 3, 7]', out)
         self.assertIn('VALUE: 8', out)
 
         # Remove the script
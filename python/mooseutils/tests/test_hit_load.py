@@ -1,6 +1,9 @@
 #!/usr/bin/env python2
 import os
+import shutil
+import tempfile
 import unittest
+import hit
 import mooseutils
 
 class TestHitLoad(unittest.TestCase):
@@ -48,6 +51,56 @@ class TestHitLoad(unittest.TestCase):
                          [root.children[1].children[0],
                           root.children[1].children[0].children[0]])
 
+    def testFindExact(self):
+        root = mooseutils.hit_load(os.path.join('..', '..', 'test_files', 'test.hit'))
+        b11 = root.children[1].children[0].children[0]
+        self.assertIs(root.find('/B/B-1/B-1-1', fuzzy=False), b11)
+        self.assertIsNone(root.find('B-1-1', fuzzy=False))
+        self.assertIs(root.children[1].find('/B/B-1/B-1-1', fuzzy=False), b11)
+        self.assertIsNone(root.children[0].find('/B/B-1/B-1-1', fuzzy=False))
+        self.assertIsNone(root.children[0].find('B-1'))
+        self.assertEqual(b11.fullpath, '/B/B-1/B-1-1')
+
+    def testFindModified(self):
+        root = mooseutils.hit_load(os.path.join('..', '..', 'test_files', 'test.hit'))
+        self.assertIsNone(root.find('/A/C', fuzzy=False))
+
+        # Added node
+        other = hit.parse('', '[C]\n[]') # the root must exist while the child is used
+        node = mooseutils.HitNode(hitnode=other.children()[0])
+        node.parent = root.children[0]
+        self.assertIs(root.find('/A/C', fuzzy=False), node)
+        self.assertIs(root.children[0].find('C'), node)
+        self.assertEqual(root.findall('C'), [node])
+
+        # Removed node
+        node.parent = None
+        self.assertIsNone(root.find('/A/C', fuzzy=False))
+        self.assertIs(node.find('C'), node)
+        self.assertIs(root.find('A-1'), root.children[0].children[0])
+
+    def testCache(self):
+        loc = tempfile.mkdtemp()
+        filename = os.path.join(loc, 'test.hit')
+        shutil.copyfile(os.path.join('..', '..', 'test_files', 'test.hit'), filename)
+
+        root = mooseutils.hit_load(filename, cache=True)
+        self.assertIs(mooseutils.hit_load(filename, cache=True), root)
+        self.assertIsNot(mooseutils.hit_load(filename), root)
+
+        # Modified file
+        with open(filename, 'w') as fid:
+            fid.write('[C]\n[]\n')
+        mtime = os.path.getmtime(filename) + 1
+        os.utime(filename, (mtime, mtime))
+        other = mooseutils.hit_load(filename, cache=True)
+        self.assertIsNot(other, root)
+        self.assertEqual(other.children[0].name, 'C')
+
+        mooseutils.clear_hit_cache()
+        self.assertIsNot(mooseutils.hit_load(filename, cache=True), other)
+        shutil.rmtree(loc)
+
     def testIterParam(self):
         root = mooseutils.hit_load(os.path.join('..', '..', 'test_files', 'test.hit'))
         for k, v in root.children[0].iterparams():
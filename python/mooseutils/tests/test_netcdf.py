@@ -0,0 +1,97 @@
+#!/usr/bin/env python2
+#pylint: disable=missing-docstring
+#* This file is part of the MOOSE framework
+#* https://www.mooseframework.org
+#*
+#* All rights reserved, see COPYRIGHT for full restrictions
+#* https://github.com/idaholab/moose/blob/master/COPYRIGHT
+#*
+#* Licensed under LGPL 2.1, please see LICENSE for details
+#* https://www.gnu.org/licenses/lgpl-2.1.html
+
+import os
+import shutil
+import tempfile
+import unittest
+import numpy as np
+import mooseutils
+from mooseutils import netcdf
+
+class TestNetCDF(unittest.TestCase):
+    """
+    Test the reading of variables from netCDF classic files.
+    """
+    INPUT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'chigger',
+                         'tests', 'input')
+
+    def testGlobal(self):
+        """
+        Test reading the global variables (record variables) from 64-bit offset files.
+        """
+        filename = os.path.join(self.INPUT, 'mug_blocks_out.e')
+        data = mooseutils.netcdf_read(filename, 'name_glo_var', 'vals_glo_var', 'time_whole')
+        self.assertEqual(data['name_glo_var'], ['func_pp'])
+        self.assertEqual(data['vals_glo_var'].shape, (21, 1))
+        np.testing.assert_allclose(data['time_whole'], np.arange(21) * 0.1, atol=1e-12)
+        np.testing.assert_allclose(data['vals_glo_var'][:, 0], data['time_whole'] * 2, atol=1e-12)
+
+        filename = os.path.join(self.INPUT, 'step10_micro_out.e')
+        data = mooseutils.netcdf_read(filename, 'name_glo_var', 'vals_glo_var')
+        self.assertEqual(data['name_glo_var'], ['k_eff', 'temp_in'])
+        self.assertEqual(list(data['vals_glo_var'][:, 1]), [301., 301.])
+
+    def testVariable(self):
+        """
+        Test reading non-record variables.
+        """
+        filename = os.path.join(self.INPUT, 'mug_blocks_out.e')
+        data = mooseutils.netcdf_read(filename, 'eb_prop1', 'coordx', 'name_nod_var')
+        self.assertEqual(list(data['eb_prop1']), [1, 76])
+        self.assertEqual(data['coordx'].dtype, np.float64)
+        self.assertEqual(data['name_nod_var'], ['convected', 'diffused'])
+
+        # CDF-1 file without timesteps
+        filename = os.path.join(self.INPUT, 'mug.e')
+        data = mooseutils.netcdf_read(filename, 'coor_names', 'coord', 'time_whole')
+        self.assertEqual(data['coor_names'], ['x', 'y', 'z'])
+        self.assertEqual(data['coord'].shape, (3, 3774))
+        self.assertEqual(len(data['time_whole']), 0)
+
+    def testErrors(self):
+        """
+        Test the errors for missing variables and other files.
+        """
+        filename = os.path.join(self.INPUT, 'mug_blocks_out.e')
+        with self.assertRaisesRegexp(KeyError, 'The variable wrong does not exist'):
+            mooseutils.netcdf_read(filename, 'wrong')
+
+        with self.assertRaisesRegexp(ValueError, 'is not a netCDF classic file'):
+            mooseutils.netcdf_read(os.path.abspath(__file__), 'vals_glo_var')
+
+    def testTruncated(self):
+        """
+        Test that only the complete records are read from a file that is being written.
+        """
+        tmp = tempfile.mkdtemp()
+        filename = os.path.join(tmp, 'truncated.e')
+        shutil.copy(os.path.join(self.INPUT, 'mug_blocks_out.e'), filename)
+        with open(filename, 'rb') as fid:
+            header = netcdf.NetCDFHeader(fid)
+        var = header.variables['vals_glo_var']
+
+        try:
+            with open(filename, 'r+b') as fid:
+                fid.truncate(var.begin + 5 * header.recsize + 4)
+            data = mooseutils.netcdf_read(filename, 'vals_glo_var', 'time_whole')
+            self.assertEqual(data['vals_glo_var'].shape, (5, 1))
+            np.testing.assert_allclose(data['vals_glo_var'][:, 0], np.arange(5) * 0.2, atol=1e-12)
+
+            with open(filename, 'r+b') as fid:
+                fid.truncate(header.variables['coordx'].begin + 4)
+            with self.assertRaisesRegexp(ValueError, 'The variable coordx is not complete'):
+                mooseutils.netcdf_read(filename, 'coordx')
+        finally:
+            shutil.rmtree(tmp)
+
+if __name__ == '__main__':
+    unittest.main(module=__name__, verbosity=2)
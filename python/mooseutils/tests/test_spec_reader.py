@@ -0,0 +1,125 @@
+#!/usr/bin/env python2
+#* This file is part of the MOOSE framework
+#* https://www.mooseframework.org
+#*
+#* All rights reserved, see COPYRIGHT for full restrictions
+#* https://github.com/idaholab/moose/blob/master/COPYRIGHT
+#*
+#* Licensed under LGPL 2.1, please see LICENSE for details
+#* https://www.gnu.org/licenses/lgpl-2.1.html
+
+import os
+import shutil
+import tempfile
+import unittest
+import mock
+import mooseutils
+
+SPEC = """[Tests]
+  design = 'foo.md'
+  issues = '#1234'
+  [test_{name}]
+    type = RunApp
+    input = {name}.i
+    requirement = "The system shall {name}."
+  []
+  [other]
+    type = RunApp
+    input = other.i
+    skip = 'reason'
+  []
+[]
+"""
+
+class TestSpecReader(unittest.TestCase):
+    """
+    Test the read_spec, read_specs, and hit_load_many functions.
+    """
+    def setUp(self):
+        self._tmp = tempfile.mkdtemp()
+        self._cache = os.path.join(self._tmp, 'cache', 'specs.pkl')
+        self._files = [self._write('a', 'a'), self._write('b', 'b')]
+
+    def tearDown(self):
+        shutil.rmtree(self._tmp)
+
+    def _write(self, dirname, name):
+        filename = os.path.join(self._tmp, dirname, 'tests')
+        if not os.path.isdir(os.path.dirname(filename)):
+            os.makedirs(os.path.dirname(filename))
+        with open(filename, 'w') as fid:
+            fid.write(SPEC.format(name=name))
+        return filename
+
+    def testReadSpec(self):
+        blocks = mooseutils.read_spec(self._files[0])
+        self.assertEqual(len(blocks), 1)
+        self.assertEqual(blocks[0].name, 'Tests')
+        self.assertEqual(blocks[0]['design'], 'foo.md')
+        self.assertEqual(blocks[0].get('issues'), '#1234')
+
+        children = list(blocks[0])
+        self.assertEqual([c.name for c in children], ['test_a', 'other'])
+        self.assertEqual(children[0].line, 4)
+        self.assertEqual(children[0]['requirement'], 'The system shall a.')
+        self.assertNotIn('requirement', children[1])
+        self.assertIsNone(children[1]['requirement'])
+        self.assertEqual(children[1]['skip'], 'reason')
+
+    def testReadSpecs(self):
+        data = mooseutils.read_specs(self._files, cache=None)
+        self.assertEqual(sorted(data.keys()), self._files)
+        self.assertEqual(data[self._files[1]][0].children[0].name, 'test_b')
+
+    def testParallel(self):
+        with mock.patch('mooseutils.spec_reader.MIN_PARALLEL', 0):
+            data = mooseutils.read_specs(self._files, cache=None, num_threads=2)
+        self.assertEqual(data[self._files[0]][0].children[0].name, 'test_a')
+        self.assertEqual(data[self._files[1]][0].children[0].name, 'test_b')
+
+    def testCache(self):
+        mooseutils.read_specs(self._files, cache=self._cache)
+        self.assertTrue(os.path.isfile(self._cache))
+
+        # Unchanged files are not parsed
+        with mock.patch('mooseutils.spec_reader.read_spec') as read_spec:
+            data = mooseutils.read_specs(self._files, cache=self._cache)
+            self.assertFalse(read_spec.called)
+        self.assertEqual(data[self._files[0]][0].children[0].name, 'test_a')
+
+        # Modified files are parsed
+        self._write('a', 'c')
+        os.utime(self._files[0], (0, 0))
+        data = mooseutils.read_specs(self._files, cache=self._cache)
+        self.assertEqual(data[self._files[0]][0].children[0].name, 'test_c')
+
+    def testHitLoadMany(self):
+        bad = os.path.join(self._tmp, 'bad.i')
+        with open(bad, 'w') as fid:
+            fid.write('[A]\n  [B]\n    x = 1\n  []\n[]\n[]\n')
+        missing = os.path.join(self._tmp, 'missing.i')
+
+        for jobs in [1, 2]:
+            with mock.patch('mooseutils.spec_reader.MIN_PARALLEL', 0):
+                trees, errors = mooseutils.hit_load_many(self._files + [bad, missing], jobs=jobs)
+            self.assertEqual(sorted(trees.keys()), self._files)
+            self.assertEqual(sorted(errors.keys()), sorted([bad, missing]))
+            self.assertIn("extra closing '[]'", errors[bad])
+
+            root = trees[self._files[1]]
+            self.assertEqual(root.children[0].name, 'Tests')
+            self.assertEqual(root.children[0]['design'], 'foo.md')
+            self.assertEqual(root.children[0].children[0].name, 'test_b')
+            self.assertEqual(root.children[0].children[0]['input'], 'b.i')
+
+        # Nested blocks are included
+        with open(bad, 'w') as fid:
+            fid.write('[A]\n  [B]\n    [C]\n      x = 1\n      y = e00\n    []\n  []\n[]\n')
+        trees, errors = mooseutils.hit_load_many([bad])
+        self.assertEqual(errors, dict())
+        block = trees[bad].children[0].children[0].children[0]
+        self.assertEqual((block.name, block.line, block['x']), ('C', 3, 1))
+        self.assertEqual(block['y'], 'e00') # hit.Node.param fails to convert this value
+
+if __name__ == '__main__':
+    unittest.main(module=__name__, verbosity=2)
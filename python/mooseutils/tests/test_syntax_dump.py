@@ -0,0 +1,119 @@
+#!/usr/bin/env python2
+#* This file is part of the MOOSE framework
+#* https://www.mooseframework.org
+#*
+#* All rights reserved, see COPYRIGHT for full restrictions
+#* https://github.com/idaholab/moose/blob/master/COPYRIGHT
+#*
+#* Licensed under LGPL 2.1, please see LICENSE for details
+#* https://www.gnu.org/licenses/lgpl-2.1.html
+
+import os
+import sys
+import stat
+import shutil
+import tempfile
+import unittest
+import mock
+import mooseutils
+
+SCRIPT = """#!/bin/sh
+echo "$@" >> {log}
+echo "Some output that is not JSON"
+echo "**START JSON DATA**"
+echo '{{"blocks": {{"{name}": {{}}}}, "args": "'"$*"'"}}'
+echo "**END JSON DATA**"
+"""
+
+class TestSyntaxDump(unittest.TestCase):
+    """
+    Test the syntax_dump function using a script that mimics the '--json' output of an application.
+    """
+    def setUp(self):
+        self._tmp = tempfile.mkdtemp()
+        self._exe = os.path.join(self._tmp, 'app-opt')
+        self._log = os.path.join(self._tmp, 'calls.log')
+        self._createExe('Kernels')
+
+        module = sys.modules['mooseutils.syntax_dump']
+        self._patch = mock.patch.object(module, 'CACHE_DIR', os.path.join(self._tmp, 'cache'))
+        self._patch.start()
+        mooseutils.clear_syntax_cache()
+
+    def tearDown(self):
+        mooseutils.clear_syntax_cache()
+        self._patch.stop()
+        shutil.rmtree(self._tmp)
+
+    def _createExe(self, name):
+        with open(self._exe, 'w') as fid:
+            fid.write(SCRIPT.format(log=self._log, name=name))
+        os.chmod(self._exe, stat.S_IRWXU)
+
+    def _calls(self):
+        if not os.path.exists(self._log):
+            return 0
+        with open(self._log, 'r') as fid:
+            return len(fid.readlines())
+
+    def testBasic(self):
+        data = mooseutils.syntax_dump(self._exe, ['--allow-test-objects'])
+        self.assertEqual(data['blocks'].keys(), ['Kernels'])
+        self.assertEqual(data['args'], '-options_left 0 --json --allow-test-objects')
+        self.assertEqual(self._calls(), 1)
+
+    def testMemoryCache(self):
+        data = mooseutils.syntax_dump(self._exe)
+        data['blocks']['Modified'] = dict()
+        other = mooseutils.syntax_dump(self._exe)
+        self.assertIsNot(other, data)
+        self.assertEqual(other['blocks'].keys(), ['Kernels'])
+        self.assertEqual(self._calls(), 1)
+
+        # Different arguments require execution
+        mooseutils.syntax_dump(self._exe, ['--allow-test-objects'])
+        self.assertEqual(self._calls(), 2)
+
+    def testDiskCache(self):
+        data = mooseutils.syntax_dump(self._exe)
+        sys.modules['mooseutils.syntax_dump']._SYNTAX.clear()
+        self.assertEqual(mooseutils.syntax_dump(self._exe), data)
+        self.assertEqual(self._calls(), 1)
+
+        # Disabled cache
+        sys.modules['mooseutils.syntax_dump']._SYNTAX.clear()
+        self.assertEqual(mooseutils.syntax_dump(self._exe, cache=False), data)
+        self.assertEqual(self._calls(), 2)
+
+    def testChangedExecutable(self):
+        mooseutils.syntax_dump(self._exe)
+        self._createExe('BCs')
+        data = mooseutils.syntax_dump(self._exe)
+        self.assertEqual(data['blocks'].keys(), ['BCs'])
+        self.assertEqual(self._calls(), 2)
+
+    def testClear(self):
+        mooseutils.syntax_dump(self._exe)
+        mooseutils.clear_syntax_cache(self._exe)
+        mooseutils.syntax_dump(self._exe)
+        self.assertEqual(self._calls(), 2)
+
+    def testPath(self):
+        with mock.patch.dict(os.environ, {'PATH':self._tmp + os.pathsep + os.environ['PATH']}):
+            data = mooseutils.syntax_dump('app-opt')
+        self.assertEqual(data['blocks'].keys(), ['Kernels'])
+        self.assertEqual(self._calls(), 1)
+
+    def testErrors(self):
+        with self.assertRaises(mooseutils.MooseException) as e:
+            mooseutils.syntax_dump(os.path.join(self._tmp, 'wrong'))
+        self.assertIn('Failed to locate the executable', e.exception.message)
+
+        with open(self._exe, 'w') as fid:
+            fid.write('#!/bin/sh\necho "No JSON"\nexit 1\n')
+        with self.assertRaises(mooseutils.MooseException) as e:
+            mooseutils.syntax_dump(self._exe)
+        self.assertIn('exit status 1', e.exception.message)
+
+if __name__ == '__main__':
+    unittest.main(module=__name__, verbosity=2)
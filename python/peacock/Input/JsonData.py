@@ -8,8 +8,6 @@
 #* Licensed under LGPL 2.1, please see LICENSE for details
 #* https://www.gnu.org/licenses/lgpl-2.1.html
 
-from peacock.utils import ExeLauncher
-import json
 import mooseutils
 from PyQt5.QtWidgets import QApplication
 
@@ -49,26 +47,20 @@ class JsonData(object):
         """
         try:
             self._processEvents()
-            raw_data = self._getRawDump(app_path)
-            self._processEvents()
-            self.json_data = json.loads(raw_data)
+            self.json_data = self._getDump(app_path)
             self._processEvents()
             self.app_path = app_path
         except Exception as e:
             mooseutils.mooseWarning("Failed to load json from '%s': %s" % (app_path, e))
 
-    def _getRawDump(self, app_path):
+    def _getDump(self, app_path):
         """
-        Generate the raw data from the executable.
+        Generate the data from the executable, the data is cached (see mooseutils.syntax_dump)
+        so the executable is only run if it changed.
         Return:
             the data
         """
-        #  "-options_left 0" is used to stop the debug version of PETSc from printing
-        # out WARNING messages that sometime confuse the json parser
-        data = ExeLauncher.runExe(app_path, ["-options_left", "0", "--json"] + self.extra_args)
-        data = data.split('**START JSON DATA**\n')[1]
-        data = data.split('**END JSON DATA**')[0]
-        return data
+        return mooseutils.syntax_dump(app_path, self.extra_args)
 
     def toPickle(self):
         """
@@ -11,16 +11,13 @@ def report_requirement_stats(location, specs):
     """
     requirements = 0
     tests = 0
-    for filename in mooseutils.git_ls_files(location):
-        if not os.path.isfile(filename):
-            continue
-        fname = os.path.basename(filename)
-        if fname in specs:
-            root = mooseutils.hit_load(filename)
-            for child in root.children[0]:
-                tests += 1
-                if child.get('requirement', None):
-                    requirements += 1
+    filenames = [fname for fname in mooseutils.git_ls_files(location) \
+                 if (os.path.basename(fname) in specs) and os.path.isfile(fname)]
+    for blocks in mooseutils.read_specs(filenames).itervalues():
+        for child in (blocks[0] if blocks else []):
+            tests += 1
+            if child.get('requirement', None):
+                requirements += 1
 
     complete = float(requirements)/float(tests)
     print 'Requirement Definitions ({:2.1f}% complete):'.format(complete*100)
@@ -89,59 +89,52 @@ def extractRequirements(args):
 
 
 def extractTestedRequirements(args, data):
-    # Here we will use the TestHarness to find all of the
+    # Here we will read the test specification files to find all of the
     # test files where we can look for tested requirements.
     # Assume SQA docs are located in <MOOSE_DIR>/framework/doc/sqa
-    test_app_name = args.application_name
     test_app_dir = os.path.join(args.application_path)
 
     #### TODO
     # figure out a cleaner way to set this up
-    # If test_app_name is framework, we need to reword some things
-    if test_app_name == 'framework':
-        test_app_name = 'moose_test'
+    # If the application is framework, we need to reword some things
+    if args.application_name == 'framework':
         test_app_dir = os.path.join(args.moose_dir, 'test')
 
-    # Set the current working directory to test_app_dir
-    saved_cwd = os.getcwd()
-    os.chdir(test_app_dir)
-
     sys.path.append(os.path.join(args.moose_dir, 'python'))
 
-    from TestHarness import TestHarness
-
-    # Build the TestHarness object here
-    harness = TestHarness([], args.moose_dir, test_app_name)
-
-    # Tell it to parse the test files only, not run them
-    harness.findAndRunTests(find_only=True)
-
-    # Now retrieve all of the accumlated Testers from the TestHarness warehouse
-    testers = harness.warehouse.getAllObjects()
-    for tester in testers:
-        print tester.specs['test_name']
-        input_filename = tester.getInputFile()
-        if input_filename == None:
-            continue
-
-        input_path = os.path.join(tester.specs['test_dir'], input_filename)
-        if not os.path.isfile(input_path):
-            continue
-
-        # Read the MOOSE input file
-        f = open(os.path.join(tester.specs['test_dir'], tester.getInputFile()))
-        text = f.read()
-        f.close()
+    import mooseutils
+
+    # Read the test specifications, the specifications are read in parallel and cached
+    # (see mooseutils.read_specs), so this is much faster than creating the TestHarness objects
+    filenames = [fname for fname in mooseutils.git_ls_files(test_app_dir) \
+                 if (os.path.basename(fname) == 'tests') and os.path.isfile(fname)]
+    specs = mooseutils.read_specs(filenames)
+
+    for spec_filename in sorted(specs.keys()):
+        test_dir = os.path.dirname(spec_filename)
+        for block in specs[spec_filename]:
+            for test in block:
+                print '{}.{}'.format(os.path.relpath(test_dir, test_app_dir), test.name)
+                input_filename = test.get('input', None)
+                if input_filename == None:
+                    continue
 
-        # See if the file maps to a requirement (e.g. @Requirement)
-        for req in re.finditer(r'@Requirement\s+([\w\.]+)', text):
-            requirement = req.group(1)
-            if requirement not in data:
-                print 'Unable to find referenced requirement "' + requirement + '" in ' + input_path
-            else:
-                data[requirement][2].add(os.path.relpath(input_path, args.moose_dir))
+                input_path = os.path.join(test_dir, str(input_filename))
+                if not os.path.isfile(input_path):
+                    continue
 
-    os.chdir(saved_cwd)
+                # Read the MOOSE input file
+                f = open(input_path)
+                text = f.read()
+                f.close()
+
+                # See if the file maps to a requirement (e.g. @Requirement)
+                for req in re.finditer(r'@Requirement\s+([\w\.]+)', text):
+                    requirement = req.group(1)
+                    if requirement not in data:
+                        print 'Unable to find referenced requirement "' + requirement + '" in ' + input_path
+                    else:
+                        data[requirement][2].add(os.path.relpath(input_path, args.moose_dir))
 
 def verifyArguments(args):
     # Verify supplied arguments